@@ -0,0 +1,144 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+from os.path import abspath
+from stat import S_ISREG
+from threading import Lock
+
+from FileExchange import FileExchange
+
+
+class Directory():
+    """
+    A directory opened once as a file descriptor, relative to which its files are listed, checked and renamed.
+
+    Resolving file names against the descriptor (dir_fd) instead of the working directory lets a single process
+    manage several directories at once without ever changing its working directory, and the system calls don't
+    have to resolve the directory's path again and again. The descriptor keeps referring to the same directory
+    even if the directory is renamed or moved in the meantime; its path is only used to identify it.
+    Directories are opened once per path and shared by all FileSets bound to them (see open).
+    """
+    _open_directories = {} # absolute directory path -> Directory
+    _lock = Lock()
+
+    def __init__(self, path):
+        """
+        Open the given directory.
+
+        @param path: The path of the directory
+
+        @raise OSError: The directory can't be opened, e.g. because it doesn't exist or is not a directory
+        """
+        self.path = abspath(path)
+        self.fd = os.open(self.path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+    def __repr__(self):
+        return "Directory({!r})".format(self.path)
+
+    def __deepcopy__(self, memo):
+        """Directories are shared, so copies of a FileSet (e.g. for a dry run) stay bound to the same directory."""
+        return self
+
+    @classmethod
+    def open(cls, path):
+        """
+        Return the opened directory of the given path, opening it if no FileSet has done so yet.
+
+        @param path: The path of the directory, or a Directory, which is returned as it is
+        """
+        if isinstance(path, Directory):
+            return path
+
+        path = abspath(path)
+        with cls._lock:
+            directory = cls._open_directories.get(path)
+            if directory is None:
+                directory = cls(path)
+                cls._open_directories[path] = directory
+
+        return directory
+
+    def close(self):
+        """Close the descriptor of the directory. FileSets still bound to it can't access their files anymore."""
+        with self._lock:
+            if self._open_directories.get(self.path) is self:
+                del self._open_directories[self.path]
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    @classmethod
+    def close_all(cls):
+        """Close all directories opened via open."""
+        for directory in list(cls._open_directories.values()):
+            directory.close()
+
+    #===========================================================================
+    # File Operations
+    #===========================================================================
+
+    def scandir(self, path=None):
+        """
+        Return an iterator of the entries of the directory (see os.scandir).
+
+        @param path: Ignored; the directory's descriptor is listed, so the method can be used as scandir_function of a DirectorySnapshot
+        """
+        return os.scandir(self.fd)
+
+    def stat(self, path=None):
+        """
+        Return the status of the directory itself (see os.stat).
+
+        @param path: Ignored; the directory's descriptor is examined, so the method can be used as stat_function of a DirectorySnapshot
+        """
+        return os.stat(self.fd)
+
+    def is_file(self, name):
+        """Return whether the given name within the directory refers to a regular file, following symbolic links like os.path.isfile."""
+        try:
+            return S_ISREG(os.stat(name, dir_fd=self.fd).st_mode)
+        except (OSError, ValueError):
+            return False
+
+    def name_taken(self, name):
+        """Return whether the given name within the directory is taken by any directory entry, like os.path.lexists."""
+        return FileExchange.lexists(name, self.fd)
+
+    def rename(self, old_name, new_name):
+        """
+        Rename a file within the directory without ever replacing an existing one (see FileExchange.rename).
+
+        @raise FileExistsError: The new name is taken
+        @raise OSError: The file can't be renamed
+        """
+        FileExchange.rename(old_name, new_name, self.fd)
+
+    def swap(self, name1, name2, temp_name, rename_function=None):
+        """
+        Swap the names of two files within the directory, exchanging them atomically if possible (see FileExchange.swap).
+
+        @param rename_function: The function used to rename a file if the files have to be renamed one after another (default: Directory.rename)
+
+        @return: True if the files have been exchanged atomically, False if they have been renamed one after another
+
+        @raise OSError: The files can't be swapped
+        """
+        return FileExchange.swap(name1, name2, temp_name, self.rename if rename_function is None else rename_function, self.fd)
+
+    def make_directory(self, name):
+        """Create a sub directory with the given name, unless it exists already."""
+        try:
+            os.mkdir(name, dir_fd=self.fd)
+        except FileExistsError:
+            pass
+
+    def remove_directory(self, name):
+        """
+        Remove the empty sub directory with the given name.
+
+        @raise OSError: The sub directory does not exist or is not empty
+        """
+        os.rmdir(name, dir_fd=self.fd)
@@ -0,0 +1,120 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from collections import OrderedDict
+from os import stat
+from os.path import abspath
+from sys import getsizeof
+
+
+class DirectoryRegistry():
+    """
+    The file sets of recently visited directories, so returning to a directory doesn't require detecting its file sets again.
+
+    The file sets of a directory are stored when it is left and taken back out when it is entered again. A stored
+    entry is only valid as long as the modification time of its directory has not changed since; otherwise the file
+    sets have to be detected again. Checking this costs a single stat, regardless of the amount of files.
+    The entries are kept in least recently used order. Once their estimated memory usage exceeds max_memory, the
+    least recently used entries are dropped until it doesn't anymore.
+    """
+    DEFAULT_MAX_MEMORY = 256 * 1024**2 # bytes
+
+    class _Entry():
+        __slots__ = ('file_sets', 'mtime', 'size')
+
+        def __init__(self, file_sets, mtime, size):
+            self.file_sets = file_sets
+            self.mtime = mtime
+            self.size = size
+
+    def __init__(self, max_memory=DEFAULT_MAX_MEMORY):
+        """
+        Create an empty registry.
+
+        @param max_memory: The estimated amount of memory in bytes the stored file sets may use at most (default: DEFAULT_MAX_MEMORY)
+        """
+        self.max_memory = max_memory
+        self.memory_usage = 0
+        self._entries = OrderedDict() # absolute directory path -> _Entry, least recently used first
+
+    def __len__(self):
+        """Return the amount of directories stored."""
+        return len(self._entries)
+
+    def __contains__(self, directory):
+        return abspath(directory) in self._entries
+
+    def __repr__(self):
+        return "DirectoryRegistry({} directories, {} of {} bytes)".format(len(self._entries), self.memory_usage, self.max_memory)
+
+    @staticmethod
+    def estimate_size(file_sets):
+        """Return the estimated memory used by the files dictionaries of the given file sets in bytes."""
+        return sum(getsizeof(file_set.files) for file_set in file_sets)
+
+    def store(self, directory, file_sets, mtime=None):
+        """
+        Store the file sets of the given directory as they are now, replacing the ones stored before.
+
+        The directory's current modification time is stored along with them, so changes the file sets have made
+        themselves don't invalidate them. If the file sets alone exceed max_memory, they are not stored at all.
+
+        @param directory: The path of the directory
+        @param file_sets: The list of file sets of the directory
+        @param mtime: The modification time of the directory in nanoseconds the file sets correspond to, e.g. the one before they were detected (default: the current one)
+        """
+        directory = abspath(directory)
+        self.forget(directory)
+
+        size = self.estimate_size(file_sets)
+        if size > self.max_memory:
+            return
+        if mtime is None:
+            try:
+                mtime = stat(directory).st_mtime_ns
+            except OSError:
+                return
+
+        self._entries[directory] = self._Entry(file_sets, mtime, size)
+        self.memory_usage += size
+        self._evict()
+
+    def take(self, directory):
+        """
+        Remove the file sets of the given directory from the registry and return them.
+
+        @param directory: The path of the directory
+
+        @return: The list of stored file sets, or None if none are stored or the directory has changed since they were stored
+        """
+        directory = abspath(directory)
+        entry = self._entries.pop(directory, None)
+        if entry is None:
+            return None
+        self.memory_usage -= entry.size
+
+        try:
+            if stat(directory).st_mtime_ns != entry.mtime:
+                return None
+        except OSError:
+            return None
+        return entry.file_sets
+
+    def forget(self, directory):
+        """Drop the file sets of the given directory, if any are stored."""
+        entry = self._entries.pop(abspath(directory), None)
+        if entry is not None:
+            self.memory_usage -= entry.size
+
+    def clear(self):
+        """Drop the file sets of all directories."""
+        self._entries.clear()
+        self.memory_usage = 0
+
+    def _evict(self):
+        """Drop the least recently used entries until the memory usage doesn't exceed max_memory anymore."""
+        while self.memory_usage > self.max_memory:
+            _, entry = self._entries.popitem(last=False)
+            self.memory_usage -= entry.size
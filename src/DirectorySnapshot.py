@@ -0,0 +1,191 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from os import getcwd, name as os_name, stat
+from os.path import abspath, join, split
+from threading import Lock
+
+
+class DirectorySnapshot():
+    """
+    The names of the files within a directory at a certain point in time, along with their inode numbers.
+
+    Snapshots are cached per directory and shared by all FileSets, so detecting several file sets within the
+    same directory only scans it once. A cached snapshot is valid as long as the modification time of its
+    directory has not changed. Renames performed by the FileSets themselves are applied to the cached snapshots
+    (see note_rename) without examining the directory, so they neither cause a rescan nor cost an extra system call.
+    The modification time they have caused is adopted afterwards with a single stat (see sync), once per executed
+    rename plan or, at the latest, on the next detection.
+    Changes that other processes make to a directory in between the first of these renames and the adoption of the
+    modification time can not be told apart from the own renames and are thus missed.
+    The inode numbers are taken from the directory listing, which costs no extra system call except on Windows,
+    where they are not recorded. They follow the files through the noted renames (see current_inodes).
+    """
+    _snapshots = {} # absolute directory path -> DirectorySnapshot
+    _moved_inodes = {} # absolute file path -> inode number of the files moved out of a cached snapshot into a directory without one
+    _LISTED_INODES = (os_name != 'nt') # whether the directory listing provides the inode numbers without a stat per file
+    _lock = Lock() # renames may be noted by several threads at once (see RenameScheduler)
+
+    def __init__(self, directory, scandir_function, stat_function=stat):
+        """
+        Take a snapshot of the given directory.
+
+        @param directory: The absolute path of the directory
+        @param scandir_function: The function used to list the directory's entries (e.g. os.scandir)
+        @param stat_function: The function used to obtain the directory's modification time (default: os.stat)
+        """
+        self.directory = directory
+        self._stat = stat_function
+        self.mtime = stat_function(directory).st_mtime_ns
+        self.renamed = False # whether renames have been noted since the modification time was obtained
+        if self._LISTED_INODES:
+            self.file_names = {entry.name: entry.inode() for entry in scandir_function(directory) if entry.is_file()} # file name -> inode number, ordered like the directory listing
+        else:
+            self.file_names = dict.fromkeys(entry.name for entry in scandir_function(directory) if entry.is_file())
+
+        ## If the directory has changed during the scan, the snapshot might not be complete
+        self.complete = (stat_function(directory).st_mtime_ns == self.mtime)
+
+    def __len__(self):
+        """Return the amount of files within the snapshot."""
+        return len(self.file_names)
+
+    def __repr__(self):
+        return "DirectorySnapshot({!r}, {} files)".format(self.directory, len(self.file_names))
+
+    def is_current(self):
+        """
+        Return whether the directory has not been changed since the snapshot was taken or last updated, apart from the renames noted since.
+
+        If renames have been noted, the modification time they have caused is adopted. A rename always changes the
+        modification time of the directories involved. If it did not change, the renames can't be told apart from
+        the state the snapshot was taken in, so the snapshot is not current to be on the safe side.
+        """
+        try:
+            mtime = self._stat(self.directory).st_mtime_ns # outside of the lock, so renames noted meanwhile don't wait for it
+        except OSError:
+            return False
+
+        with self._lock:
+            if not self.renamed:
+                return mtime == self.mtime
+            if mtime == self.mtime:
+                return False
+            self.mtime = mtime
+            self.renamed = False
+            return True
+
+    @classmethod
+    def of(cls, directory, scandir_function, stat_function=stat):
+        """
+        Return a current snapshot of the given directory, reusing the cached one if it is still valid.
+
+        @param directory: The path of the directory
+        @param scandir_function: The function used to list the directory's entries if it has to be scanned (e.g. os.scandir)
+        @param stat_function: The function used to obtain the directory's modification time (default: os.stat), e.g. Directory.stat
+        """
+        directory = abspath(directory)
+
+        snapshot = cls._snapshots.get(directory)
+        if snapshot is None or not snapshot.is_current():
+            snapshot = cls(directory, scandir_function, stat_function)
+            if snapshot.complete:
+                cls._snapshots[directory] = snapshot
+            else:
+                cls._snapshots.pop(directory, None)
+
+        return snapshot
+
+    @classmethod
+    def current_inodes(cls, directory):
+        """
+        Return the inode numbers of the files within the cached snapshot of the given directory if it is current (see is_current), without scanning the directory.
+
+        @param directory: The path of the directory
+
+        @return: A dictionary mapping the file names to their inode numbers, or to None if they are unknown; None if no current snapshot is cached
+        """
+        directory = abspath(directory)
+        snapshot = cls._snapshots.get(directory)
+        if snapshot is None or not snapshot.is_current():
+            return None
+        return snapshot.file_names
+
+    @classmethod
+    def sync(cls, directory):
+        """
+        Adopt the modification time the renames noted since the last sync have caused for the cached snapshot of the given directory (see is_current), or drop the snapshot if it is not current.
+
+        @param directory: The path of the directory
+        """
+        directory = abspath(directory)
+        snapshot = cls._snapshots.get(directory)
+        if snapshot is not None and not snapshot.is_current():
+            cls._snapshots.pop(directory, None)
+
+    @classmethod
+    def note_rename(cls, old_path, new_path, base_directory=None):
+        """
+        Apply a rename that has just been performed to the cached snapshots of the affected directories.
+
+        The directories are not examined; the modification time the rename has caused is adopted later (see sync).
+        The file keeps its inode number, also while it is moved out to a directory without a cached snapshot and back,
+        like the temporary names within the staging directory (see RenamePlan.STAGING_DIRECTORY).
+
+        @param old_path: The old path of the renamed file; may be relative or absolute
+        @param new_path: The new path of the renamed file; may be relative or absolute
+        @param base_directory: The absolute path of the directory relative paths are relative to (default: the working directory)
+        """
+        if not cls._snapshots:
+            return
+
+        old_directory, old_name = split(abspath(join(base_directory or getcwd(), old_path)))
+        new_directory, new_name = split(abspath(join(base_directory or getcwd(), new_path)))
+        with cls._lock: # only held to update the names, so concurrent renames (see RenameScheduler) are hardly serialized
+            old_snapshot = cls._snapshots.get(old_directory)
+            if old_snapshot is not None:
+                inode = old_snapshot.file_names.pop(old_name, None)
+                old_snapshot.renamed = True
+            else:
+                inode = cls._moved_inodes.pop(join(old_directory, old_name), None)
+
+            new_snapshot = cls._snapshots.get(new_directory)
+            if new_snapshot is not None:
+                new_snapshot.file_names[new_name] = inode
+                new_snapshot.renamed = True
+            elif inode is not None:
+                cls._moved_inodes[join(new_directory, new_name)] = inode
+
+    @classmethod
+    def note_exchange(cls, name1, name2, base_directory=None):
+        """
+        Apply an exchange of two files within the same directory that has just been performed atomically (see FileExchange.exchange) to its cached snapshot.
+
+        Both names still exist, so only the inode numbers are swapped.
+
+        @param name1: The path of one of the files; may be relative or absolute
+        @param name2: The path of the other file, within the same directory
+        @param base_directory: The absolute path of the directory relative paths are relative to (default: the working directory)
+        """
+        if not cls._snapshots:
+            return
+
+        directory, name1 = split(name1)
+        name2 = split(name2)[1]
+        directory = abspath(join(base_directory or getcwd(), directory))
+        with cls._lock:
+            snapshot = cls._snapshots.get(directory)
+            if snapshot is None:
+                return
+
+            file_names = snapshot.file_names
+            file_names[name1], file_names[name2] = file_names.get(name2), file_names.get(name1)
+            snapshot.renamed = True
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached snapshots, so the next detection of every directory rescans it."""
+        cls._snapshots.clear()
+        cls._moved_inodes.clear()
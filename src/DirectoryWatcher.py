@@ -0,0 +1,307 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import ctypes
+import ctypes.util
+from os import close, fsdecode, fsencode, read, scandir, stat
+from os.path import abspath, isfile, join
+import select
+import struct
+import time
+
+from FileSet import FileSet
+
+
+class DirectoryWatcher():
+    """
+    Keep the FileSets of a directory up to date with the changes other programs make to it, without rescanning it as a whole.
+
+    On Linux, the directory is watched through inotify, which reports the name of every file that is created,
+    deleted or renamed. Elsewhere, or if inotify is not available, the watcher falls back to polling the modification
+    time of the directory and only lists it if the modification time has changed.
+    The reported names are applied to the watched FileSets using FileSet.sync_files, which compares them to the
+    actual files. Renames that the FileSets have performed themselves are thus recognized as already applied.
+
+    The watcher doesn't run in the background; poll has to be called regularly to apply the changes.
+    In batch mode, the FileSets are ahead of the actual files, so the changes are held back until the batch has been committed.
+    """
+    BACKENDS = ('inotify', 'polling')
+
+    def __init__(self, directory, file_sets=(), backend=None):
+        """
+        Start watching the given directory.
+
+        Changes made before the watcher was started are not reported; use resync to apply them.
+
+        @param directory: The path of the directory
+        @param file_sets: The FileSets within the directory that are kept up to date
+        @param backend: Either 'inotify' or 'polling'. By default, inotify is used if it is available.
+
+        @raise ValueError: The backend is unknown
+        @raise OSError: The directory can't be watched using the requested backend
+        """
+        if backend is not None and not backend in self.BACKENDS:
+            raise ValueError("Unknown backend '{}'. Expected one of: {}".format(backend, ', '.join(self.BACKENDS)))
+
+        self.directory = abspath(directory)
+        self._file_sets = dict.fromkeys(file_sets) # ordered set of the watched FileSets
+        self._pending_file_names = set()
+        self._resync_pending = False
+
+        if backend is None:
+            try:
+                self._backend = _InotifyBackend(self.directory)
+            except OSError:
+                self._backend = _PollingBackend(self.directory)
+        elif backend == 'inotify':
+            self._backend = _InotifyBackend(self.directory)
+        else:
+            self._backend = _PollingBackend(self.directory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __repr__(self):
+        return "DirectoryWatcher({!r}, backend={!r})".format(self.directory, self.backend)
+
+    @property
+    def backend(self):
+        """The name of the backend used to watch the directory."""
+        return self._backend.NAME
+
+    @property
+    def file_sets(self):
+        """The list of the watched FileSets."""
+        return list(self._file_sets)
+
+    def watch(self, file_set):
+        """Keep the given FileSet up to date as well. Watching a FileSet twice has no effect."""
+        self._file_sets[file_set] = None
+
+    def unwatch(self, file_set):
+        """Stop keeping the given FileSet up to date."""
+        self._file_sets.pop(file_set, None)
+
+    def close(self):
+        """Stop watching the directory."""
+        self._backend.close()
+
+    def poll(self, timeout=0):
+        """
+        Apply the changes made to the directory since the last poll to the watched FileSets.
+
+        @param timeout: The amount of seconds to wait for a change if none is pending (default: 0, i.e. don't wait)
+
+        @return: A dictionary mapping every FileSet that has changed to a 2-tuple of its added and removed files (see FileSet.sync_files)
+        """
+        changed_file_names = self._backend.read_changed_file_names(timeout)
+        if changed_file_names is None:
+            self._resync_pending = True
+        else:
+            self._pending_file_names.update(changed_file_names)
+
+        if FileSet.in_batch_mode():
+            return {} # the FileSets are ahead of the directory until the batch is committed
+
+        if self._resync_pending:
+            return self.resync()
+
+        file_names = self._pending_file_names
+        self._pending_file_names = set()
+        if not file_names:
+            return {}
+
+        return self._sync_file_sets(file_names)
+
+    def resync(self):
+        """
+        Compare the watched FileSets with all files within the directory and apply the differences.
+
+        This is done automatically if the changes could not be tracked, e.g. because too many happened at once.
+
+        @return: A dictionary mapping every FileSet that has changed to a 2-tuple of its added and removed files (see FileSet.sync_files)
+        """
+        self._resync_pending = False
+        self._pending_file_names.clear()
+
+        try:
+            file_names = {entry.name for entry in scandir(self.directory) if entry.is_file()}
+        except OSError:
+            file_names = set() # the directory is gone and with it all of its files
+        for file_set in self._file_sets:
+            file_names.update(file_set.get_files_list())
+
+        return self._sync_file_sets(file_names)
+
+    #===========================================================================
+    # Internal Procedures
+    #===========================================================================
+
+    def _sync_file_sets(self, file_names):
+        """Apply the given changed file names to all watched FileSets and return the changes of the ones that have changed."""
+        directory = self.directory
+        file_exists = lambda file_name: isfile(join(directory, file_name))
+
+        changes = {}
+        for file_set in self._file_sets:
+            added_files, removed_files = file_set.sync_files(file_names, file_exists)
+            if added_files or removed_files:
+                changes[file_set] = (added_files, removed_files)
+
+        return changes
+
+
+class _InotifyBackend():
+    """Watch a directory using the inotify API of the Linux kernel, called through ctypes."""
+    NAME = 'inotify'
+
+    ## Constants from <sys/inotify.h>
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ONLYDIR = 0x1000000
+    IN_CLOEXEC = 0o2000000
+    IN_NONBLOCK = 0o4000
+
+    WATCH_MASK = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    RESYNC_MASK = IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+    EVENT_HEADER = struct.Struct('iIII') # watch descriptor, mask, cookie, length of the name
+    READ_SIZE = 64 * 1024
+
+    _libc = None
+
+    def __init__(self, directory):
+        """
+        @raise OSError: inotify is not available or the directory can't be watched
+        """
+        libc = self._load_libc()
+
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, "inotify_init1 failed")
+
+        if libc.inotify_add_watch(self._fd, fsencode(directory), self.WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            close(self._fd)
+            self._fd = None
+            raise OSError(errno, "inotify_add_watch failed", directory)
+
+    @classmethod
+    def _load_libc(cls):
+        """Return the C library, raising an OSError if it doesn't provide inotify."""
+        if cls._libc is None:
+            library_name = ctypes.util.find_library('c')
+            try:
+                libc = ctypes.CDLL(library_name, use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            except AttributeError:
+                raise OSError("inotify is not available on this system")
+            cls._libc = libc
+
+        return cls._libc
+
+    def close(self):
+        if self._fd is not None:
+            close(self._fd)
+            self._fd = None
+
+    def read_changed_file_names(self, timeout):
+        """
+        Read all pending events.
+
+        @return: The set of the names of the files that have been created, deleted or renamed, or None if the changes could not be tracked
+        """
+        if self._fd is None:
+            return set()
+        if timeout and not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+
+        file_names = set()
+        resync = False
+        header_size = self.EVENT_HEADER.size
+        while True:
+            try:
+                buffer = read(self._fd, self.READ_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(buffer):
+                _, mask, _, name_length = self.EVENT_HEADER.unpack_from(buffer, offset)
+                offset += header_size
+                if mask & self.RESYNC_MASK:
+                    resync = True
+                elif name_length:
+                    file_names.add(fsdecode(buffer[offset:offset+name_length].rstrip(b'\0')))
+                offset += name_length
+
+        return None if resync else file_names
+
+
+class _PollingBackend():
+    """
+    Watch a directory by polling its modification time and comparing its file names once it has changed.
+
+    A change made within the same tick of the modification time as the previous listing would go unnoticed,
+    so the directory is listed again as long as the previous listing is younger than RACY_INTERVAL.
+    """
+    NAME = 'polling'
+    POLL_INTERVAL = 0.05 # seconds
+    RACY_INTERVAL = 2 * 10**9 # nanoseconds
+
+    def __init__(self, directory):
+        """
+        @raise OSError: The directory can't be listed
+        """
+        self.directory = directory
+        self._mtime, self._listed_at, self._file_names = self._list_directory()
+
+    def close(self):
+        pass
+
+    def _list_directory(self):
+        """Return the modification time of the directory, the time it was listed at and the set of its file names."""
+        listed_at = time.time_ns()
+        mtime = stat(self.directory).st_mtime_ns
+        file_names = {entry.name for entry in scandir(self.directory) if entry.is_file()}
+        return mtime, listed_at, file_names
+
+    def _has_changed(self):
+        try:
+            mtime = stat(self.directory).st_mtime_ns
+        except OSError:
+            return True
+        return mtime != self._mtime or mtime >= self._listed_at - self.RACY_INTERVAL
+
+    def read_changed_file_names(self, timeout):
+        """
+        List the directory if it has changed since it was last listed.
+
+        @return: The set of the names of the files that have been created, deleted or renamed, or None if the directory can't be listed anymore
+        """
+        deadline = time.monotonic() + timeout
+        while not self._has_changed():
+            if time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.POLL_INTERVAL)
+
+        try:
+            self._mtime, self._listed_at, file_names = self._list_directory()
+        except OSError:
+            return None
+
+        changed_file_names = file_names ^ self._file_names
+        self._file_names = file_names
+        return changed_file_names
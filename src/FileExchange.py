@@ -0,0 +1,155 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import ctypes
+import ctypes.util
+import errno
+import os
+from os.path import lexists
+
+
+class FileExchange():
+    """
+    Rename files safely using renameat2 of the Linux kernel, called through ctypes.
+
+    Two of its flags are used:
+        - RENAME_EXCHANGE swaps the names of two files atomically. Swapping two files by renaming them takes three
+          renames and a temporary name, during which one of the files is missing. An exchange takes a single system
+          call and both names exist at any time.
+        - RENAME_NOREPLACE makes a rename fail instead of silently replacing an existing file. The kernel checks
+          this as part of the rename, so it costs nothing extra and can't be raced by other processes.
+    Elsewhere, or if the file system doesn't support a flag, the files are renamed one after another or checked for
+    existence before renaming them, respectively.
+    All operations accept the descriptor of a directory (dir_fd) that relative paths are resolved against instead of
+    the working directory (see Directory).
+    """
+    RENAME_NOREPLACE = 1 << 0 # from <linux/fs.h>
+    RENAME_EXCHANGE = 1 << 1
+    AT_FDCWD = -100
+    UNSUPPORTED_ERRNOS = (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP) # the kernel or the file system doesn't support the flag
+
+    _renameat2 = None
+    _loaded = False
+    _unsupported_flags = set() # the flags the system has rejected so far
+
+    @classmethod
+    def _load_renameat2(cls):
+        """Return renameat2 of the C library, or None if it doesn't provide it."""
+        if not cls._loaded:
+            library_name = ctypes.util.find_library('c')
+            try:
+                renameat2 = ctypes.CDLL(library_name, use_errno=True).renameat2
+            except (AttributeError, OSError):
+                renameat2 = None
+            else:
+                renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+            cls._renameat2 = renameat2
+            cls._loaded = True
+
+        return cls._renameat2
+
+    @classmethod
+    def _supports(cls, flag):
+        return cls._load_renameat2() is not None and not flag in cls._unsupported_flags
+
+    @classmethod
+    def _call_renameat2(cls, path1, path2, flag, dir_fd=None):
+        """
+        @param dir_fd: The descriptor of the directory relative paths are resolved against (default: the working directory)
+
+        @raise OSError: renameat2 failed. If its errno is one of UNSUPPORTED_ERRNOS, the flag is not used anymore from now on.
+        """
+        if not cls._supports(flag):
+            raise OSError(errno.ENOSYS, "renameat2 is not supported on this system", path1)
+
+        if dir_fd is None:
+            dir_fd = cls.AT_FDCWD
+        if cls._renameat2(dir_fd, os.fsencode(path1), dir_fd, os.fsencode(path2), flag) != 0:
+            error_number = ctypes.get_errno()
+            if error_number in cls.UNSUPPORTED_ERRNOS:
+                cls._unsupported_flags.add(flag)
+            raise OSError(error_number, os.strerror(error_number), path1, None, path2)
+
+    @classmethod
+    def is_available(cls):
+        """Return whether exchanges are supported, i.e. the C library provides renameat2 and no exchange has been rejected by the system so far."""
+        return cls._supports(cls.RENAME_EXCHANGE)
+
+    @classmethod
+    def exchange(cls, path1, path2, dir_fd=None):
+        """
+        Exchange the names of the two given files atomically.
+
+        @param dir_fd: The descriptor of the directory relative paths are resolved against (default: the working directory)
+
+        @raise OSError: The files can't be exchanged. If exchanges are not supported at all, its errno is one of UNSUPPORTED_ERRNOS and is_available returns False from now on.
+        """
+        cls._call_renameat2(path1, path2, cls.RENAME_EXCHANGE, dir_fd)
+
+    @classmethod
+    def rename(cls, old_path, new_path, dir_fd=None):
+        """
+        Rename a file, unless the new path is taken already. Unlike os.rename, an existing file is never replaced.
+
+        @param dir_fd: The descriptor of the directory relative paths are resolved against (default: the working directory)
+
+        @raise FileExistsError: The new path is taken
+        @raise OSError: The file can't be renamed
+        """
+        if cls._supports(cls.RENAME_NOREPLACE):
+            try:
+                cls._call_renameat2(old_path, new_path, cls.RENAME_NOREPLACE, dir_fd)
+                return
+            except OSError as e:
+                if not e.errno in cls.UNSUPPORTED_ERRNOS:
+                    raise
+
+        if cls.lexists(new_path, dir_fd):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), old_path, None, new_path)
+        os.rename(old_path, new_path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+    @staticmethod
+    def lexists(path, dir_fd=None):
+        """Return whether the given path is taken by any directory entry, like os.path.lexists, resolving a relative path against the given directory descriptor."""
+        if dir_fd is None:
+            return lexists(path)
+
+        try:
+            os.lstat(path, dir_fd=dir_fd)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    @classmethod
+    def swap(cls, path1, path2, temp_path, rename_function=None, dir_fd=None):
+        """
+        Swap the names of the two given files, exchanging them atomically if possible.
+
+        @param temp_path: The temporary path used if the files have to be renamed one after another; it must reside on the same file system
+        @param rename_function: The function used to rename a file if the files have to be renamed one after another (default: FileExchange.rename)
+        @param dir_fd: The descriptor of the directory relative paths are resolved against (default: the working directory); rename_function has to resolve them itself
+
+        @return: True if the files have been exchanged atomically, False if they have been renamed one after another using rename_function
+
+        @raise OSError: The files can't be swapped
+        """
+        if cls.is_available():
+            try:
+                cls.exchange(path1, path2, dir_fd)
+                return True
+            except OSError as e:
+                if not e.errno in cls.UNSUPPORTED_ERRNOS:
+                    raise
+
+        if rename_function is None:
+            rename_function = lambda old_path, new_path: cls.rename(old_path, new_path, dir_fd)
+        rename_function(path1, temp_path)
+        try:
+            rename_function(path2, path1)
+        except OSError:
+            rename_function(temp_path, path1)
+            raise
+        rename_function(temp_path, path2)
+        return False
@@ -0,0 +1,59 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import re
+
+
+class FileNameCompiler():
+    """
+    Detect the file sets a list of file names belongs to and compile their files, without scanning any directory itself.
+
+    This is shared by everything detecting the file sets of a whole directory: the CLI, the FileSetCatalog and the
+    workers of a TreeDetector.
+    """
+    LAST_INTEGER_REGEX = re.compile(r'(.*)(?<!\d)(\d+)(\D*)$', re.DOTALL) # left pattern, running index (the last integer), right pattern
+
+    @classmethod
+    def compile_file_names(cls, file_names):
+        """
+        Detect the file sets the given file names belong to and compile their files in a single pass. This only includes file sets which's running index is the last integer in its name.
+
+        Everything before the first period (.) is considered the name of the file which determines the detected pattern,
+        while everything after is considered the file extension. (periods at the front are ignored, since they indicate hidden files/patterns)
+
+        @param file_names: An iterable of file names
+
+        @return: A dictionary mapping the pattern of every detected file set to its compiled files, i.e. a dictionary of indexes and file type lists
+        """
+        match_last_integer = cls.LAST_INTEGER_REGEX.match
+
+        pattern_files_dic = {}
+        for file_name in file_names:
+            ## Split off the file extension(s), i.e. everything after the first dot (except if dot is at the front, indicating a hidden pattern)
+            dot_position = file_name.find('.', 1)
+            if 0 < dot_position < len(file_name)-1:
+                match = match_last_integer(file_name, 0, dot_position)
+                file_type = file_name[dot_position+1:]
+            else:
+                match = match_last_integer(file_name)
+                file_type = ''
+
+            if match is None:
+                continue # the current file doesn't follow a pattern. Skip it.
+
+            left_pattern, index, right_pattern = match.groups()
+            index = int(index)
+
+            files = pattern_files_dic.get((left_pattern, right_pattern))
+            if files is None:
+                pattern_files_dic[left_pattern, right_pattern] = {index: [file_type]}
+            else:
+                file_types = files.get(index)
+                if file_types is None:
+                    files[index] = [file_type]
+                else:
+                    file_types.append(file_type)
+
+        return pattern_files_dic
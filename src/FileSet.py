@@ -3,13 +3,25 @@ Created on 16.06.2018
 
 @author: FM
 '''
-from os import getcwd, rename, scandir
-from os.path import isfile
+from contextlib import contextmanager
+from copy import deepcopy
+from os import getcwd, makedirs, rmdir, scandir
+from functools import partial
+from os.path import dirname, isfile, join, lexists
 import re
 
+from Directory import Directory
+from DirectorySnapshot import DirectorySnapshot
+from FileExchange import FileExchange
+from FilesDict import CompactFilesDict, FilesDict
+from IntervalSet import IntervalSet
+from RenameJournal import RenameJournal
+from RenamePlan import RenameBatch, RenamePlan, RenameRecording
+
+rename = FileExchange.rename # renames a file without ever replacing an existing one
+
 
 # TODO: check patterns and add_file/remove_file inputs for forbidden characters | may not be useful, since Linux allows basically everything
-# TODO: working directory/path management
 # TODO: add check so change_index doesn't change into negative numbers?
 # TODO: give warning when multi-assigned indexes are detected at compilation time
 # TODO: Refactor KeyError Try/Except statements when deleting and instead use pop
@@ -19,7 +31,6 @@ import re
 # TODO: polish FileSet and remove unnecessary variables etc
 # TODO: implement find_pattersn in FileSet instead of CLI?
 # TODO: write a proper classdoc
-# TODO: extra object for a files dictionary with useful methods?
 # TODO: rework documentation; reflect errors, parameters and special traits
 # TODO: add method add_file_sets to optimize addition from multiple sets at once
 # TODO: add method "rename" to change file set pattern
@@ -39,6 +50,12 @@ class FileSet():
     """
     type_regex = re.compile(r"(?<!^)\.(.+)$")
     INDEX_INDICATOR = '*'
+    journal_renames = False # whether the renames of an operation are written to a RenameJournal first, so they can be recovered if the process dies
+    rename_workers = 1 # the amount of threads renaming the files of a single operation concurrently; more than one pays off on high-latency (e.g. network) file systems
+    exchange_files = False # whether two files swapping their names are exchanged in a single step instead of being renamed via a temporary name (see FileExchange)
+    _rename_batch = None # the RenameBatch all FileSets of the working directory rename their files into while in batch mode
+    _directory_batches = {} # Directory -> the RenameBatch the FileSets bound to that directory rename their files into while in batch mode
+    _batch_depth = 0
 
 
     #===========================================================================
@@ -70,7 +87,7 @@ class FileSet():
         """Raised when a file_type is suppoed to be moved/changed in index even though it doesn't exist at this position."""
 
     class TooManyFilesError(FileSetError):
-        """Raised by find_flaws if a file set with a very high max_index contains too great gaps which would require too long to find."""
+        """Formerly raised by find_flaws for file sets with a max_index above 1000. Flaws are now indexed incrementally, so it is not raised anymore."""
 
     class ConflictingOptionsError(FileSetError):
         """Raised when a method is called with conflicting options."""
@@ -94,8 +111,16 @@ class FileSet():
         @param **kwargs: Keyword arguments:
             - fitting_file_regex: an already compiled regular expression to match fitting files of the set against.
             - file_list_compiled: a boolean stating whether the given file_list is raw or compiled (default: False; file_list will be compiled automatically)
+            - compact_files: a boolean stating whether the files should be stored in a CompactFilesDict, which needs far less memory for very big sets (default: False)
+            - directory: the path of the directory (or an opened Directory) the files reside in; the set is bound to it and never depends on the working directory (default: None; the files reside in the working directory)
         """
         self.pattern = pattern
+        self.directory = self._open_directory(kwargs.get('directory', None))
+
+        if kwargs.get('compact_files', False):
+            self._files_dict_class = CompactFilesDict
+        else:
+            self._files_dict_class = FilesDict
 
         self.fitting_file_regex = kwargs.get('fitting_file_regex', None)
         if self.fitting_file_regex is None:
@@ -110,6 +135,19 @@ class FileSet():
 
         self.max_index = self._find_max_index()
 
+    @property
+    def files(self):
+        """The files dictionary of the set, mapping every assigned index to a list of the file types assigned to it."""
+        return self._files
+
+    @files.setter
+    def files(self, files_dict):
+        """Set the files dictionary. Plain dictionaries are converted into the set's files dictionary class, which keeps its indexes sorted."""
+        if isinstance(files_dict, self._files_dict_class):
+            self._files = files_dict
+        else:
+            self._files = self._files_dict_class(files_dict)
+
     def __len__(self):
         """Return the amount of files contained in the set."""
         amount_of_files = 0
@@ -131,41 +169,77 @@ class FileSet():
         return "{}{}{}".format(left_pattern, self.INDEX_INDICATOR, right_pattern)
 
     @classmethod
-    def files_detected(cls, pattern):
-        """Return a FileSet object, whereas the files are automatically detected within the current working directory based on the given pattern."""
+    def files_detected(cls, pattern, **kwargs):
+        """
+        Return a FileSet object, whereas the files are automatically detected within the current working directory based on the given pattern.
+
+        @param pattern: The pattern of the file set
+        @param **kwargs: Keyword arguments passed on to the initializer (e.g. compact_files). If a directory is given, the files are detected within it instead.
+        """
         left_pattern, right_pattern = pattern
         fitting_file_regex = re.compile(r"{}(\d+){}(?:\.(.+))?$".format(re.escape(left_pattern), re.escape(right_pattern)))
 
-        compiled_file_list = cls._find_files(fitting_file_regex)
+        if kwargs.get('compact_files', False):
+            files_dict_class = CompactFilesDict
+        else:
+            files_dict_class = FilesDict
+        kwargs['directory'] = cls._open_directory(kwargs.get('directory', None))
+        compiled_file_list = cls._find_files(fitting_file_regex, files_dict_class, kwargs['directory'])
 
-        return cls(pattern, compiled_file_list, fitting_file_regex=fitting_file_regex, file_list_compiled=True)
+        return cls(pattern, compiled_file_list, fitting_file_regex=fitting_file_regex, file_list_compiled=True, **kwargs)
 
     @staticmethod
-    def _find_files(fitting_file_regex):
+    def _find_files(fitting_file_regex, files_dict_class=FilesDict, directory=None):
         """
         Find the files fitting the given fitting_file_regex and return them as a compiled file list.
 
+        The directory is only scanned if it has changed since the last detection (see DirectorySnapshot).
+
         @param fitting_file_regex: The compiled regular expression to match files against
+        @param files_dict_class: The class of files dictionary to compile the files into (default: FilesDict)
+        @param directory: The Directory to find the files in (default: None; the current working directory)
 
         @return: The compiled file list
         """
-        compiled_files = {}
-        for entry in scandir(getcwd()):
-            if entry.is_file():
-                match = fitting_file_regex.match(entry.name)
-                if match:
-                    ## Compile this file
-                    index = int(match.group(1))
-                    file_type = match.group(2)
-                    if file_type is None:
-                        file_type = ''
+        return files_dict_class.from_files(FileSet._match_files(fitting_file_regex, FileSet._scan_file_names(directory)))
+
+    @staticmethod
+    def _scan_file_names(directory=None):
+        """Return the names of the files within the given Directory (default: the current working directory), as they will be after the current batch (if any) is committed."""
+        if directory is None:
+            file_names = DirectorySnapshot.of(getcwd(), scandir).file_names
+        else:
+            file_names = DirectorySnapshot.of(directory.path, directory.scandir, directory.stat).file_names
 
-                    if index in compiled_files.keys():
-                        compiled_files[index].append(file_type)
-                    else:
-                        compiled_files.update({index: [file_type]})
+        batch = FileSet._batch_of(directory)
+        if batch is not None:
+            file_names = batch.apply_to(file_names) # see the files as they will be after the batch is committed
 
-        return compiled_files
+        return file_names
+
+    @staticmethod
+    def _open_directory(directory):
+        """Return the opened Directory of the given path or Directory; None for None, i.e. the working directory."""
+        return None if directory is None else Directory.open(directory)
+
+    @staticmethod
+    def _match_files(fitting_file_regex, file_names):
+        """
+        Match the given file names against the fitting_file_regex and generate the index and file type of each fitting file.
+
+        @param fitting_file_regex: The compiled regular expression to match files against
+        @param file_names: An iterable of file names
+
+        @return: A generator of (index, file_type) 2-tuples
+        """
+        for file_name in file_names:
+            match = fitting_file_regex.match(file_name)
+            if match:
+                file_type = match.group(2)
+                if file_type is None:
+                    file_type = ''
+
+                yield int(match.group(1)), file_type
 
     def _find_max_index(self):
         """
@@ -173,12 +247,7 @@ class FileSet():
 
         @return: The highest index in the set. If the FileSet is empty (i.e. has no files), -1 will be returned.
         """
-        assigned_indexes = self.files.keys()
-
-        try:
-            return max(assigned_indexes)
-        except ValueError:
-            return -1
+        return self.files.max_index()
 
     def _compile_files(self, file_list):
         """
@@ -188,34 +257,268 @@ class FileSet():
 
         @return: The compiled file list
         """
-        compiled_files = {}
-        for file in file_list:
-            match = self.fitting_file_regex.match(file)
-            index = int(match.group(1))
-            file_type = match.group(2)
-            if file_type is None:
-                file_type = ''
+        return self._files_dict_class.from_files(self._match_files(self.fitting_file_regex, file_list))
+
+    #===========================================================================
+    # Batch Mode
+    #===========================================================================
+
+    @classmethod
+    def begin_batch(cls):
+        """
+        Enter batch mode. Until the batch is committed, the operations of all FileSets only update their files dictionaries.
+
+        The physical renames are collected instead and coalesced into the net mapping of original to final file names.
+        Committing the batch renames every affected file at most once, no matter how many operations have moved it.
+        The renames of FileSets bound to a directory are collected in a separate batch per directory.
+        Batches may be nested; only committing the outermost batch performs the renames.
+        """
+        if cls._batch_depth == 0 and cls._rename_batch is None:
+            FileSet._rename_batch = RenameBatch()
+        FileSet._batch_depth += 1
+
+    @classmethod
+    def commit_batch(cls):
+        """
+        Leave batch mode and physically perform the collected renames as a single RenamePlan per directory.
+
+        The batch of every directory is committed, even if committing another one has failed.
 
-            self._add_type_to_files_dict(compiled_files, index, file_type)
+        @raise RenamePlan.RenameError: A rename failed; all renames of the batch of its directory have been undone
+        """
+        if cls._batch_depth == 0:
+            return # not in batch mode
+
+        FileSet._batch_depth -= 1
+        if cls._batch_depth == 0 and not isinstance(cls._rename_batch, RenameRecording): # batches within a recording are recorded as well
+            batches = [(None, FileSet._rename_batch)] + list(FileSet._directory_batches.items())
+            FileSet._rename_batch = None
+            FileSet._directory_batches = {}
+
+            error = None
+            for directory, batch in batches:
+                try:
+                    FileSet._commit_directory_batch(batch, directory)
+                except Exception as e:
+                    if error is None:
+                        error = e
+            if error is not None:
+                raise error
+
+    @staticmethod
+    def _commit_directory_batch(batch, directory):
+        """Physically perform the renames collected in the batch of the given Directory (None: the working directory)."""
+        exchange_function = partial(FileSet._exchange_physically, directory=directory) if FileSet._exchanges_enabled() else None
+        try:
+            batch.commit(partial(FileSet._rename_physically, directory=directory), FileSet.rename_workers, FileSet._create_journal(directory), exchange_function, partial(FileSet._name_taken, directory=directory))
+        finally:
+            FileSet._remove_staging_directory(directory)
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """
+        Context manager running the enclosed operations in batch mode (see begin_batch).
 
-        return compiled_files
+        The batch is committed even if the enclosed operations raise an error, since the files dictionaries have already been updated.
+        """
+        cls.begin_batch()
+        try:
+            yield
+        finally:
+            cls.commit_batch()
+
+    @classmethod
+    def in_batch_mode(cls):
+        """Return whether the FileSets are currently in batch mode. This is the case while renames are recorded as well."""
+        return cls._rename_batch is not None
+
+    #===========================================================================
+    # Dry Runs
+    #===========================================================================
+
+    @classmethod
+    @contextmanager
+    def record_renames(cls):
+        """
+        Context manager recording the renames of the enclosed operations instead of performing them (see RenameRecording).
+
+        Like in batch mode, the files dictionaries of the FileSets are updated nevertheless. Therefore, the operations
+        should be performed on copies of the FileSets (see dry_run).
+        """
+        parent_batch = cls._rename_batch
+        batch_depth = cls._batch_depth
+        recording = RenameRecording(parent_batch, cls.rename_workers if parent_batch is None else 1)
+        FileSet._rename_batch = recording
+        try:
+            yield recording
+        finally:
+            FileSet._rename_batch = parent_batch
+            FileSet._batch_depth = batch_depth
+
+    def dry_run(self, operation_name, *args, **kwargs):
+        """
+        Preview an operation: perform it on a copy of the set without renaming any files and return the renames it would perform.
+
+        The arguments are copied along with the set, so FileSets among them (e.g. the set to remove files to) are not changed either.
+
+        @param operation_name: The name of the operation's method, e.g. 'move_files'
+        @param *args: The positional arguments of the operation
+        @param **kwargs: The keyword arguments of the operation
+
+        @return: A RenameRecording listing the renames in the order they would be performed, along with their statistics
+
+        @raise: The errors the operation itself would raise
+        """
+        file_set, args, kwargs = deepcopy((self, args, kwargs))
+
+        with FileSet.record_renames() as recording:
+            getattr(file_set, operation_name)(*args, **kwargs)
+
+        return recording
 
     #===========================================================================
     # Low level / Internal Procedures
     #===========================================================================
+
+    @staticmethod
+    def _batch_of(directory):
+        """Return the batch collecting the renames within the given Directory (None: the working directory); None outside of batch mode. A recording collects the renames of all directories."""
+        batch = FileSet._rename_batch
+        if directory is None or batch is None or isinstance(batch, RenameRecording):
+            return batch
+        return FileSet._directory_batches.setdefault(directory, RenameBatch())
+
+    @staticmethod
+    def _rename(old_name, new_name, directory=None):
+        """Rename a file within the given Directory (default: the working directory) physically or, in batch mode, record the rename in the current batch."""
+        batch = FileSet._batch_of(directory)
+        if batch is None:
+            FileSet._rename_physically(old_name, new_name, directory)
+        else:
+            batch.rename(old_name, new_name)
+
     @staticmethod
-    def _add_type_to_files_dict(files_dict, index, file_type):
+    def _exchange(name1, name2, directory=None):
+        """Swap the names of two files within the given Directory (default: the working directory) physically or, in batch mode, record the exchange in the current batch."""
+        batch = FileSet._batch_of(directory)
+        if batch is None:
+            FileSet._exchange_physically(name1, name2, directory)
+        else:
+            batch.exchange(name1, name2)
+
+    @staticmethod
+    def _rename_all(name_mapping, directory=None):
         """
-        Add a file specified by its index and file type to the given files_dict.
+        Rename several files at once as a RenamePlan, renaming every file exactly once.
 
-        @param files_dict: The dictionary to which to add the file
-        @param index: The index of the file
-        @param file_type: The file type of the file
+        Outside of batch mode, the renames are performed by FileSet.rename_workers threads concurrently
+        and written to a RenameJournal first if FileSet.journal_renames is set.
+        If FileSet.exchange_files is set and supported, two files swapping their names are exchanged in a single step.
+        The plan is validated before any file is renamed, so collisions with files outside of the plan don't cause renames to be undone.
+
+        @param name_mapping: A dictionary mapping old file names to new file names
+        @param directory: The Directory the file names are relative to (default: None; the working directory)
+
+        @raise RenamePlan.CollisionError: A new name is taken by a file that is not renamed; no file has been renamed
+        @raise RenamePlan.RenameError: A rename failed; all renames of the plan have been undone
         """
-        if index in files_dict.keys():
-                files_dict[index].append(file_type)
+        batch = FileSet._batch_of(directory)
+        exchange_cycles = FileSet._exchanges_enabled()
+        name_taken = partial(FileSet._name_taken, directory=directory)
+        if isinstance(batch, RenameRecording):
+            plan = RenamePlan(name_mapping, batch.max_workers, exchange_cycles=exchange_cycles)
+            plan.validate(name_taken)
+            batch.record_plan(plan)
+        else:
+            journal = FileSet._create_journal(directory) if batch is None else None
+            plan = RenamePlan(name_mapping, FileSet.rename_workers if batch is None else 1, exchange_cycles=exchange_cycles)
+            plan.validate(name_taken)
+            try:
+                plan.execute(partial(FileSet._rename, directory=directory), journal, partial(FileSet._exchange, directory=directory))
+            finally:
+                if (plan.temp_names or plan.exchange_count) and batch is None:
+                    FileSet._remove_staging_directory(directory)
+                if batch is None:
+                    DirectorySnapshot.sync(getcwd() if directory is None else directory.path) # a single stat for the whole plan instead of one per rename
+
+    @staticmethod
+    def _create_journal(directory=None):
+        """Return a RenameJournal for the given Directory (default: the working directory) if the renames are to be journaled, otherwise None."""
+        if FileSet.journal_renames:
+            directory_path = getcwd() if directory is None else directory.path
+            return RenameJournal(directory_path, DirectorySnapshot.current_inodes(directory_path)) # the inodes listed by the last detection spare a stat per renamed file
+        return None
+
+    @staticmethod
+    def _exchanges_enabled():
+        """Return whether two files swapping their names are to be exchanged in a single step, i.e. FileSet.exchange_files is set and the system supports it."""
+        return FileSet.exchange_files and FileExchange.is_available()
+
+    @staticmethod
+    def _rename_physically(old_name, new_name, directory=None):
+        """Rename a file within the given Directory (default: the working directory) and keep the cached directory snapshots up to date. The staging directory of temporary names is created on demand."""
+        rename_file = rename if directory is None else directory.rename
+        try:
+            rename_file(old_name, new_name)
+        except FileNotFoundError:
+            if dirname(new_name) != RenamePlan.STAGING_DIRECTORY:
+                raise
+            if directory is None:
+                makedirs(RenamePlan.STAGING_DIRECTORY, exist_ok=True)
+            else:
+                directory.make_directory(RenamePlan.STAGING_DIRECTORY)
+            rename_file(old_name, new_name)
+        DirectorySnapshot.note_rename(old_name, new_name, None if directory is None else directory.path)
+
+    @staticmethod
+    def _exchange_physically(name1, name2, directory=None):
+        """Swap the names of two files within the given Directory (default: the working directory), exchanging them atomically if possible (see FileExchange.swap), and keep the cached directory snapshots up to date."""
+        rename_function = partial(FileSet._rename_physically, directory=directory)
+        if directory is None:
+            exchanged = FileExchange.swap(name1, name2, RenamePlan.swap_temp_name(), rename_function)
         else:
-            files_dict.update({index: [file_type]})
+            exchanged = directory.swap(name1, name2, RenamePlan.swap_temp_name(), rename_function)
+        if exchanged: # otherwise, the renames have been noted one by one
+            DirectorySnapshot.note_exchange(name1, name2, None if directory is None else directory.path)
+
+    @staticmethod
+    def _remove_staging_directory(directory=None):
+        """Remove the staging directory of temporary names within the given Directory (default: the working directory), unless it does not exist or still holds files (e.g. of another process)."""
+        try:
+            if directory is None:
+                rmdir(RenamePlan.STAGING_DIRECTORY)
+            else:
+                directory.remove_directory(RenamePlan.STAGING_DIRECTORY)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _file_exists(file_name, directory=None):
+        """Return whether the given file exists within the given Directory (default: the working directory). In batch mode, the pending renames of the current batch are taken into account."""
+        exists = FileSet._exists_in_batch(file_name, directory)
+        if exists is None:
+            return isfile(file_name) if directory is None else directory.is_file(file_name)
+        return exists
+
+    @staticmethod
+    def _name_taken(file_name, directory=None):
+        """Return whether the given name is taken by any entry of the given Directory (default: the working directory), e.g. a file that doesn't belong to a file set. In batch mode, the pending renames of the current batch are taken into account."""
+        exists = FileSet._exists_in_batch(file_name, directory)
+        if exists is None:
+            return lexists(file_name) if directory is None else directory.name_taken(file_name)
+        return exists
+
+    @staticmethod
+    def _exists_in_batch(file_name, directory=None):
+        """Return whether a file with the given name exists according to the pending renames of the current batch of the given Directory; None if the batch doesn't tell, or outside of batch mode."""
+        batch = FileSet._batch_of(directory)
+        if batch is not None:
+            if batch.holds(file_name):
+                return True
+            elif batch.renamed_away(file_name):
+                return False
+        return None
 
     def _add_file_logically(self, index, file_type):
         """
@@ -224,7 +527,7 @@ class FileSet():
         @param files_dict: The dictionary to which to add the file
         @param index: The index of the file
         """
-        FileSet._add_type_to_files_dict(self.files, index, file_type)
+        self.files.add_type(index, file_type)
         if index > self.max_index:
             self.max_index = index
 
@@ -237,16 +540,12 @@ class FileSet():
 
         @raise IndexUnassignedError: The given index was never assigned in the first place
         """
-        file_types_at_index = self.files.get(index, None)
-        if file_types_at_index is None:
+        if not index in self.files:
             raise FileSet.IndexUnassignedError(self, index, "The index '{}' is not assigned in the file set '{}'.".format(index, str(self)))
-        elif len(file_types_at_index) == 1:
-            self.files.pop(index) # remove entire index
-            if index == self.max_index:
-                self.max_index = self._find_max_index()
-        else:
-            file_types_at_index.remove(file_type) # only remove this type from index file_type list, since there are more types assigned
 
+        self.files.remove_type(index, file_type) # removes the entire index if this is its only file type
+        if index == self.max_index and not index in self.files:
+            self.max_index = self._find_max_index()
 
     def _get_name(self, index, file_type, pattern=None):
         if pattern is not None:
@@ -259,6 +558,17 @@ class FileSet():
         else:
             return "{}{}{}.{}".format(left_pattern, index, right_pattern, file_type)
 
+    def _get_path(self, index, file_type, directory):
+        """
+        Return the name of a file of the set as seen from the given Directory (None: the working directory).
+
+        @return: The file's name if the set is bound to the given directory, otherwise the absolute path of the file
+        """
+        file_name = self._get_name(index, file_type)
+        if directory is self.directory:
+            return file_name
+        return join(getcwd() if self.directory is None else self.directory.path, file_name)
+
     @staticmethod
     def _get_file_type(file_name):
         match = FileSet.type_regex.search(file_name)
@@ -272,8 +582,17 @@ class FileSet():
         """
         Make sure an index_range is ordered from lower to higher.
 
+        @param index_range: A 2-tuple of indexes or an IntervalSet consisting of a single run
+
+        @raise ValueError: An IntervalSet that doesn't consist of exactly one run is given
+
         @return: The ordered index_range
         """
+        if isinstance(index_range, IntervalSet):
+            if len(index_range.runs) != 1:
+                raise ValueError(index_range, "The indexes {} don't form a single range.".format(index_range))
+            return index_range.runs[0]
+
         range_left, range_right = index_range
 
         if range_right < range_left: index_range = (range_right, range_left)
@@ -339,7 +658,7 @@ class FileSet():
             old_name = self._get_name(old_index, file_type)
             new_name = self._get_name(new_index, file_type)
 
-            rename(old_name, new_name)
+            self._rename(old_name, new_name, self.directory)
 
         self.files.update({new_index: fitting_files_types})
         if new_index > self.max_index:
@@ -359,43 +678,166 @@ class FileSet():
         @param index_range: The index range to be moved
         @param new_start_pos: The index that the first file of the range is going to have after the operation.
 
-        @raise FileCollisionError: The range turns out to collide with another file
+        @raise FileCollisionError: The range turns out to collide with another file; no file has been moved
         """
         left_bound, right_bound = self._order_index_range(index_range)
         amount = new_start_pos - left_bound
+        if amount == 0:
+            return
 
-        change_log = []
-        try:
-            ## Check movement direction to avoid internal collisions
-            if amount > 0:
-                ## UP: move files from left to right
-                for i in range(right_bound, left_bound-1, -1):
-                    f = i
-                    t = i + amount
-                    try:
-                        self.change_index(f, t)
-                        change_log.append((f, t))
-                    except FileSet.IndexUnassignedError:
-                        pass
-            elif amount < 0:
-                ## DOWN: move files from right to left
-                for i in range(left_bound, right_bound+1, 1):
-                    f = i
-                    t = i + amount
-                    try:
-                        self.change_index(f, t)
-                        change_log.append((f, t))
-                    except FileSet.IndexUnassignedError:
-                        pass
-        except FileSet.IndexAssignedError as e:
-            ## Moved range collides with a file! Undo operations..
-            for action in reversed(change_log):
-                t, f = action
-                self.change_index(f, t)
-
-            from_idx = e.args[0]
-            to_idx = e.args[1]
-            raise FileSet.FileCollisionError(from_idx, to_idx, "The range can not be moved: the file with the index {} can not be moved since the index {} already exists.".format(from_idx, to_idx))
+        ## Check all collisions up front and move the range as a single RenamePlan, so no rename ever has to be undone.
+        ## Only the assigned indexes are visited, so gaps within the range don't cost anything
+        moved_indexes = self.files.indexes_in(left_bound, right_bound)
+        new_indexes = {index: index + amount for index in moved_indexes}
+        for index in (reversed(moved_indexes) if amount > 0 else moved_indexes):
+            if index + amount in self.files and not index + amount in new_indexes:
+                raise FileSet.FileCollisionError(index, index + amount, "The range can not be moved: the file with the index {} can not be moved since the index {} already exists.".format(index, index + amount))
+
+        self._rearrange(new_indexes)
+
+    def _make_space(self, left_bound, width):
+        """
+        Make sure that the given amount of indexes starting at left_bound is unassigned, so that files can be inserted there.
+
+        Only the files between the first assigned index of the needed space and the nearest gap which is wide enough to
+        absorb them are moved. If there is no such gap, the files are moved up to the end of the set.
+        Unassigned indexes within the needed space are used, so files are only moved as far as necessary.
+
+        @param left_bound: The first index of the needed space
+        @param width: The amount of indexes needed
+        """
+        first_assigned_index = self.files.min_index_in(left_bound, left_bound+width-1)
+        if first_assigned_index is None:
+            return # space is free already
+
+        amount = left_bound + width - first_assigned_index
+        absorbing_gap = self.files.next_gap(first_assigned_index, amount)
+        if absorbing_gap is None:
+            last_moved_index = self.max_index
+        else:
+            last_moved_index = absorbing_gap[0] - 1
+
+        self.move_range((first_assigned_index, last_moved_index), first_assigned_index+amount)
+
+    def _rearrange(self, new_indexes):
+        """
+        Move several indexes to new indexes at once, renaming every affected file exactly once.
+
+        The new indexes may be assigned currently, as long as their files are moved away within the same operation.
+        This allows shifting and rotating whole ranges without making space in between (see RenamePlan).
+        For multi-assigned indexes, all files are moved accordingly.
+
+        @param new_indexes: A dictionary mapping assigned indexes to their new indexes
+
+        @raise IndexAssignedError: A new index is assigned to a file that is not moved itself
+        """
+        new_indexes = {old_index: new_index for old_index, new_index in new_indexes.items() if old_index != new_index}
+
+        name_mapping = {}
+        for old_index, new_index in new_indexes.items():
+            if new_index in self.files and not new_index in new_indexes:
+                raise FileSet.IndexAssignedError(new_index, old_index, "The index {} is already assigned. Can't move file with index {} to it.".format(new_index, old_index))
+
+            for file_type in self.files[old_index]:
+                name_mapping[self._get_name(old_index, file_type)] = self._get_name(new_index, file_type)
+
+        self._rename_all(name_mapping, self.directory)
+
+        self.files.move_indexes(new_indexes)
+        self.max_index = self._find_max_index()
+
+    def _get_index_offsets(self, indexes, **kwargs):
+        """
+        Determine the position of every file that is about to be taken out of this FileSet, taking gap-handling options into account.
+
+        An IntervalSet is processed run by run (see _get_range_offsets), so the cost depends on the amount of runs and assigned indexes rather than the amount of indexes it covers.
+
+        @param indexes: An IntervalSet, or an iterable of indexes which's order is followed
+        Keyword arguments:
+        @param strip_gaps: If set to True, unassigned indexes are left out.
+        @param preserve_gaps: If set to True, unassigned indexes are kept as gaps, i.e. they take up a position as well.
+
+        @raise IndexUnassignedError: An index is unassigned and no gap-handling option has been chosen
+        @raise TypeError: The iterable does not just contain valid integers
+        @raise ConflictingOptionsError: An index is unassigned and both strip_gaps and preserve_gaps are set to True
+
+        @return: A 2-tuple consisting of the following:
+            - A dictionary mapping every assigned index to its position, in the given order
+            - The amount of positions (if preserve_gaps is chosen, gaps are included in this amount)
+        """
+        if isinstance(indexes, IntervalSet):
+            return self._get_range_offsets(indexes, **kwargs)
+
+        offsets = {}
+        position = 0
+        for index in indexes:
+            ## Check whether index is actually a valid integer
+            if not type(index) is int: raise TypeError(index, "'{}' is not a valid index.".format(index))
+
+            ## Check whether index is actually in this set. If not: if strict raise error, else skip it or keep its position as a gap
+            if index in self.files:
+                offsets[index] = position
+                position += 1
+            else:
+                strip_gaps = kwargs.get('strip_gaps', False)
+                preserve_gaps = kwargs.get('preserve_gaps', False)
+
+                if strip_gaps and preserve_gaps:
+                    raise FileSet.ConflictingOptionsError("Both strip_gaps and preserve_gaps were set to True, even though you have to decide for one.")
+
+                if preserve_gaps:
+                    position += 1
+                elif not strip_gaps:
+                    raise FileSet.IndexUnassignedError(index, "The index {} is unassigned.".format(index))
+
+        return offsets, position
+
+    def _get_range_offsets(self, index_range, **kwargs):
+        """
+        Determine the position of every file within an index range that is about to be moved as a whole, taking gap-handling options into account.
+
+        For an IntervalSet, the runs are lined up one after another; the integers in between them are not part of the range.
+
+        @param index_range: The ordered index range or an IntervalSet
+        Keyword Arguments:
+        @param strip_gaps: If set to True, the gaps within the range are removed, i.e. the files are positioned directly next to each other.
+        @param preserve_gaps: If set to True, the gaps within the range are preserved, i.e. the files keep their distance to each other.
+
+        @raise IndexUnassignedError: The range contains gaps and no gap-handling option has been chosen
+        @raise ConflictingOptionsError: The range contains gaps and both strip_gaps and preserve_gaps are set to True
+
+        @return: A 2-tuple consisting of the following:
+            - A dictionary mapping every assigned index of the range to its offset from the start of the moved range
+            - The width of the moved range (if strip_gaps is chosen, the gaps are not included in this width)
+        """
+        if isinstance(index_range, IntervalSet):
+            offsets = {}
+            width = 0
+            for run in index_range.runs:
+                run_offsets, run_width = self._get_range_offsets(run, **kwargs)
+                for index, offset in run_offsets.items():
+                    offsets[index] = width + offset
+                width += run_width
+            return offsets, width
+
+        left_bound, right_bound = index_range
+        range_width = right_bound - left_bound + 1
+        assigned_indexes = self.files.indexes_in(left_bound, right_bound)
+
+        if len(assigned_indexes) < range_width:
+            strip_gaps = kwargs.get('strip_gaps', False)
+            preserve_gaps = kwargs.get('preserve_gaps', False)
+
+            if strip_gaps and preserve_gaps:
+                raise FileSet.ConflictingOptionsError("Both strip_gaps and preserve_gaps were set to True, even though you have to decide for one.")
+            elif strip_gaps:
+                return {index: i for i, index in enumerate(assigned_indexes)}, len(assigned_indexes)
+            elif not preserve_gaps:
+                ## The first gap is where the assigned indexes stop being consecutive
+                gap_index = next((left_bound+i for i, index in enumerate(assigned_indexes) if index != left_bound+i), left_bound+len(assigned_indexes))
+                raise FileSet.IndexUnassignedError(gap_index, "The index {} is unassigned and thus can't be moved.".format(gap_index))
+
+        return {index: index-left_bound for index in assigned_indexes}, range_width
 
     #===========================================================================
     # High level / API Procedures
@@ -406,19 +848,104 @@ class FileSet():
 
         @param new_pattern: The new pattern to be used
         """
+        name_mapping = {}
         for index in self.files.keys():
             for file_type in self.files[index]:
                 old_name = self._get_name(index, file_type)
                 new_name = self._get_name(index, file_type, new_pattern)
 
-                rename(old_name, new_name) # change name physically
+                name_mapping[old_name] = new_name
+        self._rename_all(name_mapping, self.directory) # change names physically
 
         # update pattern after successful rename
         self.pattern = new_pattern
 
     def update(self):
-        """Re-read the files in the directory and update the files list. This is useful e.g. when another software has physically added or deleted files to/from the file set."""
-        self.files = self._find_files(self.fitting_file_regex)
+        """
+        Re-read the files in the directory and update the files list. This is useful e.g. when another software has physically added or deleted files to/from the file set.
+
+        The detected files are compared to the current files dictionary and only the differences are applied to it,
+        so its sorted indexes and flaw index are kept up to date instead of being rebuilt. Only if a large part of
+        the set has changed, the files dictionary is rebuilt as a whole.
+
+        @return: A 2-tuple consisting of the following:
+            - The list of files that have been added, as (index, file_type) 2-tuples ordered by their index
+            - The list of files that have been removed, as (index, file_type) 2-tuples ordered by their index
+        """
+        detected_files = {}
+        for index, file_type in self._match_files(self.fitting_file_regex, self._scan_file_names(self.directory)):
+            detected_file_types = detected_files.get(index)
+            if detected_file_types is None:
+                detected_files[index] = [file_type]
+            else:
+                detected_file_types.append(file_type)
+
+        added_files = []
+        removed_files = []
+        for index, detected_file_types in detected_files.items():
+            file_types = self.files.get(index, ())
+            if file_types != detected_file_types:
+                added_files.extend((index, file_type) for file_type in detected_file_types if not file_type in file_types)
+                removed_files.extend((index, file_type) for file_type in file_types if not file_type in detected_file_types)
+        for index, file_types in self.files.items():
+            if not index in detected_files:
+                removed_files.extend((index, file_type) for file_type in file_types)
+        added_files.sort()
+        removed_files.sort()
+
+        if (len(added_files) + len(removed_files)) * self.files.REBUILD_RATIO > len(self.files):
+            self.files = detected_files
+        else:
+            for index, file_type in removed_files:
+                self.files.remove_type(index, file_type)
+            for index, file_type in added_files:
+                self.files.add_type(index, file_type)
+        self.max_index = self._find_max_index()
+
+        return added_files, removed_files
+
+    def sync_files(self, file_names, file_exists=None):
+        """
+        Check whether the given files exist and add or remove them to/from the files dictionary accordingly.
+
+        This is the incremental counterpart of update: instead of re-reading the whole directory, only the given
+        files are checked, e.g. the ones a DirectoryWatcher has seen being created, deleted or renamed.
+        File names that don't fit the pattern of the set are ignored.
+
+        @param file_names: An iterable of the names of the files that might have changed
+        @param file_exists: A function returning whether the file of the given name exists (default: the file is looked up in the set's directory)
+
+        @return: A 2-tuple consisting of the following:
+            - The list of files that have been added, as (index, file_type) 2-tuples ordered by their index
+            - The list of files that have been removed, as (index, file_type) 2-tuples ordered by their index
+        """
+        if file_exists is None:
+            file_exists = partial(self._file_exists, directory=self.directory)
+
+        added_files = []
+        removed_files = []
+        for file_name in set(file_names):
+            match = self.fitting_file_regex.match(file_name)
+            if not match:
+                continue
+
+            index = int(match.group(1))
+            file_type = match.group(2)
+            if file_type is None:
+                file_type = ''
+
+            in_set = file_type in self.files.get(index, ())
+            if file_exists(file_name):
+                if not in_set:
+                    self._add_file_logically(index, file_type)
+                    added_files.append((index, file_type))
+            elif in_set:
+                self._remove_file_logically(index, file_type)
+                removed_files.append((index, file_type))
+        added_files.sort()
+        removed_files.sort()
+
+        return added_files, removed_files
 
     def file_in_set(self, file_name):
         """
@@ -441,11 +968,8 @@ class FileSet():
 
     def get_files_list(self):
         """Return the list of file names the set currently contains in adjacent order (multi-assigned indexes are ordered alphabetically)."""
-        indexes_list = list(self.files.keys())
-        indexes_list.sort()
-
         files_list = []
-        for index in indexes_list:
+        for index in self.files.sorted_indexes():
             file_types = self.files[index]
             file_types.sort()
             for file_type in file_types:
@@ -463,19 +987,18 @@ class FileSet():
 
         @raise FileNotFoundError: The given file name does not exist or is not a file
         """
-        if not isfile(new_file): raise FileNotFoundError(new_file, "The file '{}' does not exist or is not a file.".format(new_file))
+        if not self._file_exists(new_file, self.directory): raise FileNotFoundError(new_file, "The file '{}' does not exist or is not a file.".format(new_file))
 
         _, insert_index = self._check_and_order_spot(spot)
 
-        if (insert_index <= self.max_index) and (insert_index in self.files.keys()):
-            self.move_range((insert_index, self.max_index), insert_index+1)
-        elif insert_index > self.max_index:
+        self._make_space(insert_index, 1)
+        if insert_index > self.max_index:
             self.max_index = insert_index
 
         file_type = self._get_file_type(new_file)
 
         new_name = self._get_name(insert_index, file_type)
-        rename(new_file, new_name) # physically add file
+        self._rename(new_file, new_name, self.directory) # physically add file
 
         self.files.update({insert_index: [file_type]}) # logically add file
 
@@ -500,21 +1023,21 @@ class FileSet():
         ## Check whether files exist; raise error or remove them if applicable
         files_to_add = []
         for file in file_names:
-            if isfile(file):
+            if self._file_exists(file, self.directory):
                 files_to_add.append(file)
             elif ignore_unfound_files:
                 pass
             else:
                 raise FileSet.FileNotFoundError()
 
+        if len(files_to_add) == 0:
+            return
+
         _, new_pos = self._check_and_order_spot(spot)
 
-        if new_pos <= self.max_index:
-            ## Make space for addition into file set
-            self.move_range((new_pos, self.max_index), new_pos + len(files_to_add))
-        else:
-            ## Files are appended. Manually update max_index
-            self.max_index = new_pos + len(file_names)-1
+        ## Make space for addition into file set, only moving files up to the nearest fitting gap
+        self._make_space(new_pos, len(files_to_add))
+        self.max_index = max(self.max_index, new_pos + len(files_to_add)-1)
 
         ## Add physically and logically
         for i, file in enumerate(files_to_add):
@@ -522,7 +1045,7 @@ class FileSet():
             index = new_pos + i
             new_name = self._get_name(index, file_type)
 
-            rename(file, new_name) # add physically
+            self._rename(file, new_name, self.directory) # add physically
             self._add_file_logically(index, file_type) # add logically
 
 
@@ -543,7 +1066,7 @@ class FileSet():
 
         @param foreign_file_set: The FileSet object which's files are to be added to this FileSet
         @param spot: The spot at which the added sequence of files is going to start
-        @param add_indexes: An iterable of indexes of the foreign_file_set which shall be added. The order of them is being followed. (Default: 'ALL', the whole FileSet will be added)
+        @param add_indexes: An IntervalSet or an iterable of indexes of the foreign_file_set which shall be added. The order of an iterable is being followed. (Default: 'ALL', the whole FileSet will be added)
         Keyword arguments:
         @param strip_gaps: If set to True, all gaps within the given iterable will be removed during the operation, leaving only the existing files to be added; as opposed to raising an error when encountering them.
         @param preserve_gaps: If set to True, all gaps within the given iterable will be preserved by the operation; as opposed to raising an error when encountering them.
@@ -556,75 +1079,36 @@ class FileSet():
         """
         # TODO: allow list of file/path names
         if add_indexes == 'ALL':
-            add_indexes = [*foreign_file_set.files.keys()]
+            add_offsets = {index: i for i, index in enumerate(foreign_file_set.files.sorted_indexes())}
+            add_width = len(add_offsets)
         else:
-            ## Check index input for validity
-            given_add_indexes = list(add_indexes) # necessary since generators don't support item deletion
-            add_indexes = []
-
-            for i, index in enumerate(given_add_indexes):
-                ## Check whether index is actually a valid integer
-                if not type(index) is int: raise TypeError(index, "'{}' is not a valid index.".format(index))
-
-                ## Check whether index is actually in foreign_file_set. If not: if strict raise error, else just remove index from list
-                if not index in foreign_file_set.files:
-                    strip_gaps = kwargs.get('strip_gaps', False)
-                    preserve_gaps = kwargs.get('preserve_gaps', False)
-
-                    if strip_gaps and preserve_gaps:
-                        raise FileSet.ConflictingOptionsError("Both strip_gaps and preserve_gaps were set to True, even though you have to decide for one.")
-
-                    if strip_gaps:
-                        pass # skip this index altogether
-                    elif preserve_gaps:
-                        add_indexes.append(index) # add index to index list nevertheless. It will be recognized as a gap and skipped later on
-                    else:
-                        foreign_left_pattern, foreign_right_pattern = foreign_file_set.pattern
-                        raise FileSet.IndexUnassignedError(index, foreign_file_set, "The index {} is unassigned in the foreign FileSet {}{}{} and thus can't be added to this FileSet.".format(index, foreign_left_pattern, FileSet.INDEX_INDICATOR, foreign_right_pattern))
-                else:
-                    ## Index exists. Add to add_indexes list so it will be added later on
-                    add_indexes.append(index)
-
-        ## Find minimum index that is assigned in this insert domain. Required to check whether/where to move range to make space
+            try:
+                add_offsets, add_width = foreign_file_set._get_index_offsets(add_indexes, **kwargs)
+            except FileSet.IndexUnassignedError as e:
+                foreign_left_pattern, foreign_right_pattern = foreign_file_set.pattern
+                raise FileSet.IndexUnassignedError(e.args[0], foreign_file_set, "The index {} is unassigned in the foreign FileSet {}{}{} and thus can't be added to this FileSet.".format(e.args[0], foreign_left_pattern, FileSet.INDEX_INDICATOR, foreign_right_pattern))
+
+        ## Make space for the insert domain if necessary, only moving files up to the nearest fitting gap
         _, new_pos = self._check_and_order_spot(spot)
 
-        insert_domain_left = new_pos
-        insert_domain_right = new_pos+len(add_indexes)-1
-
-        min_assigned_index_in_insert_domain = None
-        for index in self.files:
-            if insert_domain_left <= index <= insert_domain_right:
-                if min_assigned_index_in_insert_domain is None or index < min_assigned_index_in_insert_domain:
-                    min_assigned_index_in_insert_domain = index
-
-        ## Move range if necessary
-        if not min_assigned_index_in_insert_domain is None:
-            self.move_range((min_assigned_index_in_insert_domain, self.max_index), insert_domain_right+1)
-        elif insert_domain_right > self.max_index:
-            # If move range isn't called to do the job, update index in case that will be necessary
-            self.max_index = insert_domain_right
-
-        ## Finally add the files
-        foreign_left_pattern, foreign_right_pattern = foreign_file_set.pattern
-        added_index_count = 0
-        for i, old_index in enumerate(add_indexes):
-            new_index = new_pos+i
-            file_types = foreign_file_set.files.get(old_index)
-            if file_types is None:
-                added_index_count += 1
-                pass
-            else:
-                for file_type in file_types[:]: # shallow copy to avoid issues with logical removal within loop
-                    old_name = "{}{}{}.{}".format(foreign_left_pattern, old_index, foreign_right_pattern, file_type)
-                    new_name = self._get_name(new_index, file_type)
+        self._make_space(new_pos, add_width)
+        self.max_index = max(self.max_index, new_pos+add_width-1)
 
-                    rename(old_name, new_name)
+        ## Finally add the files; physically all at once, then logically
+        added_files = []
+        name_mapping = {}
+        for old_index, offset in add_offsets.items():
+            new_index = new_pos+offset
+            for file_type in foreign_file_set.files[old_index]:
+                added_files.append((old_index, new_index, file_type))
+                name_mapping[foreign_file_set._get_path(old_index, file_type, self.directory)] = self._get_name(new_index, file_type)
+        self._rename_all(name_mapping, self.directory)
 
-                    self._add_file_logically(new_index, file_type)
-                    foreign_file_set._remove_file_logically(old_index, file_type)
-                added_index_count += 1
+        for old_index, new_index, file_type in added_files:
+            self._add_file_logically(new_index, file_type)
+            foreign_file_set._remove_file_logically(old_index, file_type)
 
-        return added_index_count
+        return add_width # gaps that have been preserved count as well
 
     def remove_file(self, index, removed_file_set=None):
         """
@@ -645,11 +1129,11 @@ class FileSet():
 
         if not index in self.files: raise FileSet.IndexUnassignedError(index, "The index {} does not exist within this FileSet".format(index))
 
-        if removed_file_set is None: removed_file_set = FileSet.files_detected(DEFAULT_REMOVE_PATTERN)
+        if removed_file_set is None: removed_file_set = FileSet.files_detected(DEFAULT_REMOVE_PATTERN, directory=self.directory)
 
         file_types = self.files[index]
         for i, file_type in enumerate(file_types):
-            file_name = self._get_name(index, file_type)
+            file_name = self._get_path(index, file_type, removed_file_set.directory)
 
             removed_file_set.add_file(file_name, removed_file_set.max_index + i + 1)
 
@@ -666,9 +1150,10 @@ class FileSet():
         """
         Remove files within a given index range from the FileSet. This is the preferred method for removing multiple files at once.
 
+        The removals and the renames compacting the remaining files are performed as a single RenamePlan, so every file is renamed at most once.
         The right order of files might not be preserved for multi-assigned indexes.
 
-        @param index_iterable: An iterable of indexes which shall be removed from the set.
+        @param index_iterable: An IntervalSet or an iterable of indexes which shall be removed from the set. The order of an iterable is being followed.
         @param removed_file_set: An optional FileSet object to append the removed files to (default: None)
         Keyword Arguments:
         @param strip_gaps: If set to True, all gaps within the given iterable will be removed during the operation, leaving only the existing files to be removed; as opposed to raising an error when encountering them.
@@ -686,23 +1171,46 @@ class FileSet():
         DEFAULT_REMOVE_PATTERN = ('removed', '')
 
         if removed_file_set is None:
-            removed_file_set = FileSet.files_detected(DEFAULT_REMOVE_PATTERN)
+            removed_file_set = FileSet.files_detected(DEFAULT_REMOVE_PATTERN, directory=self.directory)
 
         try:
-            removed_index_count = removed_file_set.add_file_set(self, (removed_file_set.max_index, removed_file_set.max_index+1), index_iterable, strip_gaps=kwargs.get('strip_gaps', False), preserve_gaps=kwargs.get('preserve_gaps', False))
+            remove_offsets, remove_width = self._get_index_offsets(index_iterable, strip_gaps=kwargs.get('strip_gaps', False), preserve_gaps=kwargs.get('preserve_gaps', False))
         except FileSet.IndexUnassignedError as e:
-            ## Add files won't change anything if it runs into this error, thus things are safe
+            ## Nothing has been changed at this point, thus things are safe
             raise FileSet.IndexUnassignedError(e.args[0], "The file with the index {} does not exist and thus can't be removed.".format(e.args[0]))
 
-        ## Files could have been removed from virtually anywhere. This file set might have become a swiss cheese. Fix all gaps now.
-        if not kwargs.get('keep_gaps_in_set', False):
-            still_existing_indexes = list(self.files.keys())
-            still_existing_indexes.sort()
-            for i in range(len(still_existing_indexes)):
-                current_existing_index = still_existing_indexes[i]
-                self.change_index(current_existing_index, i)
+        ## The removed files are appended to the removed_file_set in the given order
+        removed_set_start = removed_file_set.max_index + 1
+        removed_files = []
+        name_mapping = {}
+        for index, offset in remove_offsets.items():
+            for file_type in self.files[index]:
+                removed_files.append((removed_set_start+offset, file_type))
+                name_mapping[self._get_name(index, file_type)] = removed_file_set._get_path(removed_set_start+offset, file_type, self.directory)
+
+        ## Files could have been removed from virtually anywhere. Unless the gaps shall be kept, compact the remaining files in the same pass,
+        ## so the removals and the renames of the remaining files are performed as a single RenamePlan
+        keep_gaps_in_set = kwargs.get('keep_gaps_in_set', False)
+        remaining_files = {}
+        for index in self.files.sorted_indexes():
+            if index in remove_offsets:
+                continue
+
+            new_index = index if keep_gaps_in_set else len(remaining_files)
+            file_types = self.files[index]
+            if new_index != index:
+                for file_type in file_types:
+                    name_mapping[self._get_name(index, file_type)] = self._get_name(new_index, file_type)
+            remaining_files[new_index] = file_types
+
+        self._rename_all(name_mapping, self.directory)
+
+        for index, file_type in removed_files:
+            removed_file_set._add_file_logically(index, file_type)
+        self.files = remaining_files
+        self.max_index = self._find_max_index()
 
-        return removed_file_set, removed_index_count
+        return removed_file_set, remove_width # gaps that have been preserved count as well
 
     def move_file(self, current_index, spot, allow_gap=False):
         """
@@ -729,7 +1237,13 @@ class FileSet():
         To choose the spot at the very beginning of the set, simply use (-1, 0).
         If an index of the spot is actually covered by the range, no files will be moved, since that means that they are already in place. (e.g: range=(2, 4), spot=(3, 4))
 
-        @param index_range: The inclusive range of indexes which shall be moved to the new position
+        The move is performed as a rotation of the range and the files it is moved past, so every affected file is renamed exactly once
+        (plus one temporary rename per rotation cycle).
+
+        If an IntervalSet of several runs is given, its files are gathered at the spot, lined up in ascending order, while the files
+        in between them close up. In this case, the spot may lie in between the runs as well.
+
+        @param index_range: The inclusive range of indexes which shall be moved to the new position, or an IntervalSet
         @param spot: A tuple of two adjacent indexes to move the files in between
         Keyword Arguments:
         @param strip_gaps: If set to True, all gaps within the given index range will be removed during the operation, leaving only the existing files to be moved; as opposed to raising an error when encountering them.
@@ -739,52 +1253,50 @@ class FileSet():
         @raise IndexUnassignedError: The supplied index_range contains gaps and no gap-handling option has been chosen
         @raise ConflictingOptionsError: Both strip_gaps and preserve_gaps are set to True
         """
-        left_range, right_range = self._order_index_range(index_range)
+        if isinstance(index_range, IntervalSet):
+            index_set = index_range
+        else:
+            index_set = IntervalSet([index_range])
+        if not index_set:
+            return # nothing to move
+        left_range, right_range = index_set.bounds
         left_spot, right_spot = self._check_and_order_spot(spot)
 
         for i in [left_range, right_range, right_spot]:
             if i < 0: raise ValueError(i, "The index {} is negative, but this may only be possible for the left_spot.")
 
-        if left_spot in range(left_range, right_range+1) or right_spot in range(left_range, right_range+1):
+        if len(index_set.runs) == 1 and (left_spot in range(left_range, right_range+1) or right_spot in range(left_range, right_range+1)):
             ## If the left or the right spot are part of the given range, that means it already is in the right position
             ## and no movement operation is necessary. Thus terminate this method.
             return
 
-        tmp_set = FileSet.files_detected(('tmp', ''))
-
-        indexes_to_move = range(left_range, right_range+1)
-        tmp_insert_pos = tmp_set.max_index+1
-        removed_indexes_count = tmp_set.add_file_set(self, (tmp_insert_pos-1, tmp_insert_pos), indexes_to_move, strip_gaps=kwargs.get('strip_gaps', False), preserve_gaps=kwargs.get('preserve_gaps', False))
+        set_width = len(index_set)
+        block_offsets, block_width = self._get_range_offsets(index_set, **kwargs)
 
-        if right_range < left_spot:
-            ## MOVE UP
-            range_to_move = (right_range+1, left_spot)
-            to_position = left_range
-            self.move_range(range_to_move, to_position)
+        ## The move is a rotation of the block and the files it is moved past (including the files in between its runs):
+        ## the files below the spot move down by the amount of moved indexes below them, the files above the spot
+        ## follow the block. The files behind all of them are shifted as well in case gaps have been stripped from the block.
+        set_width_below_spot = index_set.count_below(right_spot)
+        block_start = right_spot - set_width_below_spot
 
-            readd_position = left_range + (left_spot - right_range) # add directly after range we just moved down to make space
-            self.add_file_set(tmp_set, (readd_position-1, readd_position), range(tmp_insert_pos, tmp_insert_pos+removed_indexes_count), preserve_gaps=True)
+        new_indexes = {index: block_start+offset for index, offset in block_offsets.items()}
 
-            ## Close resulting gap in case there were gaps in index_range; but only if NOT moving to the END of the set!
-            if right_spot <= self.max_index:
-                range_to_move = (right_spot, self.max_index)
-                to_position = readd_position + removed_indexes_count
-                self.move_range(range_to_move, to_position)
-
-        elif left_range > right_spot:
-            ## MOVE DOWN
-            range_to_move = (right_spot, left_range-1)
-            to_position = left_spot + removed_indexes_count + 1 # make resulting gap exactly fitting for re-add files
-            self.move_range(range_to_move, to_position)
+        moved_past_range = (min(left_range, right_spot), max(right_range, left_spot))
+        for index in self.files.indexes_in(*moved_past_range):
+            if index in block_offsets:
+                continue
+            set_width_below = index_set.count_below(index)
+            if index <= left_spot:
+                new_indexes[index] = index - set_width_below
+            else:
+                new_indexes[index] = block_start + block_width + (index - right_spot) - (set_width_below - set_width_below_spot)
 
-            readd_position = left_spot + 1 # add directly after left_spot
-            self.add_file_set(tmp_set, (readd_position-1, readd_position), range(tmp_insert_pos, tmp_insert_pos+removed_indexes_count), preserve_gaps=True)
+        tail_shift = block_width - set_width
+        if tail_shift != 0:
+            for index in self.files.indexes_in(moved_past_range[1]+1, self.max_index):
+                new_indexes[index] = index + tail_shift
 
-            ## Close resulting gap in case there were gaps in index_range; but only if NOT moving from the END of the set
-            if right_range < self.max_index:
-                range_to_move = (right_range + 1, self.max_index)
-                to_position = to_position + (left_range-1 - right_spot + 1)
-                self.move_range(range_to_move, to_position)
+        self._rearrange(new_indexes)
 
 
     def switch_files(self, index1, index2, allow_gaps=False):
@@ -806,8 +1318,10 @@ class FileSet():
         """
         Switch the positions of two file ranges. They do not have to be equal in size.
 
-        @param index_range1: The index range of the first sequence of files
-        @param index_range2: The index range of the second sequence of files
+        The final index of every affected file is computed up front, so every file is renamed exactly once (plus one temporary rename per rotation cycle).
+
+        @param index_range1: The index range of the first sequence of files, or an IntervalSet consisting of a single run
+        @param index_range2: The index range of the second sequence of files, or an IntervalSet consisting of a single run
         Keyword Arguments:
         @param strip_gaps: If set to True, all gaps within the given index ranges will be removed during the operation, leaving only the existing files to be switched; as opposed to raising an error when encountering them.
         @param preserve_gaps: If set to True, all gaps within the given index ranges will be preserved by the operation; as opposed to raising an error when encountering them.
@@ -815,158 +1329,60 @@ class FileSet():
         @raise ConflictingOptionsError: Both strip_gaps and preserve_gaps are set to True
         @raise OverlappingRangesError: The given index ranges are overlapping each other
         @raise IndexUnassignedError: The given index ranges contain gaps and no gap-handling option is chosen
+        @raise ValueError: An IntervalSet consisting of several runs is given
         """
-        strip_gaps = kwargs.get('strip_gaps', False)
-        preserve_gaps = kwargs.get('preserve_gaps', False)
-        original_max_index = self.max_index
-
         left_range1, right_range1 = self._order_index_range(index_range1)
         left_range2, right_range2 = self._order_index_range(index_range2)
 
         ## If the two ranges overlap, raise an error
-        if (left_range1 <= left_range2 <= right_range1) or (left_range2 <= right_range1 <= right_range2):
+        if left_range1 <= right_range2 and left_range2 <= right_range1:
             raise FileSet.OverlappingRangesError(index_range1, index_range2, "The ranges '{}' and '{}' are overlapping each other and thus can't be switched.".format(index_range1, index_range2))
 
-        range1 = (left_range1, right_range1)
-        range2 = (left_range2, right_range2)
-
-        ## Acquire information about the given ranges (which one is on the left, which one is greater)
         if left_range1 < left_range2:
-            leftmost_range = range1
-            rightmost_range = range2
-            in_between_range = (right_range1+1, left_range2-1)
+            leftmost_range = (left_range1, right_range1)
+            rightmost_range = (left_range2, right_range2)
         else:
-            leftmost_range = range2
-            rightmost_range = range1
-            in_between_range = (right_range2+1, left_range1-1)
-
-        left_in_between_range, right_in_between_range = in_between_range
-        in_between_range_width = right_in_between_range - left_in_between_range + 1
-        if left_in_between_range > right_in_between_range:
-            ## Invalid; this means there isn't actually any more indexes between the two given ranges
-            in_between_range = None
-
-        if (right_range1 - left_range1) > (right_range2 - left_range2):
-            greater_range = range1
-            smaller_range = range2
-        else:
-            greater_range = range2
-            smaller_range = range1
-
-        ## Perform action
-        tmp_set = FileSet.files_detected(('tmp', ''))
-
-        shift_files_range = range(greater_range[0], greater_range[1]+1)
-
-        tmp_set, amount_shifted = self.remove_files(shift_files_range, tmp_set, strip_gaps=strip_gaps, preserve_gaps=preserve_gaps, keep_gaps_in_set=True)
-        shifted_files_indexes_in_tmp_set = range(tmp_set.max_index-amount_shifted+1, tmp_set.max_index+1)
-
-        if greater_range is leftmost_range:
-            move_other_range_spot = (leftmost_range[0]-1, leftmost_range[0])
-            range_to_move = range(smaller_range[0], smaller_range[1]+1)
-            ## Actually, the files are only moved by the usage of this operation.
-            #  Using add_file_set is required instead of move_range in order to
-            #  ensure that possibly occurring gaps are correctly dealt with.
-            ## This "hack" of self-addition only works because there is free space
-            #  at the re-addition spot. Therefore, a call of move_range
-            #  to make space is not required and add-indexes aren't unknowingly changed.
-            moved_files_amount = self.add_file_set(self, move_other_range_spot, range_to_move, strip_gaps=strip_gaps, preserve_gaps=preserve_gaps)
-
-            next_unassigned_index = leftmost_range[0] + moved_files_amount
-
-            if in_between_range is not None:
-                self.move_range(in_between_range, next_unassigned_index)
-                next_unassigned_index += in_between_range_width
-
-            readd_spot = (next_unassigned_index-1, next_unassigned_index)
-            amount_readded = self.add_file_set(tmp_set, readd_spot, shifted_files_indexes_in_tmp_set)
-
-            ## Fix possible gap caused by possible gap stripping and/or update max_index
-            next_index = next_unassigned_index + amount_readded
-            if rightmost_range[1] >= original_max_index:
-                self.max_index = next_index - 1
-            elif next_index < rightmost_range[1]+1:
-                range_to_move = (rightmost_range[1]+1, self.max_index)
-                self.move_range(range_to_move, next_index)
-
-        elif greater_range is rightmost_range:
-            smaller_range_width = smaller_range[1] - smaller_range[0] + 1
-            if not (amount_shifted < smaller_range_width) or in_between_range is None:
-                if in_between_range is not None:
-                    to_position = leftmost_range[0] + amount_shifted # + amount of files which will actually be readded later on
-                    self.move_range(in_between_range, to_position)
-                    next_unassigned_index = to_position + in_between_range_width
-                else:
-                    next_unassigned_index = leftmost_range[0] + amount_shifted
-
-                move_other_range_spot = (next_unassigned_index-1, next_unassigned_index)
-                range_to_move = range(smaller_range[0], smaller_range[1]+1)
-                ## Actually, the files are only moved by the usage of this operation.
-                #  Using add_file_set is required instead of move_range in order to
-                #  ensure that possibly occurring gaps are correctly dealt with.
-                ## This "hack" of self-addition only works because there is free space
-                #  at the re-addition spot. Therefore, a call of move_range
-                #  to make space is not required and add-indexes aren't unknowingly changed.
-                moved_files_amount = self.add_file_set(self, move_other_range_spot, range_to_move, strip_gaps=strip_gaps, preserve_gaps=preserve_gaps)
-
-                readd_spot = (leftmost_range[0]-1, leftmost_range[0])
-                self.add_file_set(tmp_set, readd_spot, shifted_files_indexes_in_tmp_set)
-            else:
-                ## Special case. Actual temporarily removed bigger range is smaller than width of supposedly smaller range. (This may occur because of strip_gaps)
-                ## If there is an in_between_range, not handling this special case will lead to a range collision. Otherwise, the normal part of the algorithm will work.
-                range_to_shift = range(smaller_range[0], smaller_range[1]+1)
-                tmp_set, amount_shifted_smaller = self.remove_files(range_to_shift, tmp_set, strip_gaps=strip_gaps, preserve_gaps=preserve_gaps, keep_gaps_in_set=True)
-                shifted_files_smaller_indexes_in_tmp_set = range(tmp_set.max_index-amount_shifted_smaller+1, tmp_set.max_index+1)
-
-                ## Shift in between range
-                to_position = leftmost_range[0] + amount_shifted # + amount of files from expectedly greater range that will be readded later on
-                self.move_range(in_between_range, to_position)
-                next_unassigned_index = to_position + in_between_range_width
-
-                ## Readd both ranges
-                readd_spot = (leftmost_range[0]-1, leftmost_range[0])
-                self.add_file_set(tmp_set, readd_spot, shifted_files_indexes_in_tmp_set) # greater range
-                readd_spot = (next_unassigned_index-1, next_unassigned_index)
-                moved_files_amount = self.add_file_set(tmp_set, readd_spot, shifted_files_smaller_indexes_in_tmp_set) # smaller range
-
-            ## Fix possible gap caused by possible gap stripping and/or update max_index
-            next_index = next_unassigned_index + moved_files_amount
-            if rightmost_range[1] >= original_max_index:
-                self.max_index = next_index - 1
-            elif next_index < rightmost_range[1]+1:
-                range_to_move = (rightmost_range[1]+1, self.max_index)
-                self.move_range(range_to_move, next_index)
+            leftmost_range = (left_range2, right_range2)
+            rightmost_range = (left_range1, right_range1)
+
+        leftmost_offsets, leftmost_width = self._get_range_offsets(leftmost_range, **kwargs)
+        rightmost_offsets, rightmost_width = self._get_range_offsets(rightmost_range, **kwargs)
+
+        ## Compute the final index of every affected file: the rightmost range takes the place of the leftmost one,
+        ## followed by the files in between, the leftmost range and the files behind, which close possibly stripped gaps
+        new_indexes = {}
+        next_index = leftmost_range[0]
+
+        for index, offset in rightmost_offsets.items():
+            new_indexes[index] = next_index + offset
+        next_index += rightmost_width
+
+        in_between_shift = next_index - (leftmost_range[1]+1)
+        for index in self.files.indexes_in(leftmost_range[1]+1, rightmost_range[0]-1):
+            new_indexes[index] = index + in_between_shift
+        next_index += rightmost_range[0] - leftmost_range[1] - 1
+
+        for index, offset in leftmost_offsets.items():
+            new_indexes[index] = next_index + offset
+        next_index += leftmost_width
+
+        tail_shift = next_index - (rightmost_range[1]+1)
+        if tail_shift != 0:
+            for index in self.files.indexes_in(rightmost_range[1]+1, self.max_index):
+                new_indexes[index] = index + tail_shift
+
+        self._rearrange(new_indexes)
 
     def find_flaws(self):
         """
-        Scan the FileSet for gaps and multi_assigned indexes and return a tuple listing both of them in distinct lists.
+        Return a tuple listing the gaps and the multi_assigned indexes of the FileSet in distinct lists.
 
-        @raise TooManyFilesError: The max_index of the file set is greater than 1000.
+        The flaws are looked up in the flaw index the files dictionary maintains, so this costs only as much as there are flaws, regardless of the size of the set.
 
         @return: A 2-tuple containing the list of gap ranges and the list of multi_assigned_index 2-tuples, which in turn contain the index and the file types.
         """
-        if (self.max_index > 1000):
-            raise FileSet.TooManyFilesError(self, "The file set has a maximum index of {}. It would take too long to scan it for flaws.".format(self.max_index))
-
-        gap_list = []
-        multi_assigned_list = []
-        in_gap = False
-        for i in range(0, self.max_index+1): # scan all indexes in the set
-            file_types = self.files.get(i)
-
-            ## Gaps
-            if file_types is None:
-                if not in_gap:
-                    gap_left_bound = i
-                    in_gap = True
-            else:
-                if in_gap:
-                    gap_right_bound = i-1
-                    gap_list.append((gap_left_bound, gap_right_bound))
-                    in_gap = False
-
-                ## Multi-assigned indexes
-                if len(file_types) > 1: multi_assigned_list.append((i, file_types))
+        gap_list = self.files.gaps()
+        multi_assigned_list = [(index, self.files[index]) for index in self.files.multi_assigned_indexes()]
 
         return (gap_list, multi_assigned_list)
 
@@ -975,59 +1391,38 @@ class FileSet():
         Close gaps and optionally resolve multi-assigned indexes.
 
         Gaps within the FileSet (not assigned indexes) are closed automatically.
-        If preserve_multi_idx is True, multi-assigned indexes are resolved automatically and a change log regarding them will be returned.
-        If the file set contains more than 1000 files, it will still be attempted to close possible gaps. This may take very long if there really are many files in the set.
+        If fix_multi_idx is True, the files of every multi-assigned index are spread across consecutive indexes, ordered by file type.
 
-        @raise TooManyFilesError: The file set contains more than 1000 files and fix_multi_idx is set to True.
+        The final index of every file is computed in a single pass over the assigned indexes and all files are renamed as a single RenamePlan,
+        so every file is renamed at most once, regardless of the amount of gaps and multi-assigned indexes.
 
         @param fix_multi_idx: If False, the FileSet will only fix its gaps. If this is set to True, multi-assigned indexes will be resolved by alphabetical order (Default: False)
         """
-        try:
-            gap_list, multi_assigned_list = self.find_flaws()
-            flaw_detection_failed = False
-        except FileSet.TooManyFilesError:
-            flaw_detection_failed = True
-            gap_list = True
-            multi_assigned_list = []
-
-        ## Close all gaps
-        if gap_list:
-            existing_indexes = list(self.files.keys())
-            existing_indexes.sort()
-            for i in range(len(existing_indexes)):
-                current_existing_index = existing_indexes[i]
-                self.change_index(current_existing_index, i)
-
-                ## Update if it's a multi_assigned index for later use
-                for j in range(len(multi_assigned_list)):
-                    multi_idx, types = multi_assigned_list[j]
-                    if current_existing_index == multi_idx:
-                        multi_assigned_list[j] = (i, types)
-
-        ## Automatically fix multi-assigned indexes if specified
-        if fix_multi_idx:
-
-            if flaw_detection_failed:
-                if self.max_index > 1000:
-                    raise FileSet.TooManyFilesError(self, "Automatically fixing multi-assigned indexes is not supported for file sets with more than 1000 files. This set contains {} files.".format(self.max_index))
-                else:
-                    _, multi_assigned_list = self.find_flaws()
-
-            for index, file_types in reversed(multi_assigned_list): # reversed, so multi-assigned indexes don't change (iterate greater to lower)
-                ## Make space for the index expansion
-                if index != self.max_index:
-                    extra_required_space = len(file_types) - 1
-                    range_to_move = (index+1, self.max_index)
-                    to_position = index+1 + extra_required_space
-                    self.move_range(range_to_move, to_position)
-
-                ## Move the files to their new indexes based on type
-                file_types.sort()
-                file_types = file_types[:] # copy the list to prevent changes during runtime when indexes are changed
-                for i, file_type in enumerate(file_types):
-                    new_index = index + i
-
-                    self.change_index(index, new_index, file_type)
+        gap_list, multi_assigned_list = self.find_flaws()
+        if not gap_list and not (fix_multi_idx and multi_assigned_list):
+            return # nothing to fix
+
+        name_mapping = {}
+        fixed_files = {}
+        next_index = 0
+        for index in list(self.files.sorted_indexes()):
+            file_types = self.files[index]
+            if fix_multi_idx and len(file_types) > 1:
+                file_type_groups = [[file_type] for file_type in sorted(file_types)]
+            else:
+                file_type_groups = [file_types]
+
+            for file_type_group in file_type_groups:
+                if next_index != index:
+                    for file_type in file_type_group:
+                        name_mapping[self._get_name(index, file_type)] = self._get_name(next_index, file_type)
+                fixed_files[next_index] = list(file_type_group)
+                next_index += 1
+
+        self._rename_all(name_mapping, self.directory)
+
+        self.files = fixed_files
+        self.max_index = next_index - 1
 
 
     def __add__(self, other):
@@ -0,0 +1,235 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from array import array
+import json
+from os import listdir, makedirs, scandir, stat
+from os.path import abspath, dirname, expanduser, join
+import sqlite3
+import time
+
+from FileNameCompiler import FileNameCompiler
+from FileSet import FileSet
+from FilesDict import CompactFilesDict
+
+
+class FileSetCatalog():
+    """
+    A persistent catalog of the file sets detected within directories, stored in an SQLite database.
+
+    For every directory, the catalog stores the compiled files of every detected file set, the names of all files,
+    and the modification time and entry count of the directory at the time it was scanned. As long as the directory
+    has not changed, its file sets are loaded from the catalog without scanning it at all. Otherwise, the directory is
+    scanned and only the files that have been added or removed since are detected; only the file sets they belong to
+    are written back to the catalog.
+
+    A directory that was modified shortly before it was scanned might be modified again within the same tick of its
+    modification time. For such racy directories, the amount of entries is compared as well before trusting the catalog.
+    Once the modification time is old enough to be trusted, a racy directory is scanned one more time, so that
+    later detections don't need to list the directory anymore.
+
+    The catalog must not be stored within a cataloged directory, since every write would change the directory.
+    """
+    DEFAULT_PATH = join(expanduser('~'), '.cache', 'file_set_manager', 'catalog.sqlite')
+    RACY_INTERVAL = 2 * 10**9 # nanoseconds
+    FULL_DETECTION_RATIO = 4 # detect all files again if more than 1/FULL_DETECTION_RATIO of them have changed
+
+    def __init__(self, catalog_path=None):
+        """
+        Open the catalog at the given path, creating it if it does not exist yet.
+
+        @param catalog_path: The path of the catalog's database file (default: DEFAULT_PATH)
+        """
+        if catalog_path is None:
+            catalog_path = self.DEFAULT_PATH
+        if catalog_path != ':memory:':
+            makedirs(dirname(abspath(catalog_path)), exist_ok=True)
+
+        self.catalog_path = catalog_path
+        self._connection = sqlite3.connect(catalog_path)
+        with self._connection:
+            self._connection.execute("""CREATE TABLE IF NOT EXISTS directories (
+                    path TEXT PRIMARY KEY, mtime_ns INTEGER, entry_count INTEGER, scanned_at_ns INTEGER, file_names BLOB)""")
+            self._connection.execute("""CREATE TABLE IF NOT EXISTS file_sets (
+                    directory TEXT, left_pattern TEXT, right_pattern TEXT, indexes BLOB, type_ids BLOB, type_names TEXT, multi_types TEXT,
+                    PRIMARY KEY (directory, left_pattern, right_pattern))""")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __repr__(self):
+        return "FileSetCatalog({!r})".format(self.catalog_path)
+
+    def close(self):
+        """Close the catalog's database connection."""
+        self._connection.close()
+
+    #===========================================================================
+    # Detection
+    #===========================================================================
+
+    def detect_file_sets(self, directory, scandir_function=scandir):
+        """
+        Return the file sets within the given directory, loading them from the catalog if the directory has not changed since it was last scanned.
+
+        The files of the returned FileSets are stored in CompactFilesDicts, the format they are cataloged in.
+
+        @param directory: The path of the directory
+        @param scandir_function: The function used to list the directory's entries if it has to be scanned (default: os.scandir)
+
+        @return: A list of FileSet objects
+        """
+        file_sets = self.get_files(directory, scandir_function)
+
+        return [FileSet(pattern, files, file_list_compiled=True, compact_files=True) for pattern, files in file_sets.items()]
+
+    def get_files(self, directory, scandir_function=scandir):
+        """
+        Return the compiled files of the file sets within the given directory, loading them from the catalog if the directory has not changed since it was last scanned.
+
+        @param directory: The path of the directory
+        @param scandir_function: The function used to list the directory's entries if it has to be scanned (default: os.scandir)
+
+        @return: A dictionary mapping the pattern of every file set to its files as a CompactFilesDict
+        """
+        directory = abspath(directory)
+        mtime = stat(directory).st_mtime_ns
+
+        row = self._connection.execute("SELECT mtime_ns, entry_count, scanned_at_ns FROM directories WHERE path = ?", (directory,)).fetchone()
+        if row is not None:
+            cataloged_mtime, cataloged_entry_count, scanned_at = row
+            if mtime == cataloged_mtime:
+                if mtime < scanned_at - self.RACY_INTERVAL:
+                    return self._load_file_sets(directory)
+                elif len(listdir(directory)) == cataloged_entry_count and mtime >= time.time_ns() - self.RACY_INTERVAL:
+                    return self._load_file_sets(directory)
+                ## Otherwise, the directory is scanned again. Once the modification time is old enough, this settles the racy entry for good
+
+        return self._refresh(directory, mtime, row is not None, scandir_function)
+
+    def forget(self, directory):
+        """Remove the given directory from the catalog."""
+        directory = abspath(directory)
+        with self._connection:
+            self._connection.execute("DELETE FROM directories WHERE path = ?", (directory,))
+            self._connection.execute("DELETE FROM file_sets WHERE directory = ?", (directory,))
+
+    #===========================================================================
+    # Internal Procedures
+    #===========================================================================
+
+    def _refresh(self, directory, mtime, is_cataloged, scandir_function):
+        """
+        Scan the directory and update its catalog entry, detecting only the files that have changed if it has been cataloged before.
+
+        @param directory: The absolute path of the directory
+        @param mtime: The modification time of the directory before scanning it
+        @param is_cataloged: Whether the directory has been cataloged before
+
+        @return: A dictionary mapping the pattern of every file set to its files as a CompactFilesDict
+        """
+        scanned_at = time.time_ns()
+        entry_count = 0
+        file_names = []
+        for entry in scandir_function(directory):
+            entry_count += 1
+            if entry.is_file():
+                file_names.append(entry.name)
+
+        added_file_names = removed_file_names = None
+        if is_cataloged:
+            cataloged_file_names = self._load_file_names(directory)
+            current_file_names = set(file_names)
+            added_file_names = [file_name for file_name in file_names if not file_name in cataloged_file_names]
+            removed_file_names = [file_name for file_name in cataloged_file_names if not file_name in current_file_names]
+
+        with self._connection:
+            if is_cataloged and (len(added_file_names) + len(removed_file_names)) * self.FULL_DETECTION_RATIO <= len(file_names):
+                ## Incremental: only detect the changed files and write back the file sets they belong to
+                file_sets = self._load_file_sets(directory)
+                for pattern in self._apply_changes(file_sets, added_file_names, removed_file_names):
+                    self._store_file_set(directory, pattern, file_sets.get(pattern))
+            else:
+                file_sets = {pattern: CompactFilesDict(files) for pattern, files in FileNameCompiler.compile_file_names(file_names).items()}
+                self._connection.execute("DELETE FROM file_sets WHERE directory = ?", (directory,))
+                for pattern, files in file_sets.items():
+                    self._store_file_set(directory, pattern, files)
+
+            self._connection.execute("INSERT OR REPLACE INTO directories VALUES (?, ?, ?, ?, ?)",
+                                     (directory, mtime, entry_count, scanned_at, '\0'.join(file_names).encode('utf-8', 'surrogateescape')))
+
+        return file_sets
+
+    def _apply_changes(self, file_sets, added_file_names, removed_file_names):
+        """
+        Remove and add the given files from and to the compiled file sets.
+
+        @param file_sets: A dictionary mapping patterns to CompactFilesDicts, which is modified in place
+        @param added_file_names: The names of the files that have been added to the directory
+        @param removed_file_names: The names of the files that have been removed from the directory
+
+        @return: The set of patterns which's files have changed
+        """
+        removed_files = FileNameCompiler.compile_file_names(removed_file_names)
+        for pattern, files in removed_files.items():
+            files_dict = file_sets[pattern]
+            for index, file_types in files.items():
+                for file_type in file_types:
+                    files_dict.remove_type(index, file_type)
+            if len(files_dict) == 0:
+                del file_sets[pattern]
+        changed_patterns = set(removed_files)
+
+        for pattern, files in FileNameCompiler.compile_file_names(added_file_names).items():
+            files_dict = file_sets.get(pattern)
+            if files_dict is None:
+                file_sets[pattern] = CompactFilesDict(files)
+            else:
+                for index, file_types in files.items():
+                    for file_type in file_types:
+                        files_dict.add_type(index, file_type)
+            changed_patterns.add(pattern)
+
+        return changed_patterns
+
+    def _load_file_names(self, directory):
+        """Return the set of file names the directory contained when it was last scanned."""
+        file_names_blob, = self._connection.execute("SELECT file_names FROM directories WHERE path = ?", (directory,)).fetchone()
+        if not file_names_blob:
+            return set()
+
+        return set(file_names_blob.decode('utf-8', 'surrogateescape').split('\0'))
+
+    def _load_file_sets(self, directory):
+        """Return the cataloged file sets of the directory as a dictionary mapping every pattern to a CompactFilesDict."""
+        file_sets = {}
+        rows = self._connection.execute("SELECT left_pattern, right_pattern, indexes, type_ids, type_names, multi_types FROM file_sets WHERE directory = ?", (directory,))
+        for left_pattern, right_pattern, indexes_blob, type_ids_blob, type_names, multi_types in rows:
+            sorted_indexes = array('q')
+            sorted_indexes.frombytes(indexes_blob)
+            type_ids = array('I')
+            type_ids.frombytes(type_ids_blob)
+            multi_types = {int(index): file_types for index, file_types in json.loads(multi_types).items()}
+
+            file_sets[left_pattern, right_pattern] = CompactFilesDict.from_arrays(sorted_indexes, type_ids, json.loads(type_names), multi_types)
+
+        return file_sets
+
+    def _store_file_set(self, directory, pattern, files_dict):
+        """Write the given file set to the catalog, or remove it from the catalog if files_dict is None."""
+        left_pattern, right_pattern = pattern
+        if files_dict is None:
+            self._connection.execute("DELETE FROM file_sets WHERE directory = ? AND left_pattern = ? AND right_pattern = ?", (directory, left_pattern, right_pattern))
+            return
+
+        if not isinstance(files_dict, CompactFilesDict):
+            files_dict = CompactFilesDict(files_dict)
+        sorted_indexes, type_ids, type_names, multi_types = files_dict.to_arrays()
+
+        self._connection.execute("INSERT OR REPLACE INTO file_sets VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                 (directory, left_pattern, right_pattern, sorted_indexes.tobytes(), type_ids.tobytes(), json.dumps(type_names), json.dumps(multi_types)))
@@ -0,0 +1,543 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping, MutableMapping
+from itertools import islice
+from sys import getsizeof
+
+
+class _IndexedFiles():
+    """
+    Mixin maintaining the sorted indexes and the flaw index of a files dictionary.
+
+    The assigned indexes are kept in the sorted sequence _sorted_indexes. This allows answering
+    the typical questions of a FileSet (highest assigned index, lowest assigned index within a range, ordered
+    iteration) in logarithmic instead of linear time, which matters for file sets with hundred-thousands of files.
+
+    The flaws of the set are indexed as well: the gaps are stored as intervals and the multi-assigned indexes in
+    a sorted list. Both are updated along with every modification, so querying them only costs as much as there
+    are flaws, regardless of the size of the set.
+    """
+    REBUILD_RATIO = 16 # rebuild instead of moving index by index if more than 1/REBUILD_RATIO of the indexes are moved
+
+    def _init_flaw_index(self):
+        """Build the gap and multi-assigned index from the current _sorted_indexes."""
+        self._gap_lefts = [] # sorted left bounds of all gaps
+        self._gap_rights = {} # left bound -> right bound of every gap
+        previous_index = -1
+        for index in self._sorted_indexes:
+            if index > previous_index+1:
+                self._add_gap(previous_index+1, index-1)
+            previous_index = index
+
+        self._multi_assigned_indexes = self._find_multi_assigned_indexes()
+
+    def _find_multi_assigned_indexes(self):
+        """Return the sorted list of indexes that are assigned to more than one file by looking at every index."""
+        return [index for index in self._sorted_indexes if len(self[index]) > 1]
+
+    #===========================================================================
+    # Internal index maintenance
+    #===========================================================================
+
+    def _register_index(self, index):
+        """
+        Split the gap a newly assigned index is assigned in.
+
+        @return: The position at which the index has to be inserted into the sorted indexes
+        """
+        position = bisect_left(self._sorted_indexes, index)
+        if position > 0:
+            previous_index = self._sorted_indexes[position-1]
+        else:
+            previous_index = -1
+
+        if position < len(self._sorted_indexes):
+            ## The index lies within the set, thus within a gap
+            next_index = self._sorted_indexes[position]
+            self._remove_gap(previous_index+1)
+            if next_index > index+1:
+                self._add_gap(index+1, next_index-1)
+        if index > previous_index+1:
+            self._add_gap(previous_index+1, index-1)
+
+        return position
+
+    def _unregister_index(self, position):
+        """Merge the gaps around the index at the given position, which is not assigned anymore, and remove it from the sorted indexes."""
+        index = self._sorted_indexes[position]
+        del self._sorted_indexes[position]
+
+        if position > 0:
+            previous_index = self._sorted_indexes[position-1]
+        else:
+            previous_index = -1
+
+        if index > previous_index+1:
+            self._remove_gap(previous_index+1)
+        if position < len(self._sorted_indexes):
+            next_index = self._sorted_indexes[position]
+            if next_index > index+1:
+                self._remove_gap(index+1)
+            self._add_gap(previous_index+1, next_index-1)
+        ## If the highest index was removed, the gap below it simply vanishes, since it is now outside of the set
+
+        self._update_multi_assigned(index, 0)
+
+    def _add_gap(self, left_bound, right_bound):
+        insort(self._gap_lefts, left_bound)
+        self._gap_rights[left_bound] = right_bound
+
+    def _remove_gap(self, left_bound):
+        del self._gap_rights[left_bound]
+        del self._gap_lefts[bisect_left(self._gap_lefts, left_bound)]
+
+    def _update_multi_assigned(self, index, type_count):
+        """Add the index to or remove it from the multi-assigned indexes depending on its current amount of file types."""
+        position = bisect_left(self._multi_assigned_indexes, index)
+        is_listed = position < len(self._multi_assigned_indexes) and self._multi_assigned_indexes[position] == index
+
+        if type_count > 1:
+            if not is_listed:
+                self._multi_assigned_indexes.insert(position, index)
+        elif is_listed:
+            del self._multi_assigned_indexes[position]
+
+    #===========================================================================
+    # Bulk modification
+    #===========================================================================
+
+    def move_indexes(self, new_indexes):
+        """
+        Move the file types of several indexes to new indexes at once.
+
+        Moving many indexes one by one would cost a shift of the sorted indexes per index. Thus, if a considerable
+        part of the dictionary is moved, it is rebuilt as a whole instead.
+
+        @param new_indexes: A dictionary mapping assigned indexes to their new indexes. The new indexes must be unique and
+                            may only be assigned already if their files are moved away as well.
+        """
+        moved_files = [(new_index, self[old_index]) for old_index, new_index in new_indexes.items()]
+
+        if len(new_indexes) * self.REBUILD_RATIO > len(self):
+            files = [(index, self[index]) for index in self._sorted_indexes if not index in new_indexes]
+            files.extend(moved_files)
+            self._rebuild(files)
+        else:
+            for old_index in new_indexes:
+                del self[old_index]
+            for new_index, file_types in moved_files:
+                self[new_index] = file_types
+
+    #===========================================================================
+    # Index queries
+    #===========================================================================
+
+    def max_index(self):
+        """
+        Return the highest assigned index.
+
+        @return: The highest index. If the dictionary is empty, -1 is returned.
+        """
+        if self._sorted_indexes:
+            return self._sorted_indexes[-1]
+        else:
+            return -1
+
+    def min_index_in(self, left_bound, right_bound):
+        """
+        Return the lowest assigned index within the given inclusive range.
+
+        @param left_bound: The lower bound of the range
+        @param right_bound: The upper bound of the range
+
+        @return: The lowest assigned index in the range; None if no index within the range is assigned
+        """
+        position = bisect_left(self._sorted_indexes, left_bound)
+        if position < len(self._sorted_indexes) and self._sorted_indexes[position] <= right_bound:
+            return self._sorted_indexes[position]
+        else:
+            return None
+
+    def indexes_in(self, left_bound, right_bound):
+        """Return the sorted list of assigned indexes within the given inclusive range."""
+        left_position = bisect_left(self._sorted_indexes, left_bound)
+        right_position = bisect_right(self._sorted_indexes, right_bound)
+
+        return list(self._sorted_indexes[left_position:right_position])
+
+    def sorted_indexes(self):
+        """Return an iterator over all assigned indexes in ascending order."""
+        return iter(self._sorted_indexes)
+
+    def next_gap(self, start_index, min_width=1):
+        """
+        Return the first gap at or above the given index that is at least min_width indexes wide.
+
+        A gap reaching below start_index only counts with its part at or above start_index.
+        Only the gaps up to the one that is found are looked at.
+
+        @param start_index: The lowest index the gap may cover
+        @param min_width: The minimal amount of unassigned indexes the gap has to consist of (default: 1)
+
+        @return: The gap as an ordered inclusive 2-tuple; None if there is no such gap below the highest index
+        """
+        position = max(bisect_right(self._gap_lefts, start_index)-1, 0) # the gap to the left might still reach up to start_index
+
+        for left_bound in islice(self._gap_lefts, position, None):
+            right_bound = self._gap_rights[left_bound]
+            left_bound = max(left_bound, start_index)
+            if right_bound - left_bound + 1 >= min_width:
+                return (left_bound, right_bound)
+
+        return None
+
+    def gaps(self):
+        """Return the list of gaps, i.e. unassigned index ranges below the highest index, as ordered inclusive 2-tuples."""
+        return [(left_bound, self._gap_rights[left_bound]) for left_bound in self._gap_lefts]
+
+    def multi_assigned_indexes(self):
+        """Return the sorted list of indexes that are assigned to more than one file."""
+        return self._multi_assigned_indexes[:]
+
+    def _index_sizeof(self):
+        """Return the memory used by the sorted indexes and the flaw index in bytes, not counting the index integers themselves."""
+        return getsizeof(self._sorted_indexes) + getsizeof(self._gap_lefts) + getsizeof(self._gap_rights) + getsizeof(self._multi_assigned_indexes)
+
+
+class FilesDict(_IndexedFiles, dict):
+    """
+    The files dictionary of a FileSet, mapping every assigned index to the list of file types assigned to it.
+
+    In addition to the plain dictionary, the assigned indexes are kept sorted and the flaws are indexed (see _IndexedFiles).
+
+    All of the dictionary's modifying methods keep these structures up to date, so the object can be used just like
+    a plain dict. Read access is not affected at all.
+    The file type lists must not be modified in place, though, since this would bypass the index of multi-assigned
+    indexes. Use add_type and remove_type instead, or re-assign the list.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sorted_indexes = sorted(dict.keys(self))
+        self._init_flaw_index()
+
+    def _rebuild(self, files):
+        """Replace the whole content with the given (index, file_types) 2-tuples."""
+        dict.clear(self)
+        self.__init__(files)
+
+    @classmethod
+    def from_files(cls, files):
+        """
+        Create a files dictionary from an iterable of files.
+
+        @param files: An iterable of (index, file_type) 2-tuples
+
+        @return: The new files dictionary
+        """
+        files_dict = {}
+        for index, file_type in files:
+            file_types = files_dict.get(index)
+            if file_types is None:
+                files_dict[index] = [file_type]
+            else:
+                file_types.append(file_type)
+
+        return cls(files_dict)
+
+    def __reduce__(self):
+        """Pickle and copy the dictionary by its content, so the sorted index list is rebuilt instead of being mixed up."""
+        return (self.__class__, (dict(self),))
+
+    def __sizeof__(self):
+        """Estimate the memory used by the dictionary, including its file type lists and indexes (see sys.getsizeof)."""
+        return dict.__sizeof__(self) + sum(getsizeof(file_types) for file_types in dict.values(self)) + self._index_sizeof()
+
+    #===========================================================================
+    # Modifying dictionary methods
+    #===========================================================================
+
+    def __setitem__(self, index, file_types):
+        if not index in self:
+            self._sorted_indexes.insert(self._register_index(index), index)
+        super().__setitem__(index, file_types)
+        self._update_multi_assigned(index, len(file_types))
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._unregister_index(bisect_left(self._sorted_indexes, index))
+
+    def pop(self, index, *default):
+        if index in self:
+            file_types = self[index]
+            del self[index]
+            return file_types
+        else:
+            return super().pop(index, *default)
+
+    def popitem(self):
+        index, file_types = super().popitem()
+        self._unregister_index(bisect_left(self._sorted_indexes, index))
+        return index, file_types
+
+    def setdefault(self, index, default=None):
+        if not index in self:
+            self[index] = default
+        return self[index]
+
+    def update(self, *args, **kwargs):
+        for index, file_types in dict(*args, **kwargs).items():
+            self[index] = file_types
+
+    def clear(self):
+        super().clear()
+        self._sorted_indexes = []
+        self._init_flaw_index()
+
+    def copy(self):
+        return self.__class__(self)
+
+    def add_type(self, index, file_type):
+        """Add a file specified by its index and file type, updating the index of multi-assigned indexes."""
+        file_types = self.get(index)
+        if file_types is None:
+            self[index] = [file_type]
+        else:
+            file_types.append(file_type)
+            self._update_multi_assigned(index, len(file_types))
+
+    def remove_type(self, index, file_type):
+        """
+        Remove a file specified by its index and file type. If it is the last file at this index, the entire index is removed.
+
+        @raise KeyError: The given index is not assigned
+        @raise ValueError: The given file type is not assigned at the index
+        """
+        file_types = self[index]
+        if len(file_types) == 1 and file_types[0] == file_type:
+            del self[index]
+        else:
+            file_types.remove(file_type)
+            self._update_multi_assigned(index, len(file_types))
+
+
+class CompactFilesDict(_IndexedFiles, MutableMapping):
+    """
+    A memory-saving alternative to the FilesDict for file sets of millions of files, offering the same interface.
+
+    Instead of a dictionary entry and a list of file type strings per index, the files are stored in two parallel
+    typed arrays: the sorted indexes and the ID of their file type. Every file type string is interned once in a
+    table of file types. This is the fast path for the usual single-assigned index and costs about a dozen bytes per file.
+    Multi-assigned indexes are marked with MULTI_TYPE_ID and store their file types list in a separate dictionary.
+
+    The file type lists returned by this dictionary are always copies. Use add_type and remove_type, or re-assign
+    the list to modify the file types of an index.
+    """
+    MULTI_TYPE_ID = 0xFFFFFFFF
+
+    def __init__(self, files_dict=None):
+        self._sorted_indexes = array('q')
+        self._type_ids = array('I')
+        self._multi_types = {}
+        self._type_names = []
+        self._type_ids_by_name = {}
+
+        if files_dict:
+            if isinstance(files_dict, Mapping):
+                files_dict = files_dict.items()
+            for index, file_types in sorted(files_dict):
+                self._sorted_indexes.append(index)
+                self._type_ids.append(self._get_type_id(index, file_types))
+
+        self._init_flaw_index()
+
+    @classmethod
+    def from_files(cls, files):
+        """
+        Create a compact files dictionary from an iterable of files without building an intermediate dictionary.
+
+        @param files: An iterable of (index, file_type) 2-tuples
+
+        @return: The new files dictionary
+        """
+        new_dict = cls()
+
+        ## Collect the files in scan order first and sort them afterwards; inserting into the arrays one by one would be quadratic
+        indexes = array('q')
+        type_ids = array('I')
+        for index, file_type in files:
+            indexes.append(index)
+            type_ids.append(new_dict._intern_type(file_type))
+
+        order = sorted(range(len(indexes)), key=indexes.__getitem__)
+        for position in order:
+            index = indexes[position]
+            type_name = new_dict._type_names[type_ids[position]]
+            if new_dict._sorted_indexes and new_dict._sorted_indexes[-1] == index:
+                ## Another file type of the previous index; turn it into a multi-assigned index
+                if new_dict._type_ids[-1] == cls.MULTI_TYPE_ID:
+                    new_dict._multi_types[index].append(type_name)
+                else:
+                    new_dict._multi_types[index] = [new_dict._type_names[new_dict._type_ids[-1]], type_name]
+                    new_dict._type_ids[-1] = cls.MULTI_TYPE_ID
+            else:
+                new_dict._sorted_indexes.append(index)
+                new_dict._type_ids.append(type_ids[position])
+
+        new_dict._init_flaw_index()
+        return new_dict
+
+    @classmethod
+    def from_arrays(cls, sorted_indexes, type_ids, type_names, multi_types):
+        """
+        Create a compact files dictionary directly from its internal representation, as returned by to_arrays.
+
+        @param sorted_indexes: An array('q') of the assigned indexes in ascending order
+        @param type_ids: An array('I') of the type ID of every index; MULTI_TYPE_ID for multi-assigned indexes
+        @param type_names: The list of file types, whereas the position of every file type is its type ID
+        @param multi_types: A dictionary mapping every multi-assigned index to its list of file types
+
+        @return: The new files dictionary
+        """
+        new_dict = cls.__new__(cls)
+        new_dict._sorted_indexes = sorted_indexes
+        new_dict._type_ids = type_ids
+        new_dict._multi_types = multi_types
+        new_dict._type_names = type_names
+        new_dict._type_ids_by_name = {type_name: type_id for type_id, type_name in enumerate(type_names)}
+
+        new_dict._init_flaw_index()
+        return new_dict
+
+    def to_arrays(self):
+        """
+        Return the internal representation of the dictionary, which can be stored efficiently and turned back into a dictionary by from_arrays.
+
+        @return: A 4-tuple of the sorted indexes, the type IDs, the file types and the multi-assigned indexes' file types. They must not be modified.
+        """
+        return self._sorted_indexes, self._type_ids, self._type_names, self._multi_types
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __sizeof__(self):
+        """Estimate the memory used by the dictionary, including its arrays, file types and indexes (see sys.getsizeof)."""
+        multi_types_size = getsizeof(self._multi_types) + sum(getsizeof(file_types) for file_types in self._multi_types.values())
+        type_names_size = getsizeof(self._type_names) + getsizeof(self._type_ids_by_name)
+        return object.__sizeof__(self) + getsizeof(self._type_ids) + multi_types_size + type_names_size + self._index_sizeof()
+
+    def _rebuild(self, files):
+        """Replace the whole content with the given (index, file_types) 2-tuples."""
+        self.__init__(files)
+
+    def _find_multi_assigned_indexes(self):
+        """Return the sorted list of multi-assigned indexes, which are exactly the ones with a separate file types list."""
+        return sorted(self._multi_types)
+
+    def _intern_type(self, file_type):
+        """Return the ID of the given file type, adding it to the table of file types if it is new."""
+        type_id = self._type_ids_by_name.get(file_type)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._type_names.append(file_type)
+            self._type_ids_by_name[file_type] = type_id
+        return type_id
+
+    def _get_type_id(self, index, file_types):
+        """Return the type ID to store for the given file types list, registering multi-assigned indexes on the way."""
+        if len(file_types) == 1:
+            self._multi_types.pop(index, None)
+            return self._intern_type(file_types[0])
+        else:
+            self._multi_types[index] = list(file_types)
+            return self.MULTI_TYPE_ID
+
+    def _find_position(self, index):
+        """Return the position of the given index within the arrays, or None if it is not assigned."""
+        position = bisect_left(self._sorted_indexes, index)
+        if position < len(self._sorted_indexes) and self._sorted_indexes[position] == index:
+            return position
+        else:
+            return None
+
+    #===========================================================================
+    # Mapping methods
+    #===========================================================================
+
+    def __getitem__(self, index):
+        position = self._find_position(index)
+        if position is None:
+            raise KeyError(index)
+
+        type_id = self._type_ids[position]
+        if type_id == self.MULTI_TYPE_ID:
+            return self._multi_types[index][:]
+        else:
+            return [self._type_names[type_id]]
+
+    def __setitem__(self, index, file_types):
+        position = self._find_position(index)
+        if position is None:
+            position = self._register_index(index)
+            self._sorted_indexes.insert(position, index)
+            self._type_ids.insert(position, self._get_type_id(index, file_types))
+        else:
+            self._type_ids[position] = self._get_type_id(index, file_types)
+        self._update_multi_assigned(index, len(file_types))
+
+    def __delitem__(self, index):
+        position = self._find_position(index)
+        if position is None:
+            raise KeyError(index)
+
+        del self._type_ids[position]
+        self._multi_types.pop(index, None)
+        self._unregister_index(position)
+
+    def __contains__(self, index):
+        return self._find_position(index) is not None
+
+    def __iter__(self):
+        return iter(self._sorted_indexes)
+
+    def __len__(self):
+        return len(self._sorted_indexes)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, dict(self))
+
+    def clear(self):
+        self.__init__()
+
+    def copy(self):
+        return self.__class__(self)
+
+    def add_type(self, index, file_type):
+        """Add a file specified by its index and file type."""
+        position = self._find_position(index)
+        if position is None:
+            self[index] = [file_type]
+        else:
+            file_types = self[index]
+            file_types.append(file_type)
+            self._type_ids[position] = self._get_type_id(index, file_types)
+            self._update_multi_assigned(index, len(file_types))
+
+    def remove_type(self, index, file_type):
+        """
+        Remove a file specified by its index and file type. If it is the last file at this index, the entire index is removed.
+
+        @raise KeyError: The given index is not assigned
+        @raise ValueError: The given file type is not assigned at the index
+        """
+        file_types = self[index]
+        file_types.remove(file_type)
+        if file_types:
+            self[index] = file_types
+        else:
+            del self[index]
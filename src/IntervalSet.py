@@ -0,0 +1,108 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet():
+    """
+    An immutable set of integers, stored as sorted, disjoint runs of consecutive integers.
+
+    For instance, the indexes 0, 1, 2, 5, 7 and 8 are stored as the runs (0, 2), (5, 5) and (7, 8).
+    Index ranges can thus be passed around and processed run by run, regardless of how many indexes they cover.
+    """
+
+    def __init__(self, runs=()):
+        """
+        @param runs: An iterable of inclusive ranges, i.e. 2-tuples of integers. Their bounds may be given in any order and they may overlap or adjoin each other.
+
+        @raise TypeError: A bound is not an integer
+        """
+        ordered_runs = []
+        for left_bound, right_bound in runs:
+            if not type(left_bound) is int or not type(right_bound) is int:
+                raise TypeError((left_bound, right_bound), "The range ({}, {}) doesn't consist of integers.".format(left_bound, right_bound))
+            if right_bound < left_bound:
+                left_bound, right_bound = right_bound, left_bound
+            ordered_runs.append((left_bound, right_bound))
+        ordered_runs.sort()
+
+        ## Merge overlapping and adjoining runs
+        self._lefts = []
+        self._rights = []
+        for left_bound, right_bound in ordered_runs:
+            if self._rights and left_bound <= self._rights[-1] + 1:
+                self._rights[-1] = max(self._rights[-1], right_bound)
+            else:
+                self._lefts.append(left_bound)
+                self._rights.append(right_bound)
+
+        ## The amount of integers in front of every run, used to count the integers below a value in logarithmic time
+        self._counts_before = []
+        count = 0
+        for left_bound, right_bound in zip(self._lefts, self._rights):
+            self._counts_before.append(count)
+            count += right_bound - left_bound + 1
+        self._count = count
+
+    @classmethod
+    def from_indexes(cls, indexes):
+        """Create an IntervalSet containing the given integers."""
+        runs = []
+        for index in sorted(set(indexes)):
+            if runs and index == runs[-1][1] + 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+
+        return cls((left_bound, right_bound) for left_bound, right_bound in runs)
+
+    @property
+    def runs(self):
+        """The list of the runs of the set as ordered inclusive 2-tuples, from lowest to highest."""
+        return list(zip(self._lefts, self._rights))
+
+    @property
+    def bounds(self):
+        """The lowest and the highest integer of the set as a 2-tuple; None if the set is empty."""
+        if not self._lefts:
+            return None
+        return (self._lefts[0], self._rights[-1])
+
+    def count_below(self, value):
+        """Return the amount of integers within the set that are lower than the given value."""
+        position = bisect_left(self._rights, value) # the first run that reaches up to value
+        if position == len(self._lefts):
+            return self._count
+
+        return self._counts_before[position] + max(value - self._lefts[position], 0)
+
+    def __len__(self):
+        """Return the amount of integers within the set."""
+        return self._count
+
+    def __iter__(self):
+        """Iterate over the integers within the set in ascending order."""
+        for left_bound, right_bound in zip(self._lefts, self._rights):
+            yield from range(left_bound, right_bound+1)
+
+    def __contains__(self, value):
+        position = bisect_right(self._lefts, value) - 1
+        return position >= 0 and value <= self._rights[position]
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._lefts == other._lefts and self._rights == other._rights
+
+    def __hash__(self):
+        return hash((tuple(self._lefts), tuple(self._rights)))
+
+    def __repr__(self):
+        return "IntervalSet({})".format(self.runs)
+
+    def __str__(self):
+        """Return the set in the notation of the CLI, e.g. '0-2,5,7-8'."""
+        return ','.join(str(left_bound) if left_bound == right_bound else '{}-{}'.format(left_bound, right_bound) for left_bound, right_bound in self.runs)
@@ -0,0 +1,331 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import json
+import os
+from os import fsync, makedirs, remove, rmdir, scandir
+from os.path import abspath, dirname, isfile, join
+from threading import Lock
+
+from FileExchange import FileExchange
+from RenamePlan import RenamePlan
+
+
+class RenameJournal():
+    """
+    A write-ahead journal of the rename operations of a RenamePlan, allowing to recover from a crash in the middle of executing it.
+
+    Before the first rename, all operations of the plan are written to a journal file within the directory, along
+    with the inode number of every renamed file. While the plan is executed, the completed operations are recorded
+    in batches of SYNC_INTERVAL: the directory is synced first, so only renames that have reached the disk are
+    recorded. Once the plan has been executed (or undone after a failure), the journal is removed.
+
+    If the process dies in between, the journal is left behind. On the next start, recover determines which
+    operations have been performed - from the recorded progress and by looking up where every file is now by its
+    inode number - and either performs the remaining operations or undoes the performed ones.
+    """
+    FILE_NAME = '.fileset_journal'
+    SYNC_INTERVAL = 1000 # the amount of renames recorded at once
+    FORMAT_VERSION = 1
+
+    class JournalError(Exception):
+        """Raised when a journal can't be started or an interrupted plan can't be recovered automatically."""
+
+    def __init__(self, directory, inodes=None):
+        """
+        @param directory: The directory the renamed files reside in; the journal is stored there as well
+        @param inodes: A dictionary mapping file names within the directory to their current inode numbers, e.g. the ones of a current DirectorySnapshot (see DirectorySnapshot.current_inodes).
+            The inode numbers of the renamed files are taken from it; the ones it lacks or maps to None are looked up (default: None, i.e. look up all of them)
+        """
+        self.directory = abspath(directory)
+        self.inodes = inodes
+        self.path = join(self.directory, self.FILE_NAME)
+        self._file = None
+        self._operation_indexes = {}
+        self._undo_indexes = {}
+        self._done = []
+        self._undone = []
+        self._exchanged = set() # the indexes of the exchanges that have been performed, since undoing an exchange means performing it again
+        self._lock = Lock()
+
+    def __repr__(self):
+        return "RenameJournal({!r})".format(self.directory)
+
+    @classmethod
+    def is_pending(cls, directory):
+        """Return whether the given directory contains the journal of an interrupted plan."""
+        return isfile(join(directory, cls.FILE_NAME))
+
+    #===========================================================================
+    # Journaling
+    #===========================================================================
+
+    def write_ahead(self, plan):
+        """
+        Write the operations of the given plan to the journal and make sure they have reached the disk.
+
+        @param plan: The RenamePlan that is about to be executed
+
+        @raise JournalError: The journal of another plan exists within the directory
+        """
+        ## Follow every file through the plan, starting with its current inode number, which is only looked up for the files the plan renames the given inodes lack
+        inodes = {}
+        def get_inode(name):
+            if not name in inodes:
+                inode = None if self.inodes is None else self.inodes.get(name)
+                if inode is None:
+                    try:
+                        inode = os.lstat(join(self.directory, name)).st_ino
+                    except OSError:
+                        pass
+                inodes[name] = inode
+            return inodes[name]
+
+        operation_inodes = []
+        for operation in plan.operations:
+            old_name, new_name = operation
+            if type(operation) is RenamePlan.Exchange:
+                ## Only the file with the old name is followed; the other one is at its old name exactly if the first one is
+                inode = get_inode(old_name)
+                inodes[old_name], inodes[new_name] = get_inode(new_name), inode
+            else:
+                inode = get_inode(old_name)
+                inodes[old_name] = None # the name is free now, not taken by the file it had before the plan
+                inodes[new_name] = inode
+            operation_inodes.append(inode)
+
+        try:
+            self._file = open(self.path, 'x', encoding='utf-8')
+        except FileExistsError:
+            raise RenameJournal.JournalError(self.path, "The journal '{}' of an interrupted operation exists. Recover it first.".format(self.path))
+
+        lines = [json.dumps({'format': self.FORMAT_VERSION, 'operations': len(plan.operations), 'temp_names': plan.temp_names})]
+        lines.extend(json.dumps(self._serialize(operation, inode)) for operation, inode in zip(plan.operations, operation_inodes))
+        self._file.write('\n'.join(lines) + '\n')
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._sync_directory(self.directory)
+
+        self._operation_indexes = {operation: i for i, operation in enumerate(plan.operations)}
+        self._undo_indexes = {(new_name, old_name): i for i, (old_name, new_name) in enumerate(plan.operations)}
+        self._exchanged = set()
+
+    @staticmethod
+    def _serialize(operation, inode):
+        """Return the journal entry of an operation, marking exchanges (see RenamePlan.Exchange) with an additional flag."""
+        old_name, new_name = operation
+        if type(operation) is RenamePlan.Exchange:
+            return [old_name, new_name, inode, True]
+        return [old_name, new_name, inode]
+
+    def track(self, rename_function):
+        """Return a rename function that performs the rename using rename_function and records it in the journal. It may be called by several threads at once."""
+        def tracked_rename(old_name, new_name):
+            rename_function(old_name, new_name)
+            self._record(old_name, new_name)
+
+        return tracked_rename
+
+    def track_exchanges(self, exchange_function):
+        """Return an exchange function that swaps the files using exchange_function and records it in the journal; None if exchange_function is None."""
+        if exchange_function is None:
+            return None
+
+        def tracked_exchange(name1, name2):
+            exchange_function(name1, name2)
+            self._record_exchange(name1, name2)
+
+        return tracked_exchange
+
+    def finish(self):
+        """Remove the journal, since its plan has been executed or undone completely."""
+        self._file.close()
+        self._file = None
+        remove(self.path)
+        self._sync_directory(self.directory)
+
+    def _record(self, old_name, new_name):
+        """Record a performed rename, writing the recorded renames to the journal once SYNC_INTERVAL of them have been collected."""
+        with self._lock:
+            i = self._operation_indexes.get((old_name, new_name))
+            if i is not None:
+                self._done.append(i)
+            else:
+                self._undone.append(self._undo_indexes[old_name, new_name]) # undoing the plan after a failure
+
+            if len(self._done) + len(self._undone) >= self.SYNC_INTERVAL:
+                self._sync_progress()
+
+    def _record_exchange(self, name1, name2):
+        """Record a performed exchange, which is either an operation of the plan or its undoing."""
+        with self._lock:
+            i = self._operation_indexes[name1, name2]
+            if i in self._exchanged:
+                self._exchanged.remove(i)
+                self._undone.append(i)
+            else:
+                self._exchanged.add(i)
+                self._done.append(i)
+
+            if len(self._done) + len(self._undone) >= self.SYNC_INTERVAL:
+                self._sync_progress()
+
+    def _sync_progress(self):
+        """Write the recorded renames to the journal, after making sure that they have reached the disk."""
+        self._sync_directory(self.directory)
+
+        self._file.write(json.dumps({'done': self._done, 'undone': self._undone}) + '\n')
+        self._file.flush()
+        fsync(self._file.fileno())
+        self._done = []
+        self._undone = []
+
+    @staticmethod
+    def _sync_directory(directory):
+        """Make sure that the changes to the entries of the directory have reached the disk. This is not supported on every platform."""
+        try:
+            directory_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            fsync(directory_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(directory_fd)
+
+    #===========================================================================
+    # Recovery
+    #===========================================================================
+
+    @classmethod
+    def recover(cls, directory, roll_forward=True):
+        """
+        Complete or undo the plan of the journal an interrupted process has left within the given directory.
+
+        @param directory: The directory that might contain a journal
+        @param roll_forward: Whether to perform the remaining operations of the plan (default) or to undo the performed ones
+
+        @raise JournalError: A file of the plan has been moved or deleted by someone else since, so the plan can't be recovered automatically
+
+        @return: None if there is no journal; otherwise a 2-tuple of the amount of operations that had been performed and the amount of renames performed to recover
+        """
+        directory = abspath(directory)
+        journal_path = join(directory, cls.FILE_NAME)
+        try:
+            with open(journal_path, encoding='utf-8') as journal_file:
+                lines = journal_file.read().split('\n')
+        except FileNotFoundError:
+            return None
+
+        operations, operation_inodes, done = cls._parse(lines)
+        if operations is None:
+            ## The journal has not been written completely, so no rename has been performed yet
+            remove(journal_path)
+            return (0, 0)
+
+        done = cls._locate_files(directory, operations, operation_inodes, done)
+
+        ## Temporary names reside within a sub directory (see RenamePlan.STAGING_DIRECTORY), which might have to be created again
+        sub_directories = cls._get_sub_directories(operations)
+        if any(type(operation) is RenamePlan.Exchange for operation in operations):
+            sub_directories.add(RenamePlan.STAGING_DIRECTORY) # in case the files have to be swapped via a temporary name
+        for sub_directory in sub_directories:
+            makedirs(join(directory, sub_directory), exist_ok=True)
+
+        rename_in_directory = lambda old_name, new_name: FileExchange.rename(join(directory, old_name), join(directory, new_name))
+        exchange_in_directory = lambda name1, name2: FileExchange.swap(join(directory, name1), join(directory, name2), join(directory, RenamePlan.swap_temp_name()))
+
+        recovery_renames = 0
+        if roll_forward:
+            for i, operation in enumerate(operations):
+                if not i in done:
+                    RenamePlan.perform_operation(operation, rename_in_directory, exchange_in_directory)
+                    recovery_renames += 1
+        else:
+            for i in range(len(operations)-1, -1, -1):
+                if i in done:
+                    RenamePlan.undo_operation(operations[i], rename_in_directory, exchange_in_directory)
+                    recovery_renames += 1
+
+        for sub_directory in sub_directories:
+            try:
+                rmdir(join(directory, sub_directory))
+            except OSError:
+                pass # not empty
+        remove(journal_path)
+        cls._sync_directory(directory)
+
+        return (len(done), recovery_renames)
+
+    @staticmethod
+    def _get_sub_directories(operations):
+        """Return the set of the sub directories the names of the given operations reside in."""
+        return {dirname(file_name) for operation in operations for file_name in operation} - {''}
+
+    @staticmethod
+    def _parse(lines):
+        """
+        Parse the lines of a journal.
+
+        @return: A 3-tuple of the list of operations, the list of their inode numbers and the set of the indexes of the operations recorded as performed.
+            If the operations have not been written completely, (None, None, None) is returned.
+        """
+        try:
+            header = json.loads(lines[0])
+            operation_count = header['operations']
+            entries = [json.loads(line) for line in lines[1:operation_count+1]]
+        except (ValueError, KeyError):
+            return None, None, None
+        if len(entries) < operation_count:
+            return None, None, None
+
+        operations = [RenamePlan.Exchange(entry[0], entry[1]) if len(entry) > 3 and entry[3] else (entry[0], entry[1]) for entry in entries]
+        operation_inodes = [entry[2] for entry in entries]
+
+        done = set()
+        for line in lines[operation_count+1:]:
+            try:
+                progress = json.loads(line)
+            except ValueError:
+                break # the process died while writing this record
+            done.update(progress['done'])
+            done.difference_update(progress['undone'])
+
+        return operations, operation_inodes, done
+
+    @classmethod
+    def _locate_files(cls, directory, operations, operation_inodes, done):
+        """
+        Determine which operations have been performed by looking up the current name of every renamed file by its inode number.
+
+        The operations of files without a known inode number are taken from the recorded progress.
+
+        @return: The set of the indexes of the performed operations
+        """
+        current_inodes = {entry.name: entry.inode() for entry in scandir(directory)}
+        for sub_directory in cls._get_sub_directories(operations):
+            try:
+                current_inodes.update((join(sub_directory, entry.name), entry.inode()) for entry in scandir(join(directory, sub_directory)))
+            except FileNotFoundError:
+                pass
+
+        file_operations = {} # inode -> indexes of the operations renaming the file, in order
+        for i, inode in enumerate(operation_inodes):
+            if inode is not None:
+                file_operations.setdefault(inode, []).append(i)
+
+        done = set(done)
+        for inode, indexes in file_operations.items():
+            file_names = [operations[indexes[0]][0]] + [operations[i][1] for i in indexes] # every name the file has during the plan
+            positions = [position for position, file_name in enumerate(file_names) if current_inodes.get(file_name) == inode]
+            if len(positions) != 1:
+                raise RenameJournal.JournalError(file_names[0], "The file '{}' has been moved or deleted since the operation was interrupted. Recover the files manually and remove the journal.".format(file_names[0]))
+
+            position, = positions
+            done.update(indexes[:position])
+            done.difference_update(indexes[position:])
+
+        return done
@@ -0,0 +1,558 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from math import ceil
+from os import getpid
+from os.path import join
+from threading import get_ident
+
+
+class RenamePlan():
+    """
+    An ordered list of physical rename operations realizing a mapping of old file names to new file names.
+
+    Every file of the mapping is renamed exactly once. Since the names of a mapping may depend on each other
+    (e.g. 'a' -> 'b' requires 'b' -> 'c' to happen first), the mapping is decomposed into chains and cycles:
+        - A chain ends in a name that is not taken by any other file of the mapping. It is renamed back to front.
+        - A cycle (e.g. 'a' -> 'b' -> 'a') has no free name to start with. Therefore, one of its files is renamed to
+          a temporary name first, which costs one additional rename per cycle.
+
+    The new names of the mapping must be unique and must not be taken by files that are not renamed themselves.
+
+    The operations of different chains and cycles don't depend on each other, so they may be executed concurrently
+    (see RenameScheduler). To make use of this for long chains and cycles as well, they can be split into several
+    shorter ones: the file at which a chain is split is renamed to a temporary name right away and to its new name
+    once the part of the chain in front of it has been renamed. Again, this costs one additional rename per split.
+
+    Temporary names are placed within the hidden STAGING_DIRECTORY, a sub directory of the directory the files
+    reside in, so they can neither collide with the names of other files nor be detected as a file set.
+    The rename function has to create the staging directory when a file is first renamed into it.
+
+    If exchanges are requested, cycles of two files are not renamed via a temporary name, but planned as a single
+    Exchange operation instead, which swaps the names of both files at once (see FileExchange).
+    """
+    STAGING_DIRECTORY = '.fileset_staging'
+    TEMP_NAME_FORMAT = '{}_{}' # process id, running number
+    CHAINS_PER_WORKER = 4 # when planning for several workers, chains are split into about this many parts per worker ..
+    MIN_CHAIN_LENGTH = 16 # .. unless the parts would become shorter than this
+
+    class RenameError(Exception):
+        """Raised when a rename operation of a plan fails. The operations executed up to this point have been undone."""
+
+    class CollisionError(RenameError):
+        """Raised when validating a plan which's new names collide with each other or with files outside of the plan. No rename has been performed."""
+
+    class Exchange(tuple):
+        """
+        An operation swapping the names of two files, i.e. a cycle of two files performed at once.
+
+        It is a 2-tuple of both names, so it can be treated like a rename of the first name to the second one, e.g. when determining dependencies.
+        Undoing it means performing it once more.
+        """
+
+        def __new__(cls, name1, name2):
+            return super().__new__(cls, (name1, name2))
+
+        def __repr__(self):
+            return "Exchange({!r}, {!r})".format(*self)
+
+    def __init__(self, name_mapping, max_workers=1, max_chain_length=None, exchange_cycles=False):
+        """
+        Create a plan for the given name mapping.
+
+        @param name_mapping: A dictionary mapping old file names to new file names. Names that map to themselves are ignored.
+        @param max_workers: The amount of threads executing the rename operations concurrently (default: 1, i.e. execute them one after another)
+        @param max_chain_length: The maximal amount of operations of a chain or cycle before it is split.
+            (default: no splitting for a single worker; otherwise long enough to keep all workers busy, see CHAINS_PER_WORKER)
+        @param exchange_cycles: Whether cycles of two files are planned as a single Exchange instead of three renames (default: False)
+        """
+        self.name_mapping = {old_name: new_name for old_name, new_name in name_mapping.items() if old_name != new_name}
+        self.max_workers = max_workers
+        if max_chain_length is None and max_workers > 1:
+            max_chain_length = max(self.MIN_CHAIN_LENGTH, ceil(len(self.name_mapping) / (max_workers * self.CHAINS_PER_WORKER)))
+        self.max_chain_length = max_chain_length
+        self.exchange_cycles = exchange_cycles
+        self.operations = []
+        self.temp_names = []
+        self.exchange_count = 0
+
+        self._plan()
+
+    def __len__(self):
+        """Return the amount of rename operations the plan consists of."""
+        return len(self.operations)
+
+    def __repr__(self):
+        return "RenamePlan({} files, {} renames, {} temporary names)".format(len(self.name_mapping), len(self.operations), len(self.temp_names))
+
+    def _plan(self):
+        """Decompose the name mapping into chains and cycles and list their rename operations in a valid order."""
+        old_names_by_new = {new_name: old_name for old_name, new_name in self.name_mapping.items()}
+        planned = set()
+
+        ## Chains: start at every file which's new name is free and walk back to the file that is waiting for its old name
+        for old_name, new_name in self.name_mapping.items():
+            if new_name in self.name_mapping:
+                continue # not the end of a chain
+
+            self._plan_chain(old_name, new_name, None, old_names_by_new, planned)
+
+        ## Cycles: all files that are left over. Free one name by using a temporary name and proceed like with a chain
+        for cycle_start, cycle_start_target in self.name_mapping.items():
+            if cycle_start in planned:
+                continue
+
+            if self.exchange_cycles and self.name_mapping[cycle_start_target] == cycle_start:
+                self.operations.append(RenamePlan.Exchange(cycle_start, cycle_start_target))
+                self.exchange_count += 1
+                planned.update((cycle_start, cycle_start_target))
+                continue
+
+            temp_name = self._new_temp_name()
+            self.operations.append((cycle_start, temp_name))
+            planned.add(cycle_start)
+
+            self._plan_chain(old_names_by_new[cycle_start], cycle_start, cycle_start, old_names_by_new, planned)
+
+            self.operations.append((temp_name, cycle_start_target))
+
+    def _plan_chain(self, old_name, new_name, end_name, old_names_by_new, planned):
+        """
+        List the rename operations of a chain from its end to its start, splitting it every max_chain_length operations.
+
+        @param old_name: The old name of the last file of the chain
+        @param new_name: The free new name of the last file of the chain
+        @param end_name: The name at which the chain ends; None if it ends at a name that no file is renamed to
+        """
+        split_operations = [] # the operations renaming the files at which the chain has been split from their temporary names
+        chain_length = 0
+        while old_name is not None and old_name != end_name:
+            if chain_length == self.max_chain_length:
+                temp_name = self._new_temp_name()
+                self.operations.append((old_name, temp_name))
+                split_operations.append((temp_name, new_name))
+                chain_length = 0
+            else:
+                self.operations.append((old_name, new_name))
+            planned.add(old_name)
+            chain_length += 1
+
+            new_name = old_name
+            old_name = old_names_by_new.get(new_name)
+
+        self.operations.extend(split_operations)
+
+    def _new_temp_name(self):
+        temp_name = join(self.STAGING_DIRECTORY, self.TEMP_NAME_FORMAT.format(getpid(), len(self.temp_names)))
+        self.temp_names.append(temp_name)
+        return temp_name
+
+    @classmethod
+    def swap_temp_name(cls):
+        """Return the temporary name used to swap two files by renaming them one after another if they can't be exchanged (see FileExchange.swap). It is unique for every thread."""
+        return join(cls.STAGING_DIRECTORY, cls.TEMP_NAME_FORMAT.format(getpid(), 'swap_{}'.format(get_ident())))
+
+    def validate(self, file_exists):
+        """
+        Make sure up front that the plan doesn't rename any file to a name that is taken, so no rename has to be undone because of a collision.
+
+        Names that are freed within the plan are not looked up, so only the ends of the chains are looked up, i.e. one name per chain rather than per file.
+        Collisions caused by files that are created in between are still detected while executing the plan, as long as
+        the rename function refuses to replace existing files (see FileExchange.rename).
+
+        @param file_exists: A function returning whether a file with the given name exists
+
+        @raise CollisionError: Two files are renamed to the same name or a new name is taken by a file that is not renamed by the plan
+        """
+        old_names_by_new = {}
+        for old_name, new_name in self.name_mapping.items():
+            other_old_name = old_names_by_new.setdefault(new_name, old_name)
+            if other_old_name != old_name:
+                raise RenamePlan.CollisionError(old_name, new_name, "The files '{}' and '{}' can't both be renamed to '{}'.".format(other_old_name, old_name, new_name))
+
+            if not new_name in self.name_mapping and file_exists(new_name):
+                raise RenamePlan.CollisionError(old_name, new_name, "The file '{}' can't be renamed to '{}', since that name is taken by another file.".format(old_name, new_name))
+
+    def dependencies(self):
+        """
+        Determine which operations have to be completed before each operation may be executed (see find_dependencies).
+
+        @return: A list containing a tuple of the indexes of the operations that each operation depends on
+        """
+        return self.find_dependencies(self.operations)
+
+    @staticmethod
+    def find_dependencies(operations):
+        """
+        Determine which of the given operations have to be completed before each operation may be executed.
+
+        An operation depends on the latest previous operation involving its old name or its new name, e.g. the one
+        freeing the new name. Executing the operations in any order that respects these dependencies has the same
+        effect as executing them one after another.
+
+        @param operations: A list of (old_name, new_name) 2-tuples in an order they may be executed in one after another
+
+        @return: A list containing a tuple of the indexes of the operations that each operation depends on
+        """
+        last_operations = {} # file name -> index of the latest operation involving it
+        dependencies = []
+        for i, (old_name, new_name) in enumerate(operations):
+            old_name_operation = last_operations.get(old_name)
+            new_name_operation = last_operations.get(new_name)
+            dependencies.append(tuple(operation for operation in {old_name_operation, new_name_operation} if operation is not None))
+
+            last_operations[old_name] = last_operations[new_name] = i
+
+        return dependencies
+
+    @staticmethod
+    def perform_operation(operation, rename_function, exchange_function=None):
+        """Perform a single operation of a plan, which is either a rename or an Exchange."""
+        if type(operation) is RenamePlan.Exchange:
+            exchange_function(*operation)
+        else:
+            rename_function(*operation)
+
+    @staticmethod
+    def undo_operation(operation, rename_function, exchange_function=None):
+        """Undo a single operation of a plan that has been performed."""
+        old_name, new_name = operation
+        if type(operation) is RenamePlan.Exchange:
+            exchange_function(old_name, new_name)
+        else:
+            rename_function(new_name, old_name)
+
+    def execute(self, rename_function, journal=None, exchange_function=None):
+        """
+        Perform the planned rename operations, using max_workers threads if several workers have been requested.
+
+        If one of the operations fails, the operations performed so far are undone in reverse order.
+
+        @param rename_function: The function used to rename a file, taking the old and the new name (e.g. os.rename). It must be thread-safe if several workers are used.
+        @param journal: A RenameJournal to write the operations and their progress to, so the plan can be recovered if the process dies (default: None)
+        @param exchange_function: The function used to swap the names of two files (e.g. FileExchange.swap); required if the plan contains exchanges
+
+        @raise ValueError: The plan contains exchanges, but no exchange_function has been given
+        @raise RenameError: A rename operation failed; the original error is chained to it
+        @raise RenameJournal.JournalError: The journal of another plan exists
+        """
+        if self.exchange_count and exchange_function is None:
+            raise ValueError("The plan contains exchanges, but no function to exchange files has been given.")
+
+        if journal is None:
+            self._execute(rename_function, exchange_function)
+        elif self.operations:
+            journal.write_ahead(self)
+            try:
+                self._execute(journal.track(rename_function), journal.track_exchanges(exchange_function))
+            except RenamePlan.RenameError:
+                journal.finish() # the performed operations have been undone
+                raise
+            journal.finish()
+
+    def _execute(self, rename_function, exchange_function):
+        if self.max_workers > 1 and len(self.operations) > 1:
+            RenameScheduler(self.max_workers).execute(self.operations, self.dependencies(), rename_function, exchange_function)
+            return
+
+        for i, operation in enumerate(self.operations):
+            try:
+                self.perform_operation(operation, rename_function, exchange_function)
+            except OSError as e:
+                for undo_operation in reversed(self.operations[:i]):
+                    self.undo_operation(undo_operation, rename_function, exchange_function)
+
+                old_name, new_name = operation
+                raise RenamePlan.RenameError(old_name, new_name, "The file '{}' could not be renamed to '{}'. All previous renames have been undone.".format(old_name, new_name)) from e
+
+
+class RenameScheduler():
+    """
+    Executes rename operations concurrently on a bounded pool of threads, while respecting their dependencies.
+
+    An operation is handed to the pool as soon as all operations it depends on have been completed. Since every
+    rename waits for the file system most of the time, this hides its latency, e.g. on network file systems.
+    The amount of operations handed to the pool at once is limited, so huge plans don't flood it.
+    """
+    PENDING_PER_WORKER = 2 # the amount of operations handed to the pool at once per worker
+
+    def __init__(self, max_workers):
+        """
+        @param max_workers: The amount of threads executing the operations
+        """
+        self.max_workers = max_workers
+
+    def count_steps(self, dependencies):
+        """
+        Determine how many renames in a row executing operations with the given dependencies takes, assuming that every rename takes the same time.
+
+        Multiplied by the latency of a single rename, this estimates the duration of executing the operations.
+
+        @param dependencies: A list containing a tuple of the indexes of the operations that each operation depends on (see RenamePlan.dependencies)
+        """
+        dependants = [[] for _ in dependencies]
+        dependency_counts = []
+        for i, operation_dependencies in enumerate(dependencies):
+            for dependency in operation_dependencies:
+                dependants[dependency].append(i)
+            dependency_counts.append(len(operation_dependencies))
+
+        ready = deque(i for i, dependency_count in enumerate(dependency_counts) if dependency_count == 0)
+        steps = 0
+        while ready:
+            steps += 1
+            for _ in range(min(self.max_workers, len(ready))):
+                for dependant in dependants[ready.popleft()]:
+                    dependency_counts[dependant] -= 1
+                    if dependency_counts[dependant] == 0:
+                        ready.append(dependant)
+
+        return steps
+
+    def execute(self, operations, dependencies, rename_function, exchange_function=None):
+        """
+        Perform the given rename operations.
+
+        If one of the operations fails, no further operations are started. Once the running ones have finished,
+        all completed operations are undone in reverse order of their completion.
+
+        @param operations: A list of (old_name, new_name) 2-tuples
+        @param dependencies: A list containing a tuple of the indexes of the operations that each operation depends on (see RenamePlan.dependencies)
+        @param rename_function: The thread-safe function used to rename a file, taking the old and the new name
+        @param exchange_function: The thread-safe function used to swap the names of two files; required if the operations contain exchanges (see RenamePlan.Exchange)
+
+        @raise RenamePlan.RenameError: A rename operation failed; the original error is chained to it
+        """
+        dependants = [[] for _ in operations]
+        dependency_counts = []
+        for i, operation_dependencies in enumerate(dependencies):
+            for dependency in operation_dependencies:
+                dependants[dependency].append(i)
+            dependency_counts.append(len(operation_dependencies))
+
+        ready = deque(i for i, dependency_count in enumerate(dependency_counts) if dependency_count == 0)
+        running = {} # future -> index of its operation
+        completed = []
+        failure = None
+        max_running = self.max_workers * self.PENDING_PER_WORKER
+
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            while ready or running:
+                while ready and failure is None and len(running) < max_running:
+                    i = ready.popleft()
+                    running[pool.submit(RenamePlan.perform_operation, operations[i], rename_function, exchange_function)] = i
+
+                if not running:
+                    break # failed and nothing left to wait for
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        if failure is None:
+                            failure = (i, error)
+                        continue
+
+                    completed.append(i)
+                    for dependant in dependants[i]:
+                        dependency_counts[dependant] -= 1
+                        if dependency_counts[dependant] == 0:
+                            ready.append(dependant)
+
+        if failure is not None:
+            i, error = failure
+            if not isinstance(error, OSError):
+                raise error
+
+            for j in reversed(completed):
+                RenamePlan.undo_operation(operations[j], rename_function, exchange_function)
+
+            old_name, new_name = operations[i]
+            raise RenamePlan.RenameError(old_name, new_name, "The file '{}' could not be renamed to '{}'. All previous renames have been undone.".format(old_name, new_name)) from error
+
+
+class RenameBatch():
+    """
+    A collection of renames that are not performed right away, but later on as a whole.
+
+    The batch keeps track of the original name of every file it has renamed. Consecutive renames of the same
+    file are coalesced, so only the net mapping of original names to final names remains. Committing the batch
+    performs this mapping as a single RenamePlan, renaming every file at most once.
+    """
+
+    def __init__(self):
+        self._original_names = {} # current name -> original name
+        self._current_names = {} # original name -> current name
+
+    def __len__(self):
+        """Return the amount of files that would be renamed by committing the batch."""
+        return len(self.get_name_mapping())
+
+    def rename(self, old_name, new_name):
+        """
+        Rename a file within the batch, i.e. only record the rename.
+
+        @raise FileExistsError: The new name is already taken by another file that has been renamed within the batch
+        """
+        if new_name in self._original_names:
+            raise FileExistsError(new_name, "The file '{}' can't be renamed to '{}', since that name has already been taken within the batch.".format(old_name, new_name))
+
+        original_name = self._original_names.pop(old_name, old_name)
+        self._original_names[new_name] = original_name
+        self._current_names[original_name] = new_name
+
+    def exchange(self, name1, name2):
+        """Swap the names of two files within the batch, i.e. only record the exchange."""
+        original_name1 = self._original_names.pop(name1, name1)
+        original_name2 = self._original_names.pop(name2, name2)
+        self._original_names[name2] = original_name1
+        self._original_names[name1] = original_name2
+        self._current_names[original_name1] = name2
+        self._current_names[original_name2] = name1
+
+    def holds(self, file_name):
+        """Return whether a file has been renamed to the given name within the batch."""
+        return file_name in self._original_names
+
+    def renamed_away(self, file_name):
+        """Return whether the file with the given name has been renamed within the batch and the name has not been taken again."""
+        return file_name in self._current_names and not file_name in self._original_names
+
+    def get_name_mapping(self):
+        """Return the net mapping of original names to final names of all renamed files."""
+        return {original_name: current_name for original_name, current_name in self._current_names.items() if original_name != current_name}
+
+    def apply_to(self, file_names):
+        """
+        Return the given file names as they will be after committing the batch.
+
+        @param file_names: An iterable of currently existing file names, e.g. the result of a directory scan
+        """
+        file_names = [file_name for file_name in file_names if not file_name in self._current_names]
+        file_names.extend(self._original_names.keys())
+
+        return file_names
+
+    def commit(self, rename_function, max_workers=1, journal=None, exchange_function=None, file_exists=None):
+        """
+        Perform the net renames of the batch and empty it.
+
+        @param rename_function: The function used to rename a file, taking the old and the new name (e.g. os.rename)
+        @param max_workers: The amount of threads performing the renames concurrently (default: 1)
+        @param journal: A RenameJournal to execute the renames with (default: None, see RenamePlan.execute)
+        @param exchange_function: If given, cycles of two files are swapped using this function (default: None, i.e. rename them via a temporary name)
+        @param file_exists: If given, the plan is validated using this function before any file is renamed (default: None, see RenamePlan.validate)
+
+        @raise RenamePlan.CollisionError: The renames of the batch collide with other files; no file has been renamed
+        @raise RenamePlan.RenameError: A rename operation failed; the renames of the batch have been undone
+        """
+        plan = RenamePlan(self.get_name_mapping(), max_workers, exchange_cycles=exchange_function is not None)
+        self._original_names = {}
+        self._current_names = {}
+
+        if file_exists is not None:
+            plan.validate(file_exists)
+        plan.execute(rename_function, journal, exchange_function)
+
+
+class RenameRecording(RenameBatch):
+    """
+    A RenameBatch that also records every rename in the order it would have been performed, along with the temporary names used.
+
+    While a recording is active, the FileSets don't rename any files (see FileSet.record_renames), which allows
+    previewing the renames an operation would perform. If the recording is started in batch mode, the renames
+    pending in the batch are taken into account when checking which files exist.
+    """
+
+    def __init__(self, parent_batch=None, max_workers=1):
+        """
+        @param parent_batch: The batch that was active when the recording was started, if any
+        @param max_workers: The amount of threads that would perform the renames of a RenamePlan concurrently
+        """
+        super().__init__()
+        self.parent_batch = parent_batch
+        self.max_workers = max_workers
+        self.operations = []
+        self.temp_names = []
+        self._concurrent_plans = [] # (start, end) index ranges of the operations of plans that would be performed concurrently
+
+    def __len__(self):
+        """Return the amount of recorded renames."""
+        return len(self.operations)
+
+    def __repr__(self):
+        return "RenameRecording({} renames, {} files touched, {} temporary names)".format(self.rename_count, self.files_touched, len(self.temp_names))
+
+    @property
+    def rename_count(self):
+        """The amount of recorded renames."""
+        return len(self.operations)
+
+    @property
+    def files_touched(self):
+        """The amount of different files that have been renamed at least once."""
+        return len(self._current_names)
+
+    def rename(self, old_name, new_name):
+        """Record a rename."""
+        super().rename(old_name, new_name)
+        self.operations.append((old_name, new_name))
+
+    def exchange(self, name1, name2):
+        """Record an exchange."""
+        super().exchange(name1, name2)
+        self.operations.append(RenamePlan.Exchange(name1, name2))
+
+    def record_plan(self, plan):
+        """Record the operations of the given RenamePlan, as if it had been executed."""
+        start = len(self.operations)
+        for operation in plan.operations:
+            RenamePlan.perform_operation(operation, self.rename, self.exchange)
+        self.temp_names.extend(plan.temp_names)
+
+        if plan.max_workers > 1:
+            self._concurrent_plans.append((start, len(self.operations)))
+
+    def holds(self, file_name):
+        if super().holds(file_name):
+            return True
+        elif file_name in self._current_names:
+            return False # renamed away within the recording
+        return self.parent_batch is not None and self.parent_batch.holds(file_name)
+
+    def renamed_away(self, file_name):
+        if super().renamed_away(file_name):
+            return True
+        elif super().holds(file_name):
+            return False
+        return self.parent_batch is not None and self.parent_batch.renamed_away(file_name)
+
+    def apply_to(self, file_names):
+        if self.parent_batch is not None:
+            file_names = self.parent_batch.apply_to(file_names)
+        return super().apply_to(file_names)
+
+    def commit(self, rename_function, max_workers=1, journal=None, exchange_function=None, file_exists=None):
+        raise TypeError("A RenameRecording can't be committed.")
+
+    def estimate_duration(self, rename_latency=1):
+        """
+        Estimate how long performing the recorded renames would take.
+
+        Renames of RenamePlans that would be performed concurrently count as many renames in a row as their
+        dependencies require (see RenameScheduler.count_steps), all other renames count one by one.
+
+        @param rename_latency: The time a single rename takes (default: 1, i.e. return the amount of renames in a row)
+        """
+        scheduler = RenameScheduler(self.max_workers)
+        steps = len(self.operations)
+        for start, end in self._concurrent_plans:
+            steps -= end - start
+            steps += scheduler.count_steps(RenamePlan.find_dependencies(self.operations[start:end]))
+
+        return steps * rename_latency
@@ -0,0 +1,106 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from os import cpu_count, scandir, stat
+from os.path import abspath, join
+
+from FileNameCompiler import FileNameCompiler
+from FileSet import FileSet
+from FilesDict import CompactFilesDict
+
+
+class TreeDetector():
+    """
+    Detect the file sets of every directory within a directory tree, fanning the directories out over a pool of worker processes.
+
+    Every worker lists a single directory and compiles its file names in one pass (see FileNameCompiler).
+    It sends back the compiled files of every file set in the array representation of a CompactFilesDict (see to_arrays),
+    which costs about a dozen bytes per file to transfer, along with the sub directories it has found. These are handed
+    out to the workers right away, so the tree is detected while it is being walked, and every directory is only listed once.
+    Symbolic links to directories are not followed.
+
+    The detected FileSets refer to their files by name, like FileSets detected within the working directory.
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        Create a detector.
+
+        @param max_workers: The amount of worker processes (default: the amount of CPUs). If it is 1, the directories are detected within the process itself.
+        """
+        self.max_workers = max_workers or cpu_count() or 1
+
+    def __repr__(self):
+        return "TreeDetector(max_workers={})".format(self.max_workers)
+
+    def detect(self, root, registry=None):
+        """
+        Detect the file sets of the given directory and all of its sub directories.
+
+        @param root: The path of the directory tree's root
+        @param registry: An optional DirectoryRegistry to store the file sets of every directory in, along with the modification time the directory had when it was listed (default: None)
+
+        @return: A dictionary mapping the absolute path of every directory containing file sets to the list of its FileSets; directories that can't be listed are left out
+        """
+        file_sets = {}
+        for directory, mtime, compiled_sets, _ in self._detect_all(abspath(root)):
+            if not compiled_sets:
+                continue
+
+            directory_sets = [FileSet(pattern, CompactFilesDict.from_arrays(*arrays), file_list_compiled=True, compact_files=True) for pattern, arrays in compiled_sets]
+            file_sets[directory] = directory_sets
+            if registry is not None:
+                registry.store(directory, directory_sets, mtime)
+
+        return file_sets
+
+    def _detect_all(self, root):
+        """Generate the result of _detect_directory for every directory within the tree, in the order they are detected."""
+        if self.max_workers == 1:
+            pending_directories = [root]
+            while pending_directories:
+                result = self._detect_directory(pending_directories.pop())
+                pending_directories.extend(result[3])
+                yield result
+            return
+
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            pending_futures = {executor.submit(self._detect_directory, root)}
+            while pending_futures:
+                done_futures, pending_futures = wait(pending_futures, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    result = future.result()
+                    pending_futures.update(executor.submit(self._detect_directory, sub_directory) for sub_directory in result[3])
+                    yield result
+
+    @staticmethod
+    def _detect_directory(directory):
+        """
+        List the given directory and compile the file sets within it. This runs within a worker process.
+
+        @param directory: The absolute path of the directory
+
+        @return: A 4-tuple consisting of the following:
+            - The path of the directory
+            - Its modification time in nanoseconds before it was listed; None if it can't be listed
+            - A list of (pattern, arrays) 2-tuples, whereas arrays is the representation of the set's files returned by CompactFilesDict.to_arrays
+            - The list of the paths of its sub directories
+        """
+        file_names = []
+        sub_directories = []
+        try:
+            mtime = stat(directory).st_mtime_ns
+            with scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        file_names.append(entry.name)
+                    elif entry.is_dir(follow_symlinks=False):
+                        sub_directories.append(join(directory, entry.name))
+        except OSError:
+            return directory, None, [], []
+
+        compiled_sets = [(pattern, CompactFilesDict(files).to_arrays()) for pattern, files in FileNameCompiler.compile_file_names(file_names).items()]
+        return directory, mtime, compiled_sets, sub_directories
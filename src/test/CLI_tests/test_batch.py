@@ -0,0 +1,80 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from FileSet import FileSet
+import CLI
+
+
+mock_begin_batch = mock.MagicMock(name='begin_batch')
+mock_commit_batch = mock.MagicMock(name='commit_batch')
+mock_in_batch_mode = mock.MagicMock(name='in_batch_mode')
+
+@mock.patch('FileSet.FileSet.begin_batch', new=mock_begin_batch)
+@mock.patch('FileSet.FileSet.commit_batch', new=mock_commit_batch)
+@mock.patch('FileSet.FileSet.in_batch_mode', new=mock_in_batch_mode)
+class BatchTests(unittest.TestCase):
+
+    def tearDown(self):
+        mock_begin_batch.reset_mock()
+        mock_commit_batch.reset_mock()
+        mock_in_batch_mode.reset_mock()
+
+        mock_commit_batch.side_effect = None
+
+    def test_batch(self):
+        """The method should enter batch mode."""
+        mock_in_batch_mode.return_value = False
+
+        CLI.batch(None, ['batch'])
+
+        mock_begin_batch.assert_called_once_with()
+
+    def test_batch_already_active(self):
+        """The method should raise an error if batch mode is already active."""
+        mock_in_batch_mode.return_value = True
+
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to recognize that batch mode is already active."):
+            CLI.batch(None, ['batch'])
+
+        mock_begin_batch.assert_not_called()
+
+    def test_commit(self):
+        """The method should commit the active batch."""
+        mock_in_batch_mode.return_value = True
+
+        CLI.commit(None, ['commit'])
+
+        mock_commit_batch.assert_called_once_with()
+
+    def test_commit_without_batch(self):
+        """The method should raise an error if batch mode is not active."""
+        mock_in_batch_mode.return_value = False
+
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to recognize that batch mode is not active."):
+            CLI.commit(None, ['commit'])
+
+        mock_commit_batch.assert_not_called()
+
+    def test_failing_commit(self):
+        """The method should turn a failing rename into a CLIRuntimeError."""
+        mock_in_batch_mode.return_value = True
+        mock_commit_batch.side_effect = CLI.RenamePlan.RenameError('a', 'b', "The file 'a' could not be renamed to 'b'.")
+
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to report a failing rename."):
+            CLI.commit(None, ['commit'])
+
+    def test_too_many_arguments(self):
+        """The methods should raise an error if they are given any arguments."""
+        with self.assertRaises(CLI.ArgumentAmountError, msg="The batch method fails to recognize too many arguments."):
+            CLI.batch(None, ['batch', 'now'])
+
+        with self.assertRaises(CLI.ArgumentAmountError, msg="The commit method fails to recognize too many arguments."):
+            CLI.commit(None, ['commit', 'now'])
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,183 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import io
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+import CLI
+from RenameJournal import RenameJournal
+from RenamePlan import RenamePlan
+
+
+class ChangeDirectoryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_directory = os.getcwd()
+        self.temp_directories = [tempfile.TemporaryDirectory(), tempfile.TemporaryDirectory()]
+        self.paths = [os.path.realpath(temp_directory.name) for temp_directory in self.temp_directories]
+        for path, pattern in zip(self.paths, ('first ({}).jpg', 'second ({}).jpg')):
+            for i in range(3):
+                open(os.path.join(path, pattern.format(i)), 'w').close()
+
+        CLI.file_set_cache = []
+        CLI.directory_registry.clear()
+        os.chdir(self.paths[0])
+        CLI.detect_file_sets()
+
+    def tearDown(self):
+        os.chdir(self.previous_directory)
+        for temp_directory in self.temp_directories:
+            temp_directory.cleanup()
+
+        CLI.file_set_cache = []
+        CLI.file_set_cache_mtime = None
+        CLI.active_file_set = None
+        CLI.default_remove_set = None
+        CLI.directory_registry.clear()
+
+    def test_change_directory(self):
+        """The method should change into the given directory, detect its file sets and leave the active file set."""
+        CLI.active_file_set = CLI.file_set_cache[0]
+
+        CLI.change_directory(None, ['cd', self.paths[1]])
+
+        self.assertEqual(os.getcwd(), self.paths[1], "The method fails to change the working directory.")
+        self.assertEqual([file_set.pattern for file_set in CLI.file_set_cache], [('second (', ')')], "The method fails to detect the file sets of the new directory.")
+        self.assertIsNone(CLI.active_file_set, "The method keeps the active file set of the previous directory.")
+
+    def test_restore_file_sets(self):
+        """The method should restore the file sets of a previously visited directory instead of detecting them again."""
+        first_sets = CLI.file_set_cache
+
+        CLI.change_directory(None, ['cd', self.paths[1]])
+        with mock.patch('CLI.os.scandir') as mock_scandir:
+            CLI.change_directory(None, ['cd', self.paths[0]])
+
+        mock_scandir.assert_not_called()
+        self.assertEqual(len(CLI.file_set_cache), 1, "The method fails to restore the file sets.")
+        self.assertIs(CLI.file_set_cache[0], first_sets[0], "The method fails to restore the very same file sets.")
+
+    def test_changed_directory(self):
+        """The method should detect the file sets of a previously visited directory again if it has changed since."""
+        first_sets = CLI.file_set_cache
+
+        CLI.change_directory(None, ['cd', self.paths[1]])
+        mtime = os.stat(self.paths[0]).st_mtime_ns
+        open(os.path.join(self.paths[0], 'first (3).jpg'), 'w').close()
+        os.utime(self.paths[0], ns=(mtime, mtime + 10**9))
+        CLI.change_directory(None, ['cd', self.paths[0]])
+
+        self.assertIsNot(CLI.file_set_cache[0], first_sets[0], "The method restores the file sets of a changed directory.")
+        self.assertEqual(len(CLI.file_set_cache[0]), 4, "The method fails to detect the changed file sets.")
+
+    def test_changed_before_leaving(self):
+        """The method should not restore file sets that were outdated already when their directory was left."""
+        first_sets = CLI.file_set_cache
+
+        mtime = os.stat(self.paths[0]).st_mtime_ns
+        open(os.path.join(self.paths[0], 'first (3).jpg'), 'w').close()
+        os.utime(self.paths[0], ns=(mtime, mtime + 10**9))
+        CLI.change_directory(None, ['cd', self.paths[1]])
+        CLI.change_directory(None, ['cd', self.paths[0]])
+
+        self.assertIsNot(CLI.file_set_cache[0], first_sets[0], "The method restores file sets that were outdated when their directory was left.")
+        self.assertEqual(len(CLI.file_set_cache[0]), 4, "The method fails to detect the changed file sets.")
+
+    def test_restore_after_own_operation(self):
+        """The method should restore the file sets of a directory changed by an action performed on them."""
+        first_sets = CLI.file_set_cache
+        mtime = os.stat(self.paths[0]).st_mtime_ns
+
+        def touch_directory(_):
+            os.utime(self.paths[0], ns=(mtime, mtime + 10**9))
+        with mock.patch('CLI.determine_and_perform_action', side_effect=touch_directory):
+            CLI.perform_action(['move'])
+        CLI.change_directory(None, ['cd', self.paths[1]])
+        CLI.change_directory(None, ['cd', self.paths[0]])
+
+        self.assertIs(CLI.file_set_cache[0], first_sets[0], "The method fails to restore the file sets after an action performed on them.")
+
+    def test_outdated_before_own_operation(self):
+        """The method should not restore file sets whose directory had been changed by someone else before an action was performed."""
+        first_sets = CLI.file_set_cache
+        mtime = os.stat(self.paths[0]).st_mtime_ns
+        open(os.path.join(self.paths[0], 'first (3).jpg'), 'w').close()
+        os.utime(self.paths[0], ns=(mtime, mtime + 10**9))
+
+        def touch_directory(_):
+            os.utime(self.paths[0], ns=(mtime, mtime + 2 * 10**9))
+        with mock.patch('CLI.determine_and_perform_action', side_effect=touch_directory):
+            CLI.perform_action(['move'])
+        self.assertIsNone(CLI.file_set_cache_mtime, "The action keeps outdated file sets marked as current.")
+        CLI.change_directory(None, ['cd', self.paths[1]])
+        CLI.change_directory(None, ['cd', self.paths[0]])
+
+        self.assertIsNot(CLI.file_set_cache[0], first_sets[0], "The method restores file sets that were outdated before the action.")
+
+    def _interrupt(self, directory, name_mapping, performed_count):
+        """Start executing a plan of the given mapping within the given directory with a journal and stop after performed_count renames, as if the process had died."""
+        plan = RenamePlan(name_mapping)
+        journal = RenameJournal(directory)
+        journal.write_ahead(plan)
+
+        tracked_rename = journal.track(lambda old_name, new_name: os.rename(os.path.join(directory, old_name), os.path.join(directory, new_name)))
+        for old_name, new_name in plan.operations[:performed_count]:
+            tracked_rename(old_name, new_name)
+        journal._file.close()
+
+    def test_recover_interrupted_operation(self):
+        """The method should complete an operation that has been interrupted within the new directory before detecting its file sets."""
+        self._interrupt(self.paths[1], {'second (1).jpg': 'second (5).jpg', 'second (2).jpg': 'second (6).jpg'}, 1)
+
+        with mock.patch('sys.stdout', new=io.StringIO()):
+            CLI.change_directory(None, ['cd', self.paths[1]])
+
+        self.assertFalse(RenameJournal.is_pending(self.paths[1]), "The method fails to recover the interrupted operation.")
+        self.assertEqual(dict(CLI.file_set_cache[0].files), {0: ['jpg'], 5: ['jpg'], 6: ['jpg']}, "The method detects the files before completing the interrupted operation.")
+
+    def test_unrecoverable_operation(self):
+        """The method should stay in the current directory if an interrupted operation within the new one can't be recovered."""
+        self._interrupt(self.paths[1], {'second (1).jpg': 'second (5).jpg', 'second (2).jpg': 'second (6).jpg'}, 1)
+        os.remove(os.path.join(self.paths[1], 'second (2).jpg'))
+
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to report the unrecoverable operation."):
+            CLI.change_directory(None, ['cd', self.paths[1]])
+
+        self.assertEqual(os.getcwd(), self.paths[0], "The method changes into a directory with an unrecoverable operation.")
+        self.assertEqual([file_set.pattern for file_set in CLI.file_set_cache], [('first (', ')')], "The method drops the file sets of the current directory.")
+
+    def test_print_directory(self):
+        """The method should print the working directory if no directory is given."""
+        with mock.patch('sys.stdout', new=io.StringIO()) as fake_out:
+            CLI.change_directory(None, ['cd'])
+
+        self.assertEqual(fake_out.getvalue().strip(), self.paths[0], "The method fails to print the working directory.")
+
+    def test_invalid_directory(self):
+        """The method should raise an error and keep the working directory if the given directory can't be entered."""
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to raise an error for a missing directory."):
+            CLI.change_directory(None, ['cd', os.path.join(self.paths[0], 'missing')])
+
+        self.assertEqual(os.getcwd(), self.paths[0], "The method changes the working directory even though the given one can't be entered.")
+
+    def test_batch_mode(self):
+        """The method should refuse to change the directory while in batch mode, since the pending renames refer to the working directory."""
+        with mock.patch('FileSet.FileSet.in_batch_mode', return_value=True):
+            with self.assertRaises(CLI.CLIRuntimeError, msg="The method changes the directory in batch mode."):
+                CLI.change_directory(None, ['cd', self.paths[1]])
+
+        self.assertEqual(os.getcwd(), self.paths[0], "The method changes the working directory in batch mode.")
+
+    def test_too_many_args(self):
+        """The method should raise an error if more than one directory is given."""
+        with self.assertRaises(CLI.ArgumentAmountError, msg="The method fails to raise an error for too many arguments."):
+            CLI.change_directory(None, ['cd', self.paths[0], self.paths[1]])
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
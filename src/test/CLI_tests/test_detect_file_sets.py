@@ -5,7 +5,7 @@ Created on 02.09.2018
 '''
 import unittest
 import unittest.mock as mock
-from test.testing_tools import mock_scandir_gen, mock_assert_msg, mock_assert_many_msg
+from test.testing_tools import mock_scandir_gen, mock_assert_msg, mock_assert_many_msg, KeywordArgTuple
 import CLI
 from CLI import detect_file_sets
 
@@ -31,7 +31,7 @@ class DetectFileSetsTests(unittest.TestCase): #TODO: this doesn't actually test
         
         mock_assert_msg(
                 mock_FileSet.assert_called_once_with, 
-                [('test (', ')'), ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg']],
+                [('test (', ')'), {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 3: ['jpg'], 4: ['jpg']}, KeywordArgTuple('file_list_compiled', True)],
                 "The CLI fails to find a lonely file set in a directory."""
             )
     
@@ -46,7 +46,7 @@ class DetectFileSetsTests(unittest.TestCase): #TODO: this doesn't actually test
         
         mock_assert_msg(
                 mock_FileSet.assert_called_once_with, 
-                [('test (', ')'), ['test (0).gif', 'test (1).mp4', 'test (2).pdf', 'test (3).gif', 'test (4).m4a', 'test (5).jpg', 'test (6).m4a', 'test (7).mp4']],
+                [('test (', ')'), {0: ['gif'], 1: ['mp4'], 2: ['pdf'], 3: ['gif'], 4: ['m4a'], 5: ['jpg'], 6: ['m4a'], 7: ['mp4']}, KeywordArgTuple('file_list_compiled', True)],
                 "The CLI fails to find the correct files and the correct file set if there are dirt files around."
             )
     
@@ -60,10 +60,10 @@ class DetectFileSetsTests(unittest.TestCase): #TODO: this doesn't actually test
         detect_file_sets()
         
         assertion_calls = [
-                (mock_FileSet.assert_any_call, [('test (', ')'),    ['test (0).gif', 'test (1).mp4', 'test (2).pdf', 'test (3).gif', 'test (4).m4a', 'test (5).jpg', 'test (6).m4a', 'test (7).mp4']]),
-                (mock_FileSet.assert_any_call, [('TEPPYZG', 'M'),   ['TEPPYZG09M.png']]),
-                (mock_FileSet.assert_any_call, [('dirt', ''),       ['dirt41.gif', 'dirt90.m4a']]),
-                (mock_FileSet.assert_any_call, [('V', 'zC'),        ['V57zC.pdf']])
+                (mock_FileSet.assert_any_call, [('test (', ')'),    {0: ['gif'], 1: ['mp4'], 2: ['pdf'], 3: ['gif'], 4: ['m4a'], 5: ['jpg'], 6: ['m4a'], 7: ['mp4']}, KeywordArgTuple('file_list_compiled', True)]),
+                (mock_FileSet.assert_any_call, [('TEPPYZG', 'M'),   {9: ['png']}, KeywordArgTuple('file_list_compiled', True)]),
+                (mock_FileSet.assert_any_call, [('dirt', ''),       {41: ['gif'], 90: ['m4a']}, KeywordArgTuple('file_list_compiled', True)]),
+                (mock_FileSet.assert_any_call, [('V', 'zC'),        {57: ['pdf']}, KeywordArgTuple('file_list_compiled', True)])
             ]
         mock_assert_many_msg(assertion_calls, "The CLI fails to find all existent FileSets in a directory.")
     
@@ -77,7 +77,7 @@ class DetectFileSetsTests(unittest.TestCase): #TODO: this doesn't actually test
         
         mock_assert_msg(
                 mock_FileSet.assert_called_once_with,
-                [('test (', ')'), ['test (0).mp4', 'test (1).png', 'test (2).gif', 'test (3).tar.gz', 'test (4).p.n.g', 'test (5).jp.gz']],
+                [('test (', ')'), {0: ['mp4'], 1: ['png'], 2: ['gif'], 3: ['tar.gz'], 4: ['p.n.g'], 5: ['jp.gz']}, KeywordArgTuple('file_list_compiled', True)],
                 "The CLI fails to deal with files that have a multi-extension."
             )
         
@@ -91,7 +91,7 @@ class DetectFileSetsTests(unittest.TestCase): #TODO: this doesn't actually test
         
         mock_assert_msg(
                 mock_FileSet.assert_called_once_with,
-                [('.hidden', ''), ['.hidden0.jpg', '.hidden1.jpg', '.hidden2.jpg', '.hidden3.jpg', '.hidden4.jpg']],
+                [('.hidden', ''), {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 3: ['jpg'], 4: ['jpg']}, KeywordArgTuple('file_list_compiled', True)],
                 "The CLI fails to detect and create a hidden file set (i.e. one which's pattern starts with a dot)."
             )
         
@@ -105,12 +105,26 @@ class DetectFileSetsTests(unittest.TestCase): #TODO: this doesn't actually test
         detect_file_sets() 
         
         assertion_calls = [
-                (mock_FileSet.assert_any_call, [('test (', ')'), ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg']]),
-                (mock_FileSet.assert_any_call, [('RMVD', ''), ['RMVD0.jpg', 'RMVD1.jpg', 'RMVD2.jpg', 'RMVD3.jpg']])
+                (mock_FileSet.assert_any_call, [('test (', ')'), {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 3: ['jpg']}, KeywordArgTuple('file_list_compiled', True)]),
+                (mock_FileSet.assert_any_call, [('RMVD', ''), {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 3: ['jpg']}, KeywordArgTuple('file_list_compiled', True)])
             ]
         mock_assert_many_msg(assertion_calls, "The CLI fails to recognize and create the two file sets.")
         
         self.assertNotEqual(CLI.default_remove_set, None, "The CLI fails to recognize and set the default remove set after stumbling upon it.")
+        
+    def test_compiled_files(self):
+        """The CLI should compile the files of a set while detecting it, including multi-assigned indexes and files without extension."""
+        test_files = [('test (1).jpg', True), ('test (2)', True), ('test (1).png', True), ('test (3).tar.gz', True), ('test (4).jpg', False)]
+        
+        mock_scandir.return_value = mock_scandir_gen(test_files)
+        
+        detect_file_sets()
+        
+        mock_assert_msg(
+                mock_FileSet.assert_called_once_with,
+                [('test (', ')'), {1: ['jpg', 'png'], 2: [''], 3: ['tar.gz']}, KeywordArgTuple('file_list_compiled', True)],
+                "The CLI fails to compile the detected files correctly."
+            )
 
 
 if __name__ == "__main__":
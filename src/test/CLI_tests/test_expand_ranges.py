@@ -0,0 +1,43 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+from CLI import _expand_ranges, RangeExpansionError
+from IntervalSet import IntervalSet
+
+
+class ExpandRangesTests(unittest.TestCase):
+
+    def test_single_range(self):
+        """The CLI should convert a single range into an IntervalSet of one run."""
+        self.assertEqual(_expand_ranges(['3-1']), IntervalSet([(1, 3)]), "The CLI fails to expand a single range.")
+
+    def test_comma_separated_ranges(self):
+        """The CLI should be able to process several ranges joined by commas."""
+        self.assertEqual(_expand_ranges(['1-3,7,9-12']), IntervalSet([(1, 3), (7, 7), (9, 12)]), "The CLI fails to expand comma-separated ranges.")
+
+    def test_several_arguments(self):
+        """The CLI should merge the ranges of several arguments, including overlapping ones."""
+        self.assertEqual(_expand_ranges(['5-8', '1,2', '7-10']), IntervalSet([(1, 2), (5, 10)]), "The CLI fails to merge the ranges of several arguments.")
+
+    def test_huge_range(self):
+        """The CLI should expand a huge range without expanding it into single indexes."""
+        index_set = _expand_ranges(['0-5000000000'])
+
+        self.assertEqual(index_set.runs, [(0, 5000000000)], "The CLI fails to expand a huge range.")
+        self.assertEqual(len(index_set), 5000000001, "The expanded huge range doesn't cover all of its indexes.")
+
+    def test_invalid_range(self):
+        """The CLI should recognize an invalid range among several ranges and raise an error."""
+        with self.assertRaises(RangeExpansionError, msg="The CLI fails to recognize an invalid range among comma-separated ranges."):
+            _expand_ranges(['1-3,a'])
+
+        with self.assertRaises(RangeExpansionError, msg="The CLI fails to recognize an empty range among comma-separated ranges."):
+            _expand_ranges(['1-3,'])
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -77,6 +77,17 @@ class ListFilesTests(unittest.TestCase):
         expected_string = ', '.join(expected_print_list)
         mock_assert_msg(mock_print.assert_called_once_with, [expected_string], "The CLI fails to list the files and gaps of a file set while marking those that share multi-assigned indexes.")
     
+    def test_wide_gaps(self):
+        """The CLI should list a gap that is wider than GAP_PRINT_LIMIT as a single entry giving its range."""
+        test_files = ['test (0).jpg', 'test (4).jpg', 'test (20240101120000).jpg', 'test (20240101120000).png']
+        test_set = FileSet(self.pattern, test_files)
+        
+        list_files(test_set, '')
+        
+        expected_print_list = ['test (0).jpg', 'G', 'G', 'G', 'test (4).jpg', 'G (5-20240101119999)', '[//: test (20240101120000).jpg', 'test (20240101120000).png :\\\\]']
+        expected_string = ', '.join(expected_print_list)
+        mock_assert_msg(mock_print.assert_called_once_with, [expected_string], "The CLI fails to list the wide gaps of a file set as single entries.")
+    
     def test_no_set_selected(self):
         """The CLI should be able to recognize and raise an error if no file set is selected."""
         with self.assertRaises(CLIRuntimeError, msg="The CLI fails to recognize and raise an error when no file set has been selected."):
@@ -6,6 +6,7 @@ Created on 05.09.2018
 import unittest
 import unittest.mock as mock
 from FileSet import FileSet
+from IntervalSet import IntervalSet
 from CLI import move, CLIRuntimeError, SpotExpansionError,\
     RangeExpansionError, ArgumentAmountError, InputProcessingError
 from test.testing_tools import mock_assert_msg, KeywordArgTuple
@@ -41,7 +42,7 @@ class MoveTests(unittest.TestCase):
         
         move(self.test_set, test_args)
         
-        mock_assert_msg(mock_move_files.assert_called_once_with, [(3, 5), (1, 2)], "The CLI fails to perform a movement operation with valid arguments.")
+        mock_assert_msg(mock_move_files.assert_called_once_with, [IntervalSet([(3, 5)]), (1, 2)], "The CLI fails to perform a movement operation with valid arguments.")
     
     def test_valid_single_file_range(self):
         """The CLI should be able to perform a movement operation given a single-file range."""
@@ -51,7 +52,7 @@ class MoveTests(unittest.TestCase):
         
         move(self.test_set, test_args)
         
-        mock_assert_msg(mock_move_files.assert_called_once_with, [(3, 3), (1, 2)], "The CLI fails to perform a movement operation with a valid single-file range.")
+        mock_assert_msg(mock_move_files.assert_called_once_with, [IntervalSet([(3, 3)]), (1, 2)], "The CLI fails to perform a movement operation with a valid single-file range.")
         
     def test_invalid_range(self):
         """The CLI should recognize an invalid range and raise an error."""
@@ -115,7 +116,7 @@ class MoveTests(unittest.TestCase):
         
         move(self.test_set, test_args)
         
-        mock_assert_msg(mock_move_files.assert_called_once_with, [(2, 3), (4, 5), KeywordArgTuple('strip_gaps', True)], "The CLI fails to provide access to the gap-handling option strip_gaps.")
+        mock_assert_msg(mock_move_files.assert_called_once_with, [IntervalSet([(2, 3)]), (4, 5), KeywordArgTuple('strip_gaps', True)], "The CLI fails to provide access to the gap-handling option strip_gaps.")
         
     def test_kwarg_preserve_gaps(self):
         """The CLI should enable the user to choose preserve_gaps as a gap handling method."""
@@ -125,7 +126,7 @@ class MoveTests(unittest.TestCase):
         
         move(self.test_set, test_args)
         
-        mock_assert_msg(mock_move_files.assert_called_once_with, [(2, 3), (4, 5), KeywordArgTuple('preserve_gaps', True)], "The CLI fails to provide access to the gap-handling option strip_gaps.")
+        mock_assert_msg(mock_move_files.assert_called_once_with, [IntervalSet([(2, 3)]), (4, 5), KeywordArgTuple('preserve_gaps', True)], "The CLI fails to provide access to the gap-handling option strip_gaps.")
 
     def test_invalid_kwarg_gap_handler(self):
         """The CLI should recognize and raise an error if an invalid gap-handling option was chosen."""
@@ -0,0 +1,78 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import io
+import unittest
+import unittest.mock as mock
+from FileSet import FileSet
+import CLI
+
+
+mock_rename = mock.MagicMock(name='rename')
+
+@mock.patch('FileSet.rename', new=mock_rename)
+class PlanTests(unittest.TestCase):
+
+    def setUp(self):
+        self.test_set = FileSet(('test (', ')'), ['test ({}).jpg'.format(i) for i in range(5)])
+        CLI.file_set_cache = [self.test_set]
+        CLI.active_file_set = self.test_set
+
+    def tearDown(self):
+        mock_rename.reset_mock()
+        CLI.file_set_cache = []
+        CLI.active_file_set = None
+        CLI.default_remove_set = None
+
+    def _plan(self, user_args):
+        with mock.patch('sys.stdout', new=io.StringIO()) as output:
+            CLI.plan(None, user_args)
+        return output.getvalue()
+
+    def test_plan_move(self):
+        """The method should print the renames of the planned operation without performing them or changing the file sets."""
+        output = self._plan(['plan', '4', '>', '0/1'])
+
+        output_lines = output.splitlines()
+        self.assertEqual(output_lines[0], "5 rename(s) of 4 file(s), using 1 temporary name(s). Estimated duration: 5 renames in a row.", "The method doesn't print the statistics of the planned operation.")
+        self.assertEqual(output_lines[2:], ["  test (3).jpg -> test (4).jpg", "  test (2).jpg -> test (3).jpg", "  test (1).jpg -> test (2).jpg",
+                                            "  {} -> test (1).jpg".format(CLI.os.path.join('.fileset_staging', '{}_0'.format(CLI.os.getpid())))], "The method doesn't print the renames of the planned operation.")
+        mock_rename.assert_not_called()
+        self.assertIs(CLI.active_file_set, self.test_set, "The method doesn't restore the active file set.")
+        self.assertIs(CLI.file_set_cache[0], self.test_set, "The method doesn't restore the cached file sets.")
+        self.assertEqual(self.test_set.files, {i: ['jpg'] for i in range(5)}, "The method changes the file set.")
+        self.assertFalse(FileSet.in_batch_mode(), "The method keeps recording renames.")
+
+    def test_plan_remove(self):
+        """The method should not keep a file set created by the planned operation."""
+        with mock.patch('FileSet.scandir', new=mock.MagicMock(return_value=iter([]))):
+            self._plan(['plan', '-', '0'])
+
+        mock_rename.assert_not_called()
+        self.assertEqual(CLI.file_set_cache, [self.test_set], "The method keeps the file set created by the planned operation.")
+        self.assertIsNone(CLI.default_remove_set, "The method keeps the remove set created by the planned operation.")
+
+    def test_print_limit(self):
+        """The method should only print the first PLAN_PRINT_LIMIT renames."""
+        self.test_set = FileSet(('test (', ')'), ['test ({}).jpg'.format(i) for i in range(100)])
+        CLI.file_set_cache = [self.test_set]
+        CLI.active_file_set = self.test_set
+
+        output = self._plan(['plan', '99', '>', '-1/0'])
+
+        self.assertEqual(len(output.splitlines()), CLI.PLAN_PRINT_LIMIT + 2, "The method doesn't limit the amount of printed renames.")
+        self.assertTrue(output.endswith(".. and 51 more\n"), "The method doesn't state the amount of renames that have not been printed.")
+
+    def test_invalid_operation(self):
+        """The method should raise an error if no operation or a command that doesn't rename files is given."""
+        with self.assertRaises(CLI.ArgumentAmountError, msg="The method fails to recognize a missing operation."):
+            CLI.plan(None, ['plan'])
+
+        with self.assertRaises(CLI.InputProcessingError, msg="The method fails to recognize a command that can't be planned."):
+            CLI.plan(None, ['plan', 'commit'])
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
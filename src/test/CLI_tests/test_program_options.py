@@ -0,0 +1,78 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+import CLI
+from FileSet import FileSet
+
+
+class ProgramOptionsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory_registry = CLI.directory_registry
+
+    def tearDown(self):
+        FileSet.journal_renames = False
+        CLI.file_set_catalog = None
+        CLI.directory_registry = self.directory_registry
+
+    def test_journal(self):
+        """The method should enable journaling the renames."""
+        CLI.apply_program_options(['--journal'])
+
+        self.assertTrue(FileSet.journal_renames, "The method fails to enable journaling the renames.")
+        self.assertIsNone(CLI.file_set_catalog, "The method uses a catalog that has not been asked for.")
+
+    def test_catalog_path(self):
+        """The method should load the catalog of the given path."""
+        with mock.patch('FileSetCatalog.FileSetCatalog') as mock_catalog:
+            CLI.apply_program_options(['--catalog', 'sets.db'])
+
+        mock_catalog.assert_called_once_with('sets.db')
+        self.assertIs(CLI.file_set_catalog, mock_catalog.return_value, "The method fails to load the catalog.")
+        self.assertFalse(FileSet.journal_renames, "The method enables journaling the renames without being asked to.")
+
+    def test_any_order(self):
+        """The method should accept the options in any order."""
+        with mock.patch('FileSetCatalog.FileSetCatalog') as mock_catalog:
+            CLI.apply_program_options(['--catalog', '--journal'])
+
+        mock_catalog.assert_called_once_with(None)
+        self.assertTrue(FileSet.journal_renames, "The method fails to enable journaling the renames after the catalog option.")
+
+        FileSet.journal_renames = False
+        with mock.patch('FileSetCatalog.FileSetCatalog') as mock_catalog:
+            CLI.apply_program_options(['--catalog', 'sets.db', '--journal'])
+
+        mock_catalog.assert_called_once_with('sets.db')
+        self.assertTrue(FileSet.journal_renames, "The method fails to enable journaling the renames after the catalog path.")
+
+    def test_registry_memory(self):
+        """The method should bound the directory registry to the given amount of megabytes."""
+        CLI.apply_program_options(['--registry-memory', '16', '--journal'])
+
+        self.assertEqual(CLI.directory_registry.max_memory, 16 * 1024**2, "The method fails to bound the directory registry.")
+        self.assertTrue(FileSet.journal_renames, "The method fails to apply the option after the registry memory.")
+
+    def test_invalid_registry_memory(self):
+        """The method should raise an error if the registry memory is missing, not an integer or negative."""
+        with self.assertRaises(CLI.InputProcessingError, msg="The method accepts a missing registry memory."):
+            CLI.apply_program_options(['--registry-memory'])
+        with self.assertRaises(CLI.InputProcessingError, msg="The method accepts an invalid registry memory."):
+            CLI.apply_program_options(['--registry-memory', 'much'])
+        with self.assertRaises(CLI.InputProcessingError, msg="The method accepts a negative registry memory."):
+            CLI.apply_program_options(['--registry-memory', '-1'])
+        self.assertIs(CLI.directory_registry, self.directory_registry, "The method replaces the directory registry despite an invalid memory.")
+
+    def test_unknown_option(self):
+        """The method should raise an error for an unknown option."""
+        with self.assertRaises(CLI.InputProcessingError, msg="The method accepts an unknown option."):
+            CLI.apply_program_options(['--journal', '--verbose'])
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
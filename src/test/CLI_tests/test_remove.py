@@ -8,6 +8,7 @@ import unittest
 from CLI import remove, CLIRuntimeError, ArgumentAmountError, InputProcessingError
 import CLI
 from FileSet import FileSet
+from IntervalSet import IntervalSet
 from test.testing_tools import mock_assert_msg, KeywordArgTuple
 import unittest.mock as mock
 
@@ -46,7 +47,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3], self.default_remove_set], "The CLI fails to perform a simple removal operation.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3)]), self.default_remove_set], "The CLI fails to perform a simple removal operation.")
         
     def test_valid_operation_multi_assigned_indexes(self):
         """The CLI should be able to deal with multi-assigned indexes in a removal operation."""
@@ -61,7 +62,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3], self.default_remove_set], "The CLI fails to perform a removal operation if there are multi-assigned indexes.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3)]), self.default_remove_set], "The CLI fails to perform a removal operation if there are multi-assigned indexes.")
         
     def test_valid_operation_multiple_ranges(self):
         """The CLI should be able to perform a valid removal operation with numerous ranges given."""    
@@ -81,7 +82,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3, 5, 7, 8, 9], self.default_remove_set], "The CLI fails to perform a removal operation with multiple ranges given.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3), (5, 5), (7, 9)]), self.default_remove_set], "The CLI fails to perform a removal operation with multiple ranges given.")
         
     @mock.patch('CLI.FileSet.files_detected')
     @mock.patch('CLI._expand_pattern')
@@ -98,7 +99,7 @@ class RemoveTests(unittest.TestCase):
         remove(self.test_set, test_args)
         
         mock_assert_msg(mock_files_detected.assert_called_once_with, [('custom', 'set')], "The CLI doesn't actually try to properly create the new remove file set.") 
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3], custom_remove_set], "The CLI fails to remove files into a newly created file set.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3)]), custom_remove_set], "The CLI fails to remove files into a newly created file set.")
     
     @mock.patch('CLI.FileSet.files_detected')
     @mock.patch('CLI._expand_pattern')
@@ -132,7 +133,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3], custom_remove_set], "The CLI fails to append the removed files to the existing custom remove set.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3)]), custom_remove_set], "The CLI fails to append the removed files to the existing custom remove set.")
     
     @mock.patch('CLI._expand_pattern')        
     def test_append_custom_remove_set_does_not_exist(self, mock_expand_pattern):
@@ -178,7 +179,7 @@ class RemoveTests(unittest.TestCase):
         except CLIRuntimeError:
             self.fail("The CLI fails to perform a remove operation if it's removing from the default remove set even though a range to append the removed files to is given.")
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[1, 2], custom_remove_set], "The CLI fails to perform a removal operation from the default remove set to a given custom remove set.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(1, 2)]), custom_remove_set], "The CLI fails to perform a removal operation from the default remove set to a given custom remove set.")
         
     def test_no_active_file_set(self):
         """The CLI should raise an error if there is no chosen file set."""
@@ -204,7 +205,7 @@ class RemoveTests(unittest.TestCase):
         remove(self.test_set, test_args)
         
         mock_assert_msg(mock_FileSet.assert_called_once_with, [CLI.DEFAULT_REMOVE_PATTERN, []], "The CLI fails to properly create the default remove set if it doesn't exist already.")
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3], default_remove_set], "The CLI fails to properly remove files if the remove set already contains files.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3)]), default_remove_set], "The CLI fails to properly remove files if the remove set already contains files.")
     
     def test_remove_set_filled(self):
         """The CLI should be able to append files to the remove set even if it already contains files."""
@@ -216,7 +217,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3], default_remove_set], "The CLI fails to properly remove files if the remove set already contains files.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 3)]), default_remove_set], "The CLI fails to properly remove files if the remove set already contains files.")
     
     def test_too_few_arguments(self):
         """The CLI should recognize and raise an error when too few arguments are given."""
@@ -234,7 +235,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3, 4, 5], self.default_remove_set, KeywordArgTuple('strip_gaps', True)], "The CLI fails to provide access to the gap-handling option strip_gaps.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 5)]), self.default_remove_set, KeywordArgTuple('strip_gaps', True)], "The CLI fails to provide access to the gap-handling option strip_gaps.")
         
     def test_kwarg_preserve_gaps(self):
         """The CLI should enable the user to choose preserve_gaps as a gap handling method."""
@@ -243,7 +244,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[2, 3, 4, 5], self.default_remove_set, KeywordArgTuple('preserve_gaps', True)], "The CLI fails to provide access to the gap-handling option preserve_gaps.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 5)]), self.default_remove_set, KeywordArgTuple('preserve_gaps', True)], "The CLI fails to provide access to the gap-handling option preserve_gaps.")
     
     @mock.patch('CLI._expand_pattern')
     def test_gap_handler_and_custom_set_specified(self, mock_expand_pattern):
@@ -259,7 +260,7 @@ class RemoveTests(unittest.TestCase):
         
         remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[1, 2, 3], custom_remove_set, KeywordArgTuple('preserve_gaps', True)], "The CLI fails to correctly remove files into a custom set if a gap-handling strategy is specified")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(1, 3)]), custom_remove_set, KeywordArgTuple('preserve_gaps', True)], "The CLI fails to correctly remove files into a custom set if a gap-handling strategy is specified")
     
     def test_invalid_kwarg_gap_handler(self):
         """The CLI should recognize and raise an error if an invalid gap-handling option was chosen."""
@@ -282,7 +283,17 @@ class RemoveTests(unittest.TestCase):
         with self.assertRaises(CLIRuntimeError, msg="The CLI fails to raise a CLIRuntimeError when encountering gaps without a gap handling strategy."):
             remove(self.test_set, test_args)
         
-        mock_assert_msg(mock_remove_files.assert_called_once_with, [[8, 9, 10, 11], self.default_remove_set], "The CLI doesn't correctly call the FileSet removal method.")
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(8, 11)]), self.default_remove_set], "The CLI doesn't correctly call the FileSet removal method.")
+
+    def test_comma_separated_and_overlapping_ranges(self):
+        """The CLI should merge comma-separated and overlapping ranges into a single IntervalSet."""
+        test_args = ['-', '2-3,5', '3-4']
+        mock_expand_range.side_effect = lambda x: {'2-3': (2, 3), '5': (5, 5), '3-4': (3, 4)}[x]
+        CLI.default_remove_set = self.default_remove_set
+
+        remove(self.test_set, test_args)
+
+        mock_assert_msg(mock_remove_files.assert_called_once_with, [IntervalSet([(2, 5)]), self.default_remove_set], "The CLI fails to merge comma-separated and overlapping ranges.")
 
 
 if __name__ == "__main__":
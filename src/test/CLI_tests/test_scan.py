@@ -0,0 +1,79 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import io
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+import CLI
+
+
+class ScanTests(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_directory = os.getcwd()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self.temp_directory.name)
+        self.sub_directory = os.path.join(self.root, 'sub')
+        os.makedirs(self.sub_directory)
+        for i in range(3):
+            open(os.path.join(self.root, 'first ({}).jpg'.format(i)), 'w').close()
+            open(os.path.join(self.sub_directory, 'second ({}).jpg'.format(i)), 'w').close()
+
+        CLI.directory_registry.clear()
+        os.chdir(self.root)
+
+    def tearDown(self):
+        os.chdir(self.previous_directory)
+        self.temp_directory.cleanup()
+        CLI.file_set_cache = []
+        CLI.file_set_cache_mtime = None
+        CLI.active_file_set = None
+        CLI.default_remove_set = None
+        CLI.directory_registry.clear()
+
+    def test_scan(self):
+        """The method should register the file sets of the sub directories, but not the ones of the working directory."""
+        with mock.patch('sys.stdout', new=io.StringIO()):
+            CLI.scan(None, ['scan', '1'])
+
+        self.assertNotIn(self.root, CLI.directory_registry, "The method registers the file sets of the working directory.")
+        file_sets = CLI.directory_registry.take(self.sub_directory)
+        self.assertEqual([file_set.pattern for file_set in file_sets], [('second (', ')')], "The method fails to register the file sets of the sub directory.")
+
+    def test_changed_after_listing(self):
+        """The method should register the file sets of a sub directory that changes after it was listed as outdated, so changing into it detects them again."""
+        detect_directory = CLI.TreeDetector._detect_directory
+
+        def detect_and_change(directory):
+            result = detect_directory(directory)
+            if directory == self.sub_directory:
+                mtime = os.stat(directory).st_mtime_ns
+                open(os.path.join(directory, 'second (3).jpg'), 'w').close()
+                os.utime(directory, ns=(mtime, mtime + 10**9))
+            return result
+        with mock.patch('sys.stdout', new=io.StringIO()), mock.patch('CLI.TreeDetector._detect_directory', side_effect=detect_and_change):
+            CLI.scan(None, ['scan', '1'])
+        CLI.change_directory(None, ['cd', self.sub_directory])
+
+        self.assertEqual(len(CLI.file_set_cache[0]), 4, "The method registers the file sets of a sub directory as current although it has changed after it was listed.")
+
+    def test_invalid_worker_count(self):
+        """The method should raise an error if the amount of workers is not a positive integer."""
+        with self.assertRaises(CLI.InputProcessingError, msg="The method accepts an invalid amount of workers."):
+            CLI.scan(None, ['scan', 'many'])
+        with self.assertRaises(CLI.InputProcessingError, msg="The method accepts zero workers."):
+            CLI.scan(None, ['scan', '0'])
+
+    def test_too_many_args(self):
+        """The method should raise an error if more than one argument is given."""
+        with self.assertRaises(CLI.ArgumentAmountError, msg="The method fails to raise an error for too many arguments."):
+            CLI.scan(None, ['scan', '1', '2'])
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -60,6 +60,25 @@ class SwitchTests(unittest.TestCase):
         
         mock_assert_msg(mock_switch_file_ranges.assert_not_called, [], "The CLI attempts to perform a switch operation even though a range is invalid.")
         
+    def test_joined_ranges(self):
+        """The CLI should accept ranges joined by commas, like the move and remove operations, as long as they are contiguous."""
+        test_args = ['2,3', '~', '5-6']
+        mock_expand_range.side_effect = lambda x: {'2': (2, 2), '3': (3, 3), '5-6': (5, 6)}[x]
+        
+        switch(self.test_set, test_args)
+        
+        mock_assert_msg(mock_switch_file_ranges.assert_called_once_with, [(2, 3), (5, 6)], "The CLI fails to merge joined ranges in the switch operation.")
+        
+    def test_non_contiguous_range(self):
+        """The CLI should recognize a range that is not contiguous and raise an error."""
+        test_args = ['2,4', '~', '6']
+        mock_expand_range.side_effect = lambda x: (int(x), int(x))
+        
+        with self.assertRaises(RangeExpansionError, msg="The CLI fails to recognize a range that is not contiguous in the switch operation."):
+            switch(self.test_set, test_args)
+        
+        mock_assert_msg(mock_switch_file_ranges.assert_not_called, [], "The CLI attempts to perform a switch operation even though a range is not contiguous.")
+        
     def test_no_active_file_set(self):
         """The CLI should recognize when no file set is selected and raise an error."""
         test_args = ['2-3', '~', '4-5']
@@ -0,0 +1,82 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import io
+import unittest
+import unittest.mock as mock
+import CLI
+
+
+mock_directory_watcher = mock.MagicMock(name='DirectoryWatcher')
+
+@mock.patch('CLI.DirectoryWatcher', new=mock_directory_watcher)
+class WatchTests(unittest.TestCase):
+
+    def tearDown(self):
+        mock_directory_watcher.reset_mock()
+        mock_directory_watcher.side_effect = None
+        CLI.directory_watcher = None
+        CLI.file_set_cache = []
+
+    def test_watch(self):
+        """The method should start watching the working directory with the cached file sets."""
+        CLI.file_set_cache = ['set1', 'set2']
+
+        CLI.watch(None, ['watch'])
+
+        mock_directory_watcher.assert_called_once_with(CLI.os.getcwd(), ['set1', 'set2'])
+        self.assertIs(CLI.directory_watcher, mock_directory_watcher.return_value, "The method fails to store the started watcher.")
+
+    def test_watch_off(self):
+        """The method should stop watching the directory if 'off' is supplied."""
+        watcher = mock.MagicMock(name='watcher')
+        CLI.directory_watcher = watcher
+
+        CLI.watch(None, ['watch', 'off'])
+
+        watcher.close.assert_called_once_with()
+        self.assertIsNone(CLI.directory_watcher, "The method fails to drop the stopped watcher.")
+
+    def test_watch_twice(self):
+        """The method should raise an error if the directory is already (or not yet) being watched."""
+        CLI.directory_watcher = mock.MagicMock(name='watcher')
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to recognize that the directory is already being watched."):
+            CLI.watch(None, ['watch'])
+
+        CLI.directory_watcher = None
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to recognize that the directory is not being watched."):
+            CLI.watch(None, ['watch', 'off'])
+
+    def test_watch_fails(self):
+        """The method should turn an error starting the watcher into a CLIRuntimeError."""
+        mock_directory_watcher.side_effect = PermissionError(13, "Permission denied")
+
+        with self.assertRaises(CLI.CLIRuntimeError, msg="The method fails to report that the directory can't be watched."):
+            CLI.watch(None, ['watch'])
+
+    def test_invalid_arguments(self):
+        """The method should raise an error if it's given an unknown or too many arguments."""
+        with self.assertRaises(CLI.InputProcessingError, msg="The method fails to recognize an unknown argument."):
+            CLI.watch(None, ['watch', 'on'])
+
+        with self.assertRaises(CLI.ArgumentAmountError, msg="The method fails to recognize too many arguments."):
+            CLI.watch(None, ['watch', 'off', 'now'])
+
+    def test_apply_watched_changes(self):
+        """The cached file sets should be watched and their changes reported to the user."""
+        watcher = mock.MagicMock(name='watcher')
+        watcher.poll.return_value = {'set1': ([(3, 'jpg'), (4, 'jpg')], [(0, 'png')])}
+        CLI.directory_watcher = watcher
+        CLI.file_set_cache = ['set1', 'set2']
+
+        with mock.patch('sys.stdout', new=io.StringIO()) as output:
+            CLI.apply_watched_changes()
+
+        watcher.watch.assert_has_calls([mock.call('set1'), mock.call('set2')])
+        self.assertEqual(output.getvalue(), "The file set 'set1' has changed: 2 file(s) added, 1 file(s) removed.\n", "The changes of the file sets are not reported correctly.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,73 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+from DirectoryRegistry import DirectoryRegistry
+from FileSet import FileSet
+
+
+class DirectoryRegistryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_directories = [tempfile.TemporaryDirectory() for _ in range(3)]
+        self.paths = [temp_directory.name for temp_directory in self.temp_directories]
+        self.file_sets = [[FileSet(('test (', ')'), ['test ({}).jpg'.format(i) for i in range(10)])] for _ in self.paths]
+        self.set_size = DirectoryRegistry.estimate_size(self.file_sets[0])
+
+    def tearDown(self):
+        for temp_directory in self.temp_directories:
+            temp_directory.cleanup()
+
+    def _touch(self, path):
+        """Change the modification time of the given directory, as creating or renaming a file within it would."""
+        mtime = os.stat(path).st_mtime_ns
+        os.utime(path, ns=(mtime, mtime + 10**9))
+
+    def test_store_and_take(self):
+        """The registry should return the stored file sets of an unchanged directory once."""
+        registry = DirectoryRegistry()
+
+        registry.store(self.paths[0], self.file_sets[0])
+
+        self.assertIn(self.paths[0], registry, "The file sets of the directory are not stored.")
+        self.assertIs(registry.take(os.path.join(self.paths[0], '.')), self.file_sets[0], "The stored file sets are not returned.")
+        self.assertIsNone(registry.take(self.paths[0]), "The file sets are returned although they have been taken already.")
+        self.assertEqual(registry.memory_usage, 0, "The memory of the taken file sets is still accounted for.")
+
+    def test_changed_directory(self):
+        """The registry should not return the file sets of a directory that has changed since they were stored."""
+        registry = DirectoryRegistry()
+        registry.store(self.paths[0], self.file_sets[0])
+
+        self._touch(self.paths[0])
+
+        self.assertIsNone(registry.take(self.paths[0]), "The file sets of a changed directory are returned.")
+
+    def test_eviction(self):
+        """The least recently stored file sets should be dropped once the memory cap is exceeded."""
+        registry = DirectoryRegistry(2 * self.set_size)
+
+        for path, file_sets in zip(self.paths, self.file_sets):
+            registry.store(path, file_sets)
+
+        self.assertNotIn(self.paths[0], registry, "The least recently used file sets are not dropped.")
+        self.assertIn(self.paths[1], registry, "File sets are dropped although they fit into the memory cap.")
+        self.assertIn(self.paths[2], registry, "The most recently used file sets are dropped.")
+        self.assertLessEqual(registry.memory_usage, registry.max_memory, "The memory cap is exceeded.")
+
+    def test_too_big(self):
+        """File sets exceeding the memory cap on their own should not be stored at all."""
+        registry = DirectoryRegistry(self.set_size - 1)
+
+        registry.store(self.paths[0], self.file_sets[0])
+
+        self.assertEqual(len(registry), 0, "File sets exceeding the memory cap are stored.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,142 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
+from FileSet import FileSet
+
+
+class DirectorySnapshotTests(unittest.TestCase):
+
+    def setUp(self):
+        DirectorySnapshot.clear_cache()
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temp_directory.name
+        for file_name in ('test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'other.txt'):
+            open(os.path.join(self.directory, file_name), 'w').close()
+        os.mkdir(os.path.join(self.directory, 'test (3).jpg')) # directories are not part of the snapshot
+
+        self.scandir = mock.MagicMock(name='scandir', side_effect=os.scandir)
+
+        self.previous_directory = os.getcwd()
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        os.chdir(self.previous_directory)
+        self.temp_directory.cleanup()
+
+        DirectorySnapshot.clear_cache()
+
+    def _touch_directory(self, mtime_ns):
+        """Set the modification time of the directory, making sure it differs from before regardless of the file system's precision."""
+        os.utime(self.directory, ns=(mtime_ns, mtime_ns))
+
+
+    def test_snapshot_reused(self):
+        """The snapshot of an unchanged directory should be reused instead of scanning the directory again."""
+        snapshot = DirectorySnapshot.of(self.directory, self.scandir)
+        self.assertEqual(set(snapshot.file_names), {'test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'other.txt'}, "The snapshot fails to list the files of the directory.")
+
+        self.assertIs(DirectorySnapshot.of(self.directory, self.scandir), snapshot, "The snapshot is not reused for an unchanged directory.")
+        self.assertEqual(self.scandir.call_count, 1, "The directory is scanned again even though it has not changed.")
+
+    def test_changed_directory(self):
+        """The snapshot should be replaced by a new one once the directory has been changed by someone else."""
+        DirectorySnapshot.of(self.directory, self.scandir)
+
+        open(os.path.join(self.directory, 'test (4).jpg'), 'w').close()
+        self._touch_directory(1)
+
+        snapshot = DirectorySnapshot.of(self.directory, self.scandir)
+        self.assertIn('test (4).jpg', snapshot.file_names, "The snapshot fails to recognize a changed directory.")
+        self.assertEqual(self.scandir.call_count, 2, "The changed directory is not scanned again.")
+
+    def test_own_rename(self):
+        """A rename performed by a FileSet should be applied to the snapshot without scanning the directory again."""
+        DirectorySnapshot.of(self.directory, self.scandir)
+
+        with mock.patch('FileSet.scandir', new=self.scandir):
+            test_set = FileSet.files_detected(('test (', ')'))
+            test_set.change_index(2, 5)
+            detected_set = FileSet.files_detected(('test (', ')'))
+
+        self.assertEqual(detected_set.files, {0: ['jpg'], 1: ['jpg'], 5: ['jpg']}, "The snapshot does not reflect the FileSet's own rename.")
+        self.assertEqual(self.scandir.call_count, 1, "The directory is scanned again after a FileSet's own rename.")
+
+    def test_own_renames_without_stat(self):
+        """The renames of a FileSet should be applied to the snapshot without examining the directory, adopting its modification time once per plan."""
+        stat = mock.MagicMock(name='stat', side_effect=os.stat)
+        DirectorySnapshot.of(self.directory, self.scandir, stat)
+
+        with mock.patch('FileSet.scandir', new=self.scandir):
+            test_set = FileSet.files_detected(('test (', ')'))
+            stat.reset_mock()
+            test_set.move_range((0, 2), 4)
+            self.assertEqual(stat.call_count, 1, "The directory is examined more than once for the renames of a single plan.")
+            detected_set = FileSet.files_detected(('test (', ')'))
+
+        self.assertEqual(detected_set.files, {4: ['jpg'], 5: ['jpg'], 6: ['jpg']}, "The snapshot does not reflect the FileSet's own renames.")
+        self.assertEqual(self.scandir.call_count, 1, "The directory is scanned again after a FileSet's own renames.")
+
+    def test_parallel_renames(self):
+        """Renames performed concurrently by several workers should all be applied to the snapshot, keeping it cached."""
+        for i in range(4, 40):
+            open(os.path.join(self.directory, 'test ({}).jpg'.format(i)), 'w').close()
+        DirectorySnapshot.of(self.directory, self.scandir)
+
+        FileSet.rename_workers = 8
+        try:
+            with mock.patch('FileSet.scandir', new=self.scandir):
+                test_set = FileSet.files_detected(('test (', ')'))
+                test_set.move_range((4, 39), 40)
+                detected_set = FileSet.files_detected(('test (', ')'))
+        finally:
+            FileSet.rename_workers = 1
+
+        self.assertEqual(set(detected_set.files), {0, 1, 2} | set(range(40, 76)), "The snapshot does not reflect all of the concurrent renames.")
+        self.assertEqual(self.scandir.call_count, 1, "The snapshot is dropped after concurrent renames.")
+
+    def test_inodes_follow_renames(self):
+        """The inode numbers of the snapshot should follow the files through a FileSet's own renames and exchanges."""
+        DirectorySnapshot.of(self.directory, self.scandir)
+
+        with mock.patch('FileSet.scandir', new=self.scandir):
+            test_set = FileSet.files_detected(('test (', ')'))
+            test_set.move_range((0, 1), 5)
+            test_set.switch_file_ranges((2, 2), (5, 5))
+
+        inodes = DirectorySnapshot.current_inodes(self.directory)
+        self.assertEqual(inodes, {file_name: os.lstat(file_name).st_ino for file_name in os.listdir(self.directory) if os.path.isfile(file_name)}, "The inode numbers of the snapshot don't follow the renamed files.")
+        self.assertEqual(self.scandir.call_count, 1, "The directory is scanned again after a FileSet's own renames.")
+
+    def test_rename_without_directory_change(self):
+        """A rename that does not change the modification time of the directory should drop the snapshot."""
+        snapshot = DirectorySnapshot.of(self.directory, self.scandir)
+
+        DirectorySnapshot.note_rename('test (0).jpg', 'test (9).jpg') # nothing has actually been renamed
+
+        self.assertIsNot(DirectorySnapshot.of(self.directory, self.scandir), snapshot, "The snapshot is kept even though the rename could not be verified.")
+        self.assertEqual(self.scandir.call_count, 2, "The directory is not scanned again after the snapshot has been dropped.")
+
+    def test_rename_into_other_directory(self):
+        """A rename moving a file out of the directory should remove it from the snapshot."""
+        os.mkdir('sub')
+        DirectorySnapshot.of(self.directory, self.scandir)
+
+        os.rename('other.txt', os.path.join('sub', 'other.txt'))
+        self._touch_directory(1)
+        DirectorySnapshot.note_rename('other.txt', os.path.join('sub', 'other.txt'))
+
+        snapshot = DirectorySnapshot.of(self.directory, self.scandir)
+        self.assertNotIn('other.txt', snapshot.file_names, "The snapshot still lists a file that has been moved into another directory.")
+        self.assertEqual(self.scandir.call_count, 1, "The directory is scanned again after a rename into another directory.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
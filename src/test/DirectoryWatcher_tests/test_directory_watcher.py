@@ -0,0 +1,156 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+from DirectorySnapshot import DirectorySnapshot
+from DirectoryWatcher import DirectoryWatcher
+from FileSet import FileSet
+
+
+def _inotify_available():
+    try:
+        DirectoryWatcher(tempfile.gettempdir(), backend='inotify').close()
+    except OSError:
+        return False
+    return True
+
+
+class DirectoryWatcherTestsMixin():
+    """Tests run against every backend of the DirectoryWatcher."""
+    backend = None
+
+    def setUp(self):
+        DirectorySnapshot.clear_cache()
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temp_directory.name
+        for file_name in ('test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'other (0).txt'):
+            self._create_file(file_name)
+
+        self.previous_directory = os.getcwd()
+        os.chdir(self.directory)
+
+        self.test_set = FileSet.files_detected(('test (', ')'))
+        self.other_set = FileSet.files_detected(('other (', ')'))
+        self.watcher = DirectoryWatcher(self.directory, [self.test_set, self.other_set], backend=self.backend)
+
+    def tearDown(self):
+        self.watcher.close()
+        FileSet.commit_batch()
+        os.chdir(self.previous_directory)
+        self.temp_directory.cleanup()
+
+        DirectorySnapshot.clear_cache()
+
+    def _create_file(self, file_name):
+        open(os.path.join(self.directory, file_name), 'w').close()
+
+
+    def test_created_file(self):
+        """The watcher should add a file that has been created to the file set it belongs to."""
+        self._create_file('test (5).png')
+
+        changes = self.watcher.poll()
+
+        self.assertEqual(changes, {self.test_set: ([(5, 'png')], [])}, "The watcher fails to report the created file.")
+        self.assertEqual(self.test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 5: ['png']}, "The watcher fails to add the created file to its file set.")
+        self.assertEqual(self.test_set.max_index, 5, "The watcher fails to update the max index of the file set.")
+
+    def test_deleted_file(self):
+        """The watcher should remove a file that has been deleted from the file set it belongs to."""
+        os.remove('test (2).jpg')
+
+        changes = self.watcher.poll()
+
+        self.assertEqual(changes, {self.test_set: ([], [(2, 'jpg')])}, "The watcher fails to report the deleted file.")
+        self.assertEqual(self.test_set.files, {0: ['jpg'], 1: ['jpg']}, "The watcher fails to remove the deleted file from its file set.")
+        self.assertEqual(self.test_set.max_index, 1, "The watcher fails to update the max index of the file set.")
+
+    def test_renamed_file(self):
+        """The watcher should apply a file being renamed from one file set into another one to both of them."""
+        os.rename('test (1).jpg', 'other (3).txt')
+
+        changes = self.watcher.poll()
+
+        self.assertEqual(changes, {self.test_set: ([], [(1, 'jpg')]), self.other_set: ([(3, 'txt')], [])}, "The watcher fails to report the renamed file.")
+        self.assertEqual(self.test_set.files, {0: ['jpg'], 2: ['jpg']}, "The watcher fails to remove the renamed file from its former file set.")
+        self.assertEqual(self.other_set.files, {0: ['txt'], 3: ['txt']}, "The watcher fails to add the renamed file to its new file set.")
+
+    def test_unrelated_files(self):
+        """The watcher should ignore files that don't belong to any of the watched file sets."""
+        self._create_file('notes.txt')
+        os.mkdir('test (7).jpg')
+
+        self.assertEqual(self.watcher.poll(), {}, "The watcher reports changes of files that don't belong to any watched file set.")
+        self.assertEqual(self.test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg']}, "The watcher changes a file set even though none of its files has changed.")
+
+    def test_own_renames(self):
+        """The watcher should recognize the renames the file sets have performed themselves as already applied."""
+        self.test_set.move_file(0, (2, 3))
+        expected_files = {0: ['jpg'], 1: ['jpg'], 2: ['jpg']}
+        self.assertEqual(self.test_set.files, expected_files, "The test set up failed.")
+
+        self.assertEqual(self.watcher.poll(), {}, "The watcher reports the renames the file set has performed itself as changes.")
+        self.assertEqual(self.test_set.files, expected_files, "The watcher applies the renames the file set has performed itself a second time.")
+
+    def test_batch_mode(self):
+        """The watcher should hold back the changes while the file sets are in batch mode and apply them once the batch has been committed."""
+        FileSet.begin_batch()
+        self.test_set.move_file(0, (2, 3))
+        self._create_file('test (4).jpg')
+
+        self.assertEqual(self.watcher.poll(), {}, "The watcher applies changes while the file sets are ahead of the directory in batch mode.")
+
+        FileSet.commit_batch()
+        changes = self.watcher.poll()
+        self.assertEqual(changes, {self.test_set: ([(4, 'jpg')], [])}, "The watcher fails to apply the held back changes after the batch has been committed.")
+        self.assertEqual(self.test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 4: ['jpg']}, "The watcher fails to apply the held back changes correctly.")
+
+    def test_resync(self):
+        """The watcher should apply the changes made before it was started once it's resynced."""
+        self.watcher.close()
+        os.remove('test (0).jpg')
+        self._create_file('test (3).jpg')
+        self.watcher = DirectoryWatcher(self.directory, [self.test_set], backend=self.backend)
+
+        changes = self.watcher.resync()
+
+        self.assertEqual(changes, {self.test_set: ([(3, 'jpg')], [(0, 'jpg')])}, "The watcher fails to resync the file set with the directory.")
+        self.assertEqual(self.test_set.files, {1: ['jpg'], 2: ['jpg'], 3: ['jpg']}, "The watcher fails to apply the differences when resyncing.")
+
+    def test_unwatch(self):
+        """The watcher should only apply changes to the file sets it's watching."""
+        self.watcher.unwatch(self.other_set)
+        self._create_file('other (1).txt')
+
+        self.assertEqual(self.watcher.poll(), {}, "The watcher reports changes of a file set it's not watching anymore.")
+        self.assertEqual(self.other_set.files, {0: ['txt']}, "The watcher changes a file set it's not watching anymore.")
+
+
+@unittest.skipUnless(_inotify_available(), "inotify is not available on this system")
+class InotifyDirectoryWatcherTests(DirectoryWatcherTestsMixin, unittest.TestCase):
+    backend = 'inotify'
+
+    def test_backend(self):
+        """The watcher should use inotify by default if it is available."""
+        watcher = DirectoryWatcher(self.directory)
+        watcher.close()
+        self.assertEqual(watcher.backend, 'inotify', "The watcher doesn't use inotify even though it is available.")
+
+
+class PollingDirectoryWatcherTests(DirectoryWatcherTestsMixin, unittest.TestCase):
+    backend = 'polling'
+
+    def test_unknown_backend(self):
+        """The watcher should raise an error when an unknown backend is requested."""
+        with self.assertRaises(ValueError, msg="The watcher fails to recognize an unknown backend."):
+            DirectoryWatcher(self.directory, backend='fsevents')
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
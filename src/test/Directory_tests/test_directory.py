@@ -0,0 +1,156 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+from Directory import Directory
+from DirectorySnapshot import DirectorySnapshot
+from FileSet import FileSet
+from RenamePlan import RenamePlan
+
+
+class DirectoryTestsMixin():
+    """Set up two temporary directories containing a few files each, neither of which is the working directory."""
+
+    def setUp(self):
+        DirectorySnapshot.clear_cache()
+
+        self.temp_directories = [tempfile.TemporaryDirectory(), tempfile.TemporaryDirectory()]
+        self.paths = [temp_directory.name for temp_directory in self.temp_directories]
+        for path in self.paths:
+            for file_name in ('test (0).jpg', 'test (1).jpg', 'test (2).jpg'):
+                with open(os.path.join(path, file_name), 'w') as file:
+                    file.write(file_name)
+
+        self.working_directory_files = os.listdir('.')
+
+    def tearDown(self):
+        FileSet.exchange_files = False
+        Directory.close_all()
+        for temp_directory in self.temp_directories:
+            temp_directory.cleanup()
+
+        DirectorySnapshot.clear_cache()
+
+        self.assertEqual(os.listdir('.'), self.working_directory_files, "A file within the working directory has been touched.")
+
+    def _get_contents(self, path):
+        contents = {}
+        for file_name in os.listdir(path):
+            with open(os.path.join(path, file_name)) as file:
+                contents[file_name] = file.read()
+        return contents
+
+
+class DirectoryTests(DirectoryTestsMixin, unittest.TestCase):
+
+    def test_open(self):
+        """A directory should be opened once per path and shared."""
+        directory = Directory.open(self.paths[0])
+
+        self.assertIs(Directory.open(os.path.join(self.paths[0], '.')), directory, "The same directory is opened twice.")
+        self.assertIs(Directory.open(directory), directory, "An opened directory is not returned as it is.")
+        self.assertIsNot(Directory.open(self.paths[1]), directory, "Different directories share their descriptor.")
+
+    def test_file_operations(self):
+        """The file operations should resolve names against the directory instead of the working directory."""
+        directory = Directory.open(self.paths[0])
+
+        self.assertTrue(directory.is_file('test (0).jpg'), "A file of the directory is not found.")
+        self.assertFalse(directory.is_file('test (5).jpg'), "A missing file is found.")
+
+        directory.rename('test (0).jpg', 'test (5).jpg')
+        with self.assertRaises(FileExistsError, msg="A file is replaced by a rename."):
+            directory.rename('test (1).jpg', 'test (2).jpg')
+        directory.swap('test (1).jpg', 'test (2).jpg', 'temp')
+
+        self.assertEqual(self._get_contents(self.paths[0]), {'test (5).jpg': 'test (0).jpg', 'test (1).jpg': 'test (2).jpg', 'test (2).jpg': 'test (1).jpg'}, "The files are not renamed within the directory.")
+        self.assertEqual(self._get_contents(self.paths[1]), {'test (0).jpg': 'test (0).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (2).jpg'}, "A file of another directory is renamed.")
+
+    def test_moved_directory(self):
+        """The descriptor should keep referring to the directory after it has been moved."""
+        directory = Directory.open(self.paths[0])
+        moved_path = os.path.join(self.paths[1], 'moved')
+        os.rename(self.paths[0], moved_path)
+        try:
+            directory.rename('test (0).jpg', 'test (5).jpg')
+            self.assertTrue(directory.name_taken('test (5).jpg'), "The descriptor doesn't follow the moved directory.")
+            self.assertTrue(os.path.isfile(os.path.join(moved_path, 'test (5).jpg')), "The file is not renamed within the moved directory.")
+        finally:
+            os.rename(moved_path, self.paths[0])
+
+
+class BoundFileSetTests(DirectoryTestsMixin, unittest.TestCase):
+
+    def test_files_detected(self):
+        """A FileSet should detect its files within the directory it is bound to."""
+        test_set = FileSet.files_detected(('test (', ')'), directory=self.paths[0])
+
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg']}, "The files of the directory are not detected.")
+        self.assertIs(test_set.directory, Directory.open(self.paths[0]), "The FileSet is not bound to the directory.")
+
+    def test_operations(self):
+        """The operations of a bound FileSet should rename its files within its directory only."""
+        FileSet.exchange_files = True
+        test_set = FileSet.files_detected(('test (', ')'), directory=self.paths[0])
+
+        test_set.move_files((0, 0), (2, 3))
+        test_set.switch_files(0, 1)
+
+        self.assertEqual(self._get_contents(self.paths[0]), {'test (1).jpg': 'test (1).jpg', 'test (0).jpg': 'test (2).jpg', 'test (2).jpg': 'test (0).jpg'}, "The files are not renamed within the directory.")
+        self.assertEqual(self._get_contents(self.paths[1]), {'test (0).jpg': 'test (0).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (2).jpg'}, "A file of another directory is renamed.")
+        self.assertFalse(os.path.exists(os.path.join(self.paths[0], 'tmp')), "The staging directory is not removed.")
+
+    def test_batch(self):
+        """The renames of FileSets bound to different directories should be committed per directory."""
+        test_sets = [FileSet.files_detected(('test (', ')'), directory=path) for path in self.paths]
+
+        with FileSet.batch():
+            test_sets[0].move_files((0, 0), (2, 3))
+            test_sets[1].change_pattern(('other (', ')'))
+            self.assertEqual(FileSet.files_detected(('test (', ')'), directory=self.paths[0]).files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg']}, "The pending renames of the batch are not taken into account.")
+            self.assertEqual(self._get_contents(self.paths[0])['test (0).jpg'], 'test (0).jpg', "A file is renamed before the batch is committed.")
+
+        self.assertEqual(self._get_contents(self.paths[0]), {'test (0).jpg': 'test (1).jpg', 'test (1).jpg': 'test (2).jpg', 'test (2).jpg': 'test (0).jpg'}, "The batch of the first directory is not committed.")
+        self.assertEqual(self._get_contents(self.paths[1]), {'other (0).jpg': 'test (0).jpg', 'other (1).jpg': 'test (1).jpg', 'other (2).jpg': 'test (2).jpg'}, "The batch of the second directory is not committed.")
+
+    def test_dry_run(self):
+        """A dry run of a bound FileSet should check for collisions within its directory without renaming any file."""
+        with open(os.path.join(self.paths[0], 'other (0).jpg'), 'w') as file:
+            file.write('other (0).jpg')
+        test_set = FileSet.files_detected(('test (', ')'), directory=self.paths[0])
+
+        recording = test_set.dry_run('move_files', (0, 0), (2, 3))
+        with self.assertRaises(RenamePlan.CollisionError, msg="A collision with a file of the directory is not found."):
+            test_set.dry_run('change_pattern', ('other (', ')'))
+
+        self.assertEqual(len(recording.get_name_mapping()), 3, "The renames of the dry run are not recorded.")
+        self.assertEqual(self._get_contents(self.paths[0])['test (0).jpg'], 'test (0).jpg', "A file is renamed during a dry run.")
+
+    def test_add_file_set(self):
+        """Adding a FileSet bound to another directory should move its files into the directory of the set."""
+        test_set = FileSet.files_detected(('test (', ')'), directory=self.paths[0])
+        foreign_set = FileSet.files_detected(('test (', ')'), directory=self.paths[1])
+
+        test_set.add_file_set(foreign_set, (2, 3))
+
+        self.assertEqual(sorted(os.listdir(self.paths[0])), ['test ({}).jpg'.format(i) for i in range(6)], "The files are not moved into the directory of the set.")
+        self.assertEqual(os.listdir(self.paths[1]), [], "The files are not moved out of the foreign directory.")
+        self.assertEqual(foreign_set.files, {}, "The foreign set is not updated.")
+
+    def test_remove_files(self):
+        """Files removed from a bound FileSet should end up in a set of removed files within the same directory."""
+        test_set = FileSet.files_detected(('test (', ')'), directory=self.paths[0])
+
+        removed_set, _ = test_set.remove_files([1])
+
+        self.assertIs(removed_set.directory, test_set.directory, "The removed files are not bound to the directory of the set.")
+        self.assertEqual(sorted(os.listdir(self.paths[0])), ['removed0.jpg', 'test (0).jpg', 'test (1).jpg'], "The file is not removed within the directory.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,160 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import errno
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
+from FileExchange import FileExchange
+from FileSet import FileSet
+from RenameJournal import RenameJournal
+from RenamePlan import RenamePlan
+
+
+class FileExchangeTestsMixin():
+    """Set up a temporary working directory containing a few files, each containing its own name."""
+
+    def setUp(self):
+        DirectorySnapshot.clear_cache()
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.previous_directory = os.getcwd()
+        os.chdir(self.temp_directory.name)
+
+        for file_name in ('test (0).jpg', 'test (1).jpg', 'test (2).jpg'):
+            with open(file_name, 'w') as file:
+                file.write(file_name)
+
+    def tearDown(self):
+        FileSet.exchange_files = False
+        os.chdir(self.previous_directory)
+        self.temp_directory.cleanup()
+
+        DirectorySnapshot.clear_cache()
+
+    def _get_contents(self):
+        contents = {}
+        for file_name in os.listdir('.'):
+            with open(file_name) as file:
+                contents[file_name] = file.read()
+        return contents
+
+
+class SwapTests(FileExchangeTestsMixin, unittest.TestCase):
+
+    def test_fallback(self):
+        """If exchanges are not supported, swap should rename the files one after another via the temporary name."""
+        mock_rename = mock.MagicMock(name='rename', wraps=os.rename)
+        with mock.patch('FileExchange.FileExchange.exchange', side_effect=OSError(errno.ENOSYS, "not supported")):
+            FileExchange.swap('test (0).jpg', 'test (2).jpg', 'temp', mock_rename)
+
+        self.assertEqual(mock_rename.call_count, 3, "The files are not renamed one after another if they can't be exchanged.")
+        self.assertEqual(self._get_contents(), {'test (0).jpg': 'test (2).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (0).jpg'}, "The files are not swapped by the fallback.")
+
+    def test_fallback_failure(self):
+        """If the fallback fails halfway, the file renamed to the temporary name should be restored."""
+        with mock.patch('FileExchange.FileExchange.exchange', side_effect=OSError(errno.ENOSYS, "not supported")):
+            with self.assertRaises(FileNotFoundError, msg="The failing rename is not reported."):
+                FileExchange.swap('test (0).jpg', 'missing.jpg', 'temp')
+
+        self.assertEqual(set(self._get_contents()), {'test (0).jpg', 'test (1).jpg', 'test (2).jpg'}, "The file renamed to the temporary name is not restored.")
+
+    def test_other_errors_raised(self):
+        """Errors other than a missing support for exchanges should be raised without falling back."""
+        mock_rename = mock.MagicMock(name='rename')
+        with mock.patch('FileExchange.FileExchange.exchange', side_effect=OSError(errno.ENOENT, "not found")):
+            with self.assertRaises(OSError, msg="The error of the exchange is not raised."):
+                FileExchange.swap('test (0).jpg', 'missing.jpg', 'temp', mock_rename)
+
+        mock_rename.assert_not_called()
+
+
+class RenameTests(FileExchangeTestsMixin, unittest.TestCase):
+
+    def test_rename(self):
+        """Renaming a file should never replace an existing file."""
+        FileExchange.rename('test (0).jpg', 'test (3).jpg')
+        with self.assertRaises(FileExistsError, msg="Renaming a file to a taken name doesn't raise an error."):
+            FileExchange.rename('test (1).jpg', 'test (2).jpg')
+
+        self.assertEqual(self._get_contents(), {'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (2).jpg', 'test (3).jpg': 'test (0).jpg'}, "A file is replaced by a rename.")
+
+    def test_rename_fallback(self):
+        """If renameat2 is not supported, the new name should be checked for existence before renaming the file."""
+        with mock.patch('FileExchange.FileExchange._call_renameat2', side_effect=OSError(errno.ENOSYS, "not supported")):
+            FileExchange.rename('test (0).jpg', 'test (3).jpg')
+            with self.assertRaises(FileExistsError, msg="Renaming a file to a taken name doesn't raise an error without renameat2."):
+                FileExchange.rename('test (1).jpg', 'test (2).jpg')
+
+        self.assertEqual(self._get_contents(), {'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (2).jpg', 'test (3).jpg': 'test (0).jpg'}, "A file is replaced by a rename without renameat2.")
+
+    def test_unknown_file_collision(self):
+        """An operation colliding with a file that doesn't belong to the set should be refused before any file is renamed."""
+        test_set = FileSet.files_detected(('test (', ')'))
+        with open('test (3).jpg', 'w') as file:
+            file.write('unknown')
+
+        with self.assertRaises(RenamePlan.CollisionError, msg="The collision with a file unknown to the set is not detected."):
+            test_set.move_range((0, 2), 1)
+
+        self.assertEqual(self._get_contents(), {'test (0).jpg': 'test (0).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (2).jpg', 'test (3).jpg': 'unknown'}, "Files are renamed despite the collision.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg']}, "The set is changed despite the collision.")
+
+
+@unittest.skipUnless(FileExchange.is_available(), "renameat2 is not available on this system")
+class ExchangeTests(FileExchangeTestsMixin, unittest.TestCase):
+
+    def test_exchange(self):
+        """Exchanging two files should swap their names."""
+        FileExchange.exchange('test (0).jpg', 'test (2).jpg')
+
+        self.assertEqual(self._get_contents(), {'test (0).jpg': 'test (2).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (0).jpg'}, "The files are not exchanged.")
+
+    def test_missing_file(self):
+        """Exchanging a file with a missing one should raise an error and leave the files untouched."""
+        with self.assertRaises(FileNotFoundError, msg="Exchanging a missing file doesn't raise an error."):
+            FileExchange.exchange('test (0).jpg', 'missing.jpg')
+
+        self.assertEqual(set(self._get_contents()), {'test (0).jpg', 'test (1).jpg', 'test (2).jpg'}, "The files are changed by a failed exchange.")
+        self.assertTrue(FileExchange.is_available(), "A missing file is taken for a missing support of exchanges.")
+
+    def test_switch_files(self):
+        """Switching two files should exchange them in a single step if exchange_files is set."""
+        FileSet.exchange_files = True
+        test_set = FileSet.files_detected(('test (', ')'))
+
+        mock_rename = mock.MagicMock(name='rename', wraps=os.rename)
+        with mock.patch('FileSet.rename', new=mock_rename):
+            test_set.switch_files(0, 2)
+
+        mock_rename.assert_not_called()
+        self.assertEqual(self._get_contents(), {'test (0).jpg': 'test (2).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (0).jpg'}, "The files are not switched.")
+
+    def test_journal_recovery(self):
+        """An exchange recorded in an interrupted journal should be recovered in both directions."""
+        for performed_count in range(2):
+            for roll_forward in (True, False):
+                plan = RenamePlan({'test (0).jpg': 'test (2).jpg', 'test (2).jpg': 'test (0).jpg'}, exchange_cycles=True)
+                journal = RenameJournal('.')
+                journal.write_ahead(plan)
+                tracked_exchange = journal.track_exchanges(FileExchange.exchange)
+                for operation in plan.operations[:performed_count]:
+                    tracked_exchange(*operation)
+                journal._file.close()
+
+                self.assertEqual(RenameJournal.recover('.', roll_forward), (performed_count, int(performed_count != roll_forward)), "The state of the exchange is not determined correctly.")
+
+                swapped = roll_forward
+                expected_contents = {'test (0).jpg': 'test (2).jpg' if swapped else 'test (0).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (0).jpg' if swapped else 'test (2).jpg'}
+                self.assertEqual(self._get_contents(), expected_contents, "An exchange interrupted after {} operations is not recovered correctly.".format(performed_count))
+                if swapped:
+                    FileExchange.exchange('test (0).jpg', 'test (2).jpg') # restore the initial state
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
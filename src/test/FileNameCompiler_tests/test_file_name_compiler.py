@@ -0,0 +1,22 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+from FileNameCompiler import FileNameCompiler
+
+
+class FileNameCompilerTests(unittest.TestCase):
+
+    def test_compile_file_names(self):
+        """The compiler should detect file sets by the last integer in their names and compile their files."""
+        file_names = ['test (0).jpg', 'test (1).tar.gz', 'test (1)', '.hidden3.png', 'dirt.txt', 'a1b2c.d4']
+
+        self.assertEqual(FileNameCompiler.compile_file_names(file_names), {('test (', ')'): {0: ['jpg'], 1: ['tar.gz', '']}, ('.hidden', ''): {3: ['png']}, ('a1b', 'c'): {2: ['d4']}},
+                         "The compiler fails to detect and compile the file sets.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
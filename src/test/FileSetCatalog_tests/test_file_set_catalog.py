@@ -0,0 +1,90 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+from FileNameCompiler import FileNameCompiler
+from FileSetCatalog import FileSetCatalog
+
+
+class FileSetCatalogTests(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_directory.name, 'files')
+        os.mkdir(self.directory)
+        for file_name in ('test (0).jpg', 'test (1).jpg', 'test (1).png', 'test (3).gif', 'RMVD0.jpg', 'dirt.txt'):
+            self._create_file(file_name)
+
+        self.catalog_path = os.path.join(self.temp_directory.name, 'catalog.sqlite')
+        self.catalog = FileSetCatalog(self.catalog_path)
+        self.scandir = mock.MagicMock(name='scandir', side_effect=os.scandir)
+
+    def tearDown(self):
+        self.catalog.close()
+        self.temp_directory.cleanup()
+
+    def _create_file(self, file_name):
+        open(os.path.join(self.directory, file_name), 'w').close()
+
+    def _get_files(self, catalog=None):
+        """Return the cataloged files of the directory as plain dictionaries."""
+        if catalog is None:
+            catalog = self.catalog
+        return {pattern: dict(files) for pattern, files in catalog.get_files(self.directory, self.scandir).items()}
+
+    def _detect_from_scratch(self):
+        file_names = [entry.name for entry in os.scandir(self.directory) if entry.is_file()]
+        return FileNameCompiler.compile_file_names(file_names)
+
+
+    def test_unchanged_directory(self):
+        """The catalog should load the file sets of an unchanged directory without scanning it again, even after being reopened."""
+        expected_files = {('test (', ')'): {0: ['jpg'], 1: ['jpg', 'png'], 3: ['gif']}, ('RMVD', ''): {0: ['jpg']}}
+        self.assertEqual(self._get_files(), expected_files, "The catalog fails to detect the file sets of a new directory.")
+
+        self.catalog.close()
+        self.catalog = FileSetCatalog(self.catalog_path)
+
+        self.assertEqual(self._get_files(), expected_files, "The catalog fails to load the cataloged file sets.")
+        self.assertEqual(self.scandir.call_count, 1, "The catalog scans the directory again even though it has not changed.")
+
+    def test_incremental_refresh(self):
+        """The catalog should pick up the files that have been added and removed since the directory was cataloged."""
+        for i in range(4, 40):
+            self._create_file('test ({}).jpg'.format(i))
+        self._get_files()
+
+        os.remove(os.path.join(self.directory, 'test (1).png'))
+        os.remove(os.path.join(self.directory, 'RMVD0.jpg'))
+        self._create_file('test (2).jpg')
+        self._create_file('new0.mp4')
+
+        expected_files = self._detect_from_scratch()
+        self.assertEqual(self._get_files(), expected_files, "The catalog fails to refresh the file sets of a changed directory.")
+        self.assertEqual(self._get_files(FileSetCatalog(self.catalog_path)), expected_files, "The catalog fails to store the refreshed file sets.")
+
+    def test_racy_directory(self):
+        """The catalog should compare the amount of entries if the directory's modification time is too recent to be trusted alone."""
+        self._get_files()
+        mtime = os.stat(self.directory).st_mtime_ns
+
+        self._create_file('test (2).jpg')
+        os.utime(self.directory, ns=(mtime, mtime)) # a change within the same tick of the modification time
+
+        self.assertIn(2, self._get_files()[('test (', ')')], "The catalog fails to recognize a change that did not alter the directory's modification time.")
+
+    def test_detect_file_sets(self):
+        """The catalog should return FileSet objects for the file sets of the directory."""
+        file_sets = self.catalog.detect_file_sets(self.directory, self.scandir)
+
+        self.assertEqual(sorted(file_set.pattern for file_set in file_sets), [('RMVD', ''), ('test (', ')')], "The catalog fails to create the FileSets.")
+        self.assertEqual([file_set.max_index for file_set in file_sets if file_set.pattern == ('test (', ')')], [3], "The catalog creates inconsistent FileSets.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -107,6 +107,20 @@ class AddFileTests(unittest.TestCase):
         
         self.assertEqual(test_set.max_index, 4, "The add_file method changed the max index even though it's adding into a gap in the middle of the set.")
         
+    def test_insert_before_gap(self):
+        """The FileSet should only move the files up to the nearest gap when inserting a new file."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg']
+        test_set = FileSet(self.pattern, test_files)
+        
+        new_file = 'new_file.jpg'
+        mock_isfile.return_value = True
+        test_set.add_file(new_file, (0, 1))
+        
+        mock_assert_msg(mock_move_range.assert_called_once_with, [(1, 2), 2], msg="The FileSet moves more files than necessary instead of making use of the gap.")
+        mock_assert_msg(mock_rename.assert_called_once_with, [new_file, 'test (1).jpg'], msg="The FileSet doesn't correctly add the file.")
+        
+        self.assertEqual(test_set.max_index, 5, "The add_file method changed the max index even though the inserted file was absorbed by a gap.")
+        
     def test_add_into_empty_set(self):
         """The FileSet should be able to add a new file if it's empty."""
         test_files = []
@@ -231,6 +231,24 @@ class AddFileSetTests(unittest.TestCase):
         mock_assert_many_msg(assertion_calls, "The FileSet fails to logically remove the files from the foreign file_set's file list.")
         self.assertEqual(amount_added, 2, "The FileSet fails to return the number of indexes that were actually added when adding into a perfectly fitting gap.")
         
+    def test_gap_further_right(self):
+        """The FileSet should only move the files up to the nearest gap that is wide enough for the added files."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (7).jpg', 'test (8).jpg']
+        test_set = FileSet(self.pattern, test_files)
+        
+        add_files = ['add (0).add', 'add (1).add']
+        add_set = FileSet(('add (', ')'), add_files)
+        
+        amount_added = test_set.add_file_set(add_set, (0, 1))
+        
+        mock_assert_msg(mock_move_range.assert_called_once_with, [(1, 4), 3], "The FileSet fails to make use of the nearest gap that is wide enough for the added files.")
+        assertion_calls = [
+                (mock_rename.assert_any_call, ['add (0).add', 'test (1).add']),
+                (mock_rename.assert_any_call, ['add (1).add', 'test (2).add'])
+            ]
+        mock_assert_many_msg(assertion_calls, "The FileSet fails to physically add the files.")
+        self.assertEqual(amount_added, 2, "The FileSet fails to return the number of indexes that were actually added.")
+        
     def test_too_small_gap(self):
         """The FileSet should be able to fill a small gap and automatically make the necessary extra-space if the amount of files requires it."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (4).jpg', 'test (5).jpg']
@@ -79,6 +79,27 @@ class AddFilesTests(unittest.TestCase):
             ]
         mock_assert_many_msg(assertion_calls, "The method fails to logically add the files.")
         
+    def test_add_before_gap(self):
+        """The method should only move the files up to the nearest gap that is wide enough for the added files."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (3).jpg', 'test (4).jpg', 'test (7).jpg', 'test (8).jpg']
+        test_set = FileSet(self.pattern, test_files)
+        
+        files_to_add = ['new_file1.add1', 'new_file2.add2']
+        
+        mock_isfile.return_value = True
+        mock_check_spot.return_value = (0, 1)
+        
+        test_set.add_files(files_to_add, (0, 1))
+        
+        mock_assert_msg(mock_move_range.assert_called_once_with, [(1, 4), 3], "The method fails to make use of the nearest gap that is wide enough for the files to be added.")
+        assertion_calls = [
+                (mock_rename.assert_any_call, ['new_file1.add1', 'test (1).add1']),
+                (mock_rename.assert_any_call, ['new_file2.add2', 'test (2).add2'])
+            ]
+        mock_assert_many_msg(assertion_calls, "The method fails to physically add the files.")
+        
+        self.assertEqual(test_set.max_index, 8, "The method changes the max_index even though the added files were absorbed by a gap.")
+        
     def test_append_files(self):
         """The method should be able to append files to the end of the set and update the max_index accordingly."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg']
@@ -0,0 +1,88 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
+from FileSet import FileSet
+from test.testing_tools import replay_renames, mock_scandir_gen
+
+
+mock_rename = mock.MagicMock(name='rename')
+mock_scandir = mock.MagicMock(name='scandir')
+
+@mock.patch('FileSet.rename', new=mock_rename)
+@mock.patch('FileSet.scandir', new=mock_scandir)
+class BatchTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pattern = ('test (', ')')
+        cls.test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
+
+    def tearDown(self):
+        mock_rename.reset_mock()
+        mock_scandir.reset_mock()
+        DirectorySnapshot.clear_cache() # the mocked directory listings differ from test to test
+
+        while FileSet.in_batch_mode():
+            FileSet.commit_batch()
+
+    def test_coalesce_operations(self):
+        """The FileSet should only update its files during a batch and rename every affected file at most once upon commit."""
+        test_set = FileSet(self.pattern, self.test_files)
+
+        with FileSet.batch():
+            for _ in range(10):
+                test_set.move_files((0, 0), (8, 9)) # rotate the set by one file each time
+            renames_during_batch = mock_rename.call_count
+            self.assertEqual(test_set.files, {i: ['jpg'] for i in range(9)}, "The FileSet fails to update its files during a batch.")
+
+        self.assertEqual(renames_during_batch, 0, "The FileSet renames files during a batch.")
+        expected_names = {'test ({}).jpg'.format(i): 'test ({}).jpg'.format((i-10) % 9) for i in range(9)}
+        self.assertEqual(replay_renames(self.test_files, mock_rename), expected_names, "The FileSet fails to perform the net renames of the batch.")
+        self.assertEqual(mock_rename.call_count, 10, "The FileSet fails to rename every file only once (plus one temporary rename) upon commit.")
+
+    def test_explicit_begin_and_nesting(self):
+        """The FileSet should only commit the outermost batch if batches are nested."""
+        test_set = FileSet(self.pattern, self.test_files)
+
+        FileSet.begin_batch()
+        with FileSet.batch():
+            test_set.switch_files(0, 8)
+        mock_rename.assert_not_called()
+        self.assertTrue(FileSet.in_batch_mode(), "The FileSet leaves batch mode after committing an inner batch.")
+
+        FileSet.commit_batch()
+
+        self.assertFalse(FileSet.in_batch_mode(), "The FileSet fails to leave batch mode.")
+        self.assertEqual(replay_renames(self.test_files, mock_rename)['test (0).jpg'], 'test (8).jpg', "The FileSet fails to perform the renames of a nested batch.")
+
+    def test_commit_upon_error(self):
+        """The FileSet should commit the batch even if an operation within it raises an error, since the files have already been updated."""
+        test_set = FileSet(self.pattern, self.test_files)
+
+        with self.assertRaises(FileSet.OverlappingRangesError):
+            with FileSet.batch():
+                test_set.move_files((0, 1), (8, 9))
+                test_set.switch_file_ranges((0, 3), (2, 5))
+
+        self.assertFalse(FileSet.in_batch_mode(), "The FileSet stays in batch mode after an error.")
+        self.assertEqual(mock_rename.call_count, 10, "The FileSet fails to commit the batch after an error.")
+
+    def test_detection_within_batch(self):
+        """The FileSet should detect files as they will be named after the batch is committed."""
+        test_set = FileSet(self.pattern, self.test_files)
+        mock_scandir.return_value = mock_scandir_gen([(file_name, True) for file_name in self.test_files])
+
+        with FileSet.batch():
+            test_set.remove_files([0, 1], FileSet(('removed', ''), []))
+            detected_set = FileSet.files_detected(self.pattern)
+
+        self.assertEqual(detected_set.files, {i: ['jpg'] for i in range(7)}, "The FileSet fails to take the pending renames into account when detecting files within a batch.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,109 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from FileSet import FileSet
+from test.testing_tools import replay_renames
+
+
+mock_rename = mock.MagicMock(name='rename')
+mock_isfile = mock.MagicMock(name='isfile')
+
+@mock.patch('FileSet.rename', new=mock_rename)
+@mock.patch('FileSet.isfile', new=mock_isfile)
+class DryRunTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pattern = ('test (', ')')
+
+    def tearDown(self):
+        mock_rename.reset_mock()
+        mock_isfile.reset_mock()
+        FileSet.rename_workers = 1
+
+    def test_dry_run(self):
+        """The FileSet should list the renames of an operation in the order they would be performed without renaming any files or changing itself."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(6)]
+        test_set = FileSet(self.pattern, test_files)
+
+        recording = test_set.dry_run('move_files', (0, 1), (3, 4))
+        mock_rename.assert_not_called()
+        self.assertEqual(test_set.files, {i: ['jpg'] for i in range(6)}, "The dry run changes the file set.")
+
+        test_set.move_files((0, 1), (3, 4))
+        performed_renames = [rename_call[0] for rename_call in mock_rename.call_args_list]
+        self.assertEqual(recording.operations, performed_renames, "The dry run doesn't list the renames the operation performs.")
+        performed_temp_names = {new_name for _, new_name in performed_renames if new_name.startswith('.fileset_staging')}
+        self.assertEqual((recording.rename_count, recording.files_touched, len(recording.temp_names)), (len(performed_renames), 4, len(performed_temp_names)), "The statistics of the dry run are wrong.")
+
+    def test_foreign_file_set(self):
+        """The FileSet should neither change itself nor other file sets involved in a dry run."""
+        test_set = FileSet(self.pattern, ['test (0).jpg', 'test (1).jpg', 'test (2).jpg'])
+        removed_set = FileSet(('removed', ''), ['removed0.jpg'])
+
+        mock_isfile.return_value = True
+        recording = test_set.dry_run('remove_files', [0], removed_set)
+
+        self.assertEqual(recording.operations, [('test (0).jpg', 'removed1.jpg'), ('test (1).jpg', 'test (0).jpg'), ('test (2).jpg', 'test (1).jpg')], "The dry run doesn't list the renames of the operation.")
+        self.assertEqual(removed_set.files, {0: ['jpg']}, "The dry run changes the foreign file set.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg']}, "The dry run changes the file set.")
+        mock_rename.assert_not_called()
+
+    def test_concurrent_renames(self):
+        """The dry run should plan the renames like they would be performed concurrently and estimate their duration accordingly."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(1000)]
+        test_set = FileSet(self.pattern, test_files)
+        FileSet.rename_workers = 10
+
+        recording = test_set.dry_run('move_range', (0, 999), 1)
+
+        replayed_rename = mock.MagicMock(name='replayed_rename')
+        for operation in recording.operations:
+            replayed_rename(*operation)
+        self.assertEqual(replay_renames(test_files, replayed_rename), {'test ({}).jpg'.format(i): 'test ({}).jpg'.format(i+1) for i in range(1000)}, "The recorded renames don't perform the operation.")
+        self.assertGreater(len(recording.temp_names), 0, "The dry run doesn't split the renames for the workers.")
+        self.assertLess(recording.estimate_duration(), recording.rename_count / 5, "The estimated duration doesn't reflect the concurrent renames.")
+        self.assertEqual(recording.estimate_duration(0.5), recording.estimate_duration() * 0.5, "The estimated duration doesn't scale with the latency of a rename.")
+
+    def test_serial_estimate(self):
+        """Renames that are performed one after another should each count towards the estimated duration."""
+        test_set = FileSet(self.pattern, ['test ({}).jpg'.format(i) for i in range(10)])
+
+        recording = test_set.dry_run('move_range', (0, 9), 1)
+
+        self.assertEqual(recording.estimate_duration(), 10, "The estimated duration of renames performed one after another is wrong.")
+
+    def test_dry_run_in_batch_mode(self):
+        """A dry run in batch mode should take the pending renames of the batch into account without adding to it."""
+        test_set = FileSet(self.pattern, ['test (0).jpg', 'test (1).jpg'])
+        mock_isfile.return_value = True
+        FileSet.begin_batch()
+        try:
+            test_set.move_range((1, 1), 2)
+
+            with self.assertRaises(FileNotFoundError, msg="The dry run fails to account for the file the batch has renamed away."):
+                test_set.dry_run('add_file', 'test (1).jpg', (0, 1))
+            recording = test_set.dry_run('add_file', 'test (2).jpg', (-1, 0))
+
+            self.assertEqual(recording.operations, [('test (0).jpg', 'test (1).jpg'), ('test (2).jpg', 'test (0).jpg')], "The dry run fails to account for the file the batch has renamed.")
+            self.assertEqual(FileSet._rename_batch.get_name_mapping(), {'test (1).jpg': 'test (2).jpg'}, "The dry run adds its renames to the batch.")
+            self.assertTrue(FileSet.in_batch_mode(), "The dry run ends the batch mode.")
+        finally:
+            FileSet.commit_batch()
+
+    def test_failing_operation(self):
+        """The dry run should raise the errors of the operation."""
+        test_set = FileSet(self.pattern, ['test (0).jpg', 'test (1).jpg'])
+
+        with self.assertRaises(FileSet.IndexUnassignedError, msg="The dry run fails to raise the error of the operation."):
+            test_set.dry_run('remove_file', 5)
+        self.assertFalse(FileSet.in_batch_mode(), "The dry run keeps recording after the operation failed.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -67,13 +67,14 @@ class FindFlawsTests(unittest.TestCase):
         
         self.assertEqual(flaws, ([(0, 0), (6, 7)], [(1, ['jpg', 'png']), (5, ['jpg', 'png', 'mp4'])]), "The FileSet fails to find gaps and multi-assigned indexes next to each other.")
     
-    def test_too_high_max_index(self):
-        """The FileSet should raise an error if the file set has a max_index of above 1000."""
-        test_files = ['test (100111).jpg']
+    def test_very_high_max_index(self):
+        """The FileSet should be able to find the flaws of a file set with a max_index far above 1000."""
+        test_files = ['test (0).jpg', 'test (5).jpg', 'test (5).png', 'test (100111).jpg']
         test_set = FileSet(self.pattern, test_files)
 
-        with self.assertRaises(FileSet.TooManyFilesError, msg="The FileSet fails to recognize when there are just too many indexes to scan for flaws."):
-            test_set.find_flaws()
+        flaws = test_set.find_flaws()
+
+        self.assertEqual(flaws, ([(1, 4), (6, 100110)], [(5, ['jpg', 'png'])]), "The FileSet fails to find the flaws of a file set with a very high max_index.")
         
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
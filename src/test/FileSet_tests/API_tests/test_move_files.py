@@ -6,23 +6,13 @@ Created on 28.08.2018
 import unittest
 import unittest.mock as mock
 from FileSet import FileSet
-from test.testing_tools import mock_assert_msg, KeywordArgTuple
+from IntervalSet import IntervalSet
+from test.testing_tools import replay_renames
 
 
-def preserve_gaps(boolean):
-    return KeywordArgTuple('preserve_gaps', boolean)
+mock_rename = mock.MagicMock(name='rename')
 
-def strip_gaps(boolean):
-    return KeywordArgTuple('strip_gaps', boolean)
-
-
-mock_files_detected = mock.MagicMock(name='files_detected')
-mock_add_file_set = mock.MagicMock(name='add_files')
-mock_move_range = mock.MagicMock(name='move_range')
-
-@mock.patch('FileSet.FileSet.files_detected', new=mock_files_detected)
-@mock.patch('FileSet.FileSet.add_file_set', new=mock_add_file_set)
-@mock.patch('FileSet.FileSet.move_range', new=mock_move_range)
+@mock.patch('FileSet.rename', new=mock_rename)
 class MoveFilesTests(unittest.TestCase):
     
     @classmethod
@@ -30,403 +20,273 @@ class MoveFilesTests(unittest.TestCase):
         cls.pattern = ('test (', ')')
     
     def tearDown(self):
-        mock_files_detected.reset_mock()
-        mock_add_file_set.reset_mock()
-        mock_move_range.reset_mock()
+        mock_rename.reset_mock()
     
-    def check_readd_call(self, expected_readd_pos, expected_index_range):
-        """Convenience method for testing re-addition of files using an add_files call."""
-        call_tuple_args, call_tuple_kwargs = tuple(mock_add_file_set.call_args)
-        used_file_set, used_readd_pos, used_index_range = call_tuple_args
-        
-        self.assertEqual(used_file_set.pattern, ('tmp', ''), "The FileSet uses a wrong FileSet pattern to remove/readd the files.")     
-        self.assertEqual(used_readd_pos, (expected_readd_pos-1, expected_readd_pos), "The FileSet re-adds the files at the wrong position.")
-        self.assertEqual(used_index_range, expected_index_range, "The FileSet doesn't correctly re-add the right files from the tmp file set.")  
-        self.assertEqual(call_tuple_kwargs['preserve_gaps'], True, "The FileSet doesn't re-add files with the options preserve_gaps=True")
+    def check_move_result(self, test_set, test_files, expected_order, expected_rename_count, msg):
+        """
+        Convenience method for checking the outcome of a move operation, both physically and logically.
+        
+        @param expected_order: The list of the original indexes of the files in their new order; None for a gap
+        @param expected_rename_count: The amount of renames the operation is expected to need, i.e. one per moved file plus one per rotation cycle
+        """
+        expected_names = {'test ({}).jpg'.format(original_index): 'test ({}).jpg'.format(new_index) for new_index, original_index in enumerate(expected_order) if original_index is not None}
+        expected_files = {new_index: ['jpg'] for new_index, original_index in enumerate(expected_order) if original_index is not None}
+        
+        self.assertEqual(replay_renames(test_files, mock_rename), expected_names, "The FileSet fails to physically move the files {}.".format(msg))
+        self.assertEqual(test_set.files, expected_files, "The FileSet fails to logically move the files {}.".format(msg))
+        self.assertEqual(test_set.max_index, len(expected_order)-1, "The FileSet fails to update its max_index when moving the files {}.".format(msg))
+        self.assertEqual(mock_rename.call_count, expected_rename_count, "The FileSet renames the files more often than necessary when moving them {}.".format(msg))
     
     def test_move_middle_to_middle(self):
         """The FileSet should be able to move a range of files from middle to middle."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (6, 7))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 7], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
-                
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 2, 3, 4, 7, 8], 6, "from middle to middle")
+    
     def test_move_middle_to_end(self):
         """The FileSet should be able to move a range of files from middle to end."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (8, 9))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving to the end of the set.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 8), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(6, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet attempts to close possibly resulting gap space, even though that's unnecessary when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 7, 8, 2, 3, 4], 8, "from middle to end")
+    
     def test_move_middle_to_front(self):
         """The FileSet should be able to move a range of files from middle to front."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (-1, 0))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving to the front of the set.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(0, 1), 3], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(0, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(5, 8), 5], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [2, 3, 4, 0, 1, 5, 6, 7, 8], 6, "from middle to front")
+    
     def test_move_middle_to_before_last_file(self):
         """The FileSet should be able to move a range of files from middle to in front of the last file of the set."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (7, 8))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving before the last file of the set.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 7), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(5, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(8, 8), 8], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 7, 2, 3, 4, 8], 9, "from middle to before the last file")
+    
     def test_move_front_to_middle(self):
         """The FileSet should be able to move a range of files from front to middle."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((0, 1), (3, 4))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(0, 1+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving from the front to the middle.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(2, 3), 0], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(2, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(4, 8), 4], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [2, 3, 0, 1, 4, 5, 6, 7, 8], 6, "from front to middle")
+    
     def test_move_end_to_middle(self):
         """The FileSet should be able to move a range of files from end to middle."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((7, 8), (3, 4))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(7, 8+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving from the end to the middle.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(4, 6), 6], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet tries to close possibly resulting gap-space even though that's unnecessary when moving from the end.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 2, 3, 7, 8, 4, 5, 6], 6, "from end to middle")
+    
     def test_move_end_to_front(self):
         """The FileSet should be able to move a range of files from end to front."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((7, 8), (-1, 0))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(7, 8+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving from the end to the front.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(0, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(0, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet tries to close possibly resulting gap-space even though that's unnecessary when moving from the end.")
-        
+        self.check_move_result(test_set, test_files, [7, 8, 0, 1, 2, 3, 4, 5, 6], 10, "from end to front")
+    
     def test_move_front_to_end(self):
         """The FileSet should be able to move a range of files from front to end."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((0, 2), (8, 9))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(0, 2+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving from the front to the end.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(3, 8), 0], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(6, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet tries to close possibly resulting gap-space even though that's unnecessary when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [3, 4, 5, 6, 7, 8, 0, 1, 2], 12, "from front to end")
+    
     def test_move_middle_to_far_end(self):
         """The FileSet should be able to move a range of files from middle to the far end of the set, causing a gap."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (10, 11))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving from the middle to the far end.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 10), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(8, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet tries to close possibly resulting gap-space even though that's unnecessary when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 7, 8, None, None, 2, 3, 4], 8, "from middle to the far end")
+    
     def test_move_single_file_range(self):
         """The FileSet should be able to move a range that contains only a single file, i.e. follows the scheme: (n, n)."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 1
-        
         test_set.move_files((4, 4), (6, 7))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(4, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving a single-file range.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 4], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(6, range(0, 0+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 7],  "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 2, 3, 5, 6, 4, 7, 8], 4, "consisting of a single file")
+    
     def test_move_range_with_gaps_middle_to_middle_strip_gaps(self):
         """The FileSet should be able to move a range with gaps from middle to middle, stripping the gaps in the process."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((2, 4), (6, 7), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 6],  "The FileSet doesn't correctly close resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 2, 4, 7, 8], 7, "with gaps from middle to middle, stripping the gaps")
+    
     def test_move_range_with_gaps_middle_to_middle_preserve_gaps(self):
-        """The FileSet should be able to move a range with gaps from middle to middle, stripping the gaps in the process."""
+        """The FileSet should be able to move a range with gaps from middle to middle, preserving the gaps in the process."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (6, 7), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps, preserving the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 7],  "The FileSet doesn't correctly close resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 2, None, 4, 7, 8], 4, "with gaps from middle to middle, preserving the gaps")
+    
     def test_move_range_with_gaps_middle_to_end_strip_gaps(self):
         """The FileSet should be able to move a range with gaps from middle to end when stripping the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((2, 4), (8, 9), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps to the end, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 8), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(6, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet tries to close resulting gap-space even though there is none when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 7, 8, 2, 4], 7, "with gaps to the end, stripping the gaps")
+    
     def test_move_range_with_gaps_middle_to_end_preserve_gaps(self):
         """The FileSet should be able to move a range with gaps from middle to end when preserving the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (8, 9), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps to the end, presering the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 8), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(6, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [], "The FileSet tries to close resulting gap-space even though there is none when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 7, 8, 2, None, 4], 6, "with gaps to the end, preserving the gaps")
+    
     def test_move_range_with_gaps_middle_to_front_strip_gaps(self):
         """The FileSet should be able to move a range with gaps from middle to front when stripping the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((2, 4), (-1, 0), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps to the front, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(0, 1), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(0, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(5, 8), 4],  "The FileSet doesn't correctly close resulting gap-space.")
-
+        self.check_move_result(test_set, test_files, [2, 4, 0, 1, 5, 6, 7, 8], 9, "with gaps to the front, stripping the gaps")
+    
     def test_move_range_with_gaps_middle_to_front_preserve_gaps(self):
         """The FileSet should be able to move a range with gaps from middle to front when preserving the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (-1, 0), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps to the front, preserving the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(0, 1), 3], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(0, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(5, 8), 5],  "The FileSet doesn't correctly close resulting gap-space.")
-
+        self.check_move_result(test_set, test_files, [2, None, 4, 0, 1, 5, 6, 7, 8], 4, "with gaps to the front, preserving the gaps")
+    
     def test_move_range_with_gaps_end_to_front_strip_gaps(self):
         """The FileSet should be able to move a range with gaps from end to front when stripping the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((7, 9), (-1, 0), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(7, 9+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps from the end to the front, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(0, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(0, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [],  "The FileSet tries to close resulting gap-space even though there is none when moving from the end.")
+        self.check_move_result(test_set, test_files, [7, 8, 0, 1, 2, None, 4, 5, 6], 8, "with gaps from the end to the front, stripping the gaps")
     
     def test_move_range_with_gaps_end_to_front_preserve_gaps(self):
         """The FileSet should be able to move a range with gaps from end to front when preserving the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((7, 9), (-1, 0), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(7, 9+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps from the end to the front, preserving the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(0, 6), 3], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(0, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [],  "The FileSet tries to close resulting gap-space even though there is none when moving from the end.")
+        self.check_move_result(test_set, test_files, [7, 8, None, 0, 1, 2, None, 4, 5, 6], 8, "with gaps from the end to the front, preserving the gaps")
     
     def test_move_range_with_gaps_front_to_end(self):
-        """The FileSet should be able to move a range with gaps from front to end when stripping the gaps.."""
+        """The FileSet should be able to move a range with gaps from front to end when stripping the gaps."""
         test_files = ['test (0).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 1
-        
         test_set.move_files((0, 1), (8, 9), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(0, 1+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps from the front to the end, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(2, 8), 0], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(7, range(0, 0+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [],  "The FileSet tries to close resulting gap-space even though there is none when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [2, None, 4, 5, 6, 7, 8, 0], 7, "with gaps from the front to the end, stripping the gaps")
+    
     def test_move_range_with_gaps_front_to_end_preserve_gaps(self):
-        """The FileSet should be able to move a range with gaps from front to end when preserving the gaps."""
+        """The FileSet should be able to move a range with gaps from front to end when preserving the gaps, without leaving a trailing gap."""
         test_files = ['test (0).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 2
-        
         test_set.move_files((0, 1), (8, 9), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(0, 1+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving a range with gaps from the front to the end, preserving the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(2, 8), 0], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(7, range(0, 1+1))
-        mock_assert_msg(mock_move_range.assert_called_once, [],  "The FileSet tries to close resulting gap-space even though there is none when moving to the end.")
-        
+        self.check_move_result(test_set, test_files, [2, None, 4, 5, 6, 7, 8, 0], 7, "with gaps from the front to the end, preserving the gaps")
+    
     def test_move_empty_range_upwards_strip_gaps(self):
-        """The FileSet should be able to move an empty range upwards when stripping the gaps.."""
+        """The FileSet should be able to move an empty range upwards when stripping the gaps, effectively closing the gap."""
         test_files = ['test (0).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 0
-        
         test_set.move_files((2, 4), (6, 7), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving an empty range upwards, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 0))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 4],  "The FileSet fails to close the resulting gap-space.")
+        self.check_move_result(test_set, test_files, [0, None, 5, 6, 7, 8], 4, "that is empty upwards, stripping the gaps")
     
     def test_move_empty_range_updwards_preserve_gaps(self):
         """The FileSet should be able to move an empty range upwards when preserving the gaps."""
         test_files = ['test (0).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (6, 7), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving an empty range upwards, preserving the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 7],  "The FileSet fails to close the resulting gap-space.")
-        
+        self.check_move_result(test_set, test_files, [0, None, 5, 6, None, None, None, 7, 8], 2, "that is empty upwards, preserving the gaps")
+    
     def test_move_empty_range_downwards_strip_gaps(self):
         """The FileSet should be able to move an empty range downwards, effectively closing the gap with option strip_gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 0
-        
         test_set.move_files((2, 4), (0, 1), strip_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(True), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files when moving an empty range downwards, stripping the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(1, 1), 1], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(1, range(0, 0))
-        mock_assert_msg(mock_move_range.assert_called_with, [(5, 8), 2],  "The FileSet fails to close the resulting gap-space.")
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 7, 8], 4, "that is empty downwards, stripping the gaps")
     
     def test_move_empty_range_downwards_preserve_gaps(self):
         """The FileSet should be able to move an empty range downwards when preserving the gaps."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (0, 1), preserve_gaps=True)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(True)], "The FileSet fails to temporarily remove the correct files when moving an empty range downwards, preserving the gaps.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(1, 1), 4], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(1, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(5, 8), 5],  "The FileSet fails to close the resulting gap-space.")
+        self.check_move_result(test_set, test_files, [0, None, None, None, 1, 5, 6, 7, 8], 1, "that is empty downwards, preserving the gaps")
+    
+    def test_move_multi_assigned_index(self):
+        """The FileSet should move all files of a multi-assigned index along with it."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (1).png', 'test (2).jpg', 'test (3).jpg']
+        test_set = FileSet(self.pattern, test_files)
         
-    def test_move_if_already_tmp_files(self):
-        """The FileSet should be able to move the files correctly even if there already are files following the tmp-files pattern."""
-        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
+        test_set.move_files((1, 1), (3, 4))
+        
+        expected_names = {'test (0).jpg': 'test (0).jpg', 'test (1).jpg': 'test (3).jpg', 'test (1).png': 'test (3).png', 'test (2).jpg': 'test (1).jpg', 'test (3).jpg': 'test (2).jpg'}
+        self.assertEqual(replay_renames(test_files, mock_rename), expected_names, "The FileSet fails to physically move all files of a multi-assigned index.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 3: ['jpg', 'png']}, "The FileSet fails to logically move all files of a multi-assigned index.")
+    
+    def test_gaps_without_option(self):
+        """The FileSet should raise an error without renaming anything if the range contains gaps and no gap-handling option is chosen."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), ['tmp1.png'])
-        mock_add_file_set.return_value = 3
+        with self.assertRaises(FileSet.IndexUnassignedError, msg="The FileSet fails to recognize a gap in the range to move."):
+            test_set.move_files((2, 4), (6, 7))
         
-        test_set.move_files((2, 4), (6, 7))
+        mock_rename.assert_not_called()
+    
+    def test_conflicting_options(self):
+        """The FileSet should raise an error if the range contains gaps and both gap-handling options are chosen."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
+        test_set = FileSet(self.pattern, test_files)
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (1, 2), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files into the tmp FileSet if there already are tmp files.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(2, 4+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 7], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
+        with self.assertRaises(FileSet.ConflictingOptionsError, msg="The FileSet fails to recognize conflicting gap-handling options."):
+            test_set.move_files((2, 4), (6, 7), strip_gaps=True, preserve_gaps=True)
         
     def test_invalid_indexes_range(self):
         """The FileSet should recognize invalid (negative) indexes in the range and raise an error."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 1
-        
         with self.assertRaises(ValueError, msg="The FileSet fails to recognize an invalid index in the range."):
             test_set.move_files((-2, 0), (6, 7))
         
@@ -435,9 +295,6 @@ class MoveFilesTests(unittest.TestCase):
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         with self.assertRaises(ValueError, msg="The FileSet fails to recognize an invalid index in the spot."):
             test_set.move_files((2, 4), (-6, -7))
     
@@ -446,9 +303,6 @@ class MoveFilesTests(unittest.TestCase):
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         try:
             test_set.move_files((2, 4), (-1, 0))
         except ValueError:
@@ -459,9 +313,6 @@ class MoveFilesTests(unittest.TestCase):
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         with self.assertRaises(ValueError, msg="The FileSet fails to recognize an invalid spot."):
             test_set.move_files((2, 4), (5, 8))
         
@@ -470,47 +321,39 @@ class MoveFilesTests(unittest.TestCase):
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((4, 2), (6, 7))
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files if the range is in the wrong order.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 6), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(4, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(7, 8), 7], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
+        self.check_move_result(test_set, test_files, [0, 1, 5, 6, 2, 3, 4, 7, 8], 6, "if the range is in the wrong order")
     
     def test_spot_wrong_order(self):
         """The FileSet should be able to deal with a valid spot that's given from higher to lower."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         try:
             test_set.move_files((2, 4), (6, 5))
         except ValueError:
             self.fail("The FileSet fails to deal with a spot that's given from higher to lower.")
         
-        mock_assert_msg(mock_add_file_set.assert_any_call, [test_set, (-1, 0), range(2, 4+1), strip_gaps(False), preserve_gaps(False)], "The FileSet fails to temporarily remove the correct files if the spot is in the wrong order.")
-        mock_assert_msg(mock_move_range.assert_any_call, [(5, 5), 2], "The FileSet fails to make space to readd the removed files into their destined position.")
-        self.check_readd_call(3, range(0, 2+1))
-        mock_assert_msg(mock_move_range.assert_called_with, [(6, 8), 6], "The FileSet doesn't correctly attempt to close possibly resulting gap-space.")
+        self.check_move_result(test_set, test_files, [0, 1, 5, 2, 3, 4, 6, 7, 8], 5, "if the spot is in the wrong order")
         
     def test_spot_in_range(self):
         """The FileSet should do nothing when the given spot is actually covered by the range."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        mock_files_detected.return_value = FileSet(('tmp', ''), [])
-        mock_add_file_set.return_value = 3
-        
         test_set.move_files((2, 4), (3, 4))
         
-        mock_assert_msg(mock_add_file_set.assert_not_called, [], "The FileSet temporarily removes files or tries to add removed files even though no operation is necessary.")
-        mock_assert_msg(mock_move_range.assert_not_called, [], "The FileSet makes space to readd removed files or tries to close gaps even though no operation is necessary.")
+        mock_rename.assert_not_called()
     
+    def test_move_interval_set(self):
+        """The FileSet should be able to gather the files of an IntervalSet consisting of several runs at the given spot."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg']
+        test_set = FileSet(self.pattern, test_files)
+        
+        test_set.move_files(IntervalSet([(1, 1), (5, 6)]), (2, 3))
+        
+        self.check_move_result(test_set, test_files, [0, 2, 1, 5, 6, 3, 4, 7, 8], 9, "of an IntervalSet with several runs")    
     
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,66 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from FileSet import FileSet
+from test.testing_tools import LatencyFileSystem
+
+
+class RenameWorkersTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pattern = ('test (', ')')
+
+    def setUp(self):
+        FileSet.rename_workers = 8
+
+    def tearDown(self):
+        FileSet.rename_workers = 1
+        FileSet.commit_batch()
+
+    def test_shift_tail(self):
+        """The FileSet should shift a long range of files correctly when renaming them concurrently."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(300)]
+        test_set = FileSet(self.pattern, test_files)
+        file_system = LatencyFileSystem(test_files)
+
+        with mock.patch('FileSet.rename', new=file_system.rename):
+            test_set.move_range((0, 299), 1)
+
+        expected_mapping = {'test ({}).jpg'.format(i): 'test ({}).jpg'.format(i+1) for i in range(300)}
+        self.assertEqual(file_system.get_name_mapping(), expected_mapping, "The FileSet fails to shift the files when renaming them concurrently.")
+        self.assertEqual(set(test_set.files), set(range(1, 301)), "The FileSet fails to update its files dictionary.")
+
+    def test_change_pattern(self):
+        """The FileSet should change the pattern of all files when renaming them concurrently."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(100)]
+        test_set = FileSet(self.pattern, test_files)
+        file_system = LatencyFileSystem(test_files)
+
+        with mock.patch('FileSet.rename', new=file_system.rename):
+            test_set.change_pattern(('new ', ''))
+
+        self.assertEqual(set(file_system.files), {'new {}.jpg'.format(i) for i in range(100)}, "The FileSet fails to change the pattern of the files when renaming them concurrently.")
+
+    def test_batch_commit(self):
+        """Committing a batch should rename the files concurrently as well."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(100)]
+        test_set = FileSet(self.pattern, test_files)
+        file_system = LatencyFileSystem(test_files)
+
+        with mock.patch('FileSet.rename', new=file_system.rename):
+            with FileSet.batch():
+                test_set.move_range((0, 49), 100)
+                test_set.move_range((50, 149), 0)
+
+        expected_mapping = {'test ({}).jpg'.format(i): 'test ({}).jpg'.format((i+50) % 100) for i in range(100)}
+        self.assertEqual(file_system.get_name_mapping(), expected_mapping, "The batch fails to rename the files correctly when renaming them concurrently.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,97 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
+from FileSet import FileSet
+from RenamePlan import RenamePlan
+
+
+class StagingTests(unittest.TestCase):
+    """The FileSet should park files under temporary names within the hidden staging directory only while an operation is performed."""
+
+    def setUp(self):
+        DirectorySnapshot.clear_cache()
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.previous_directory = os.getcwd()
+        os.chdir(self.temp_directory.name)
+
+        self.test_files = ['test ({}).jpg'.format(i) for i in range(3)] + ['tmp0.jpg']
+        for file_name in self.test_files:
+            with open(file_name, 'w') as file:
+                file.write(file_name)
+        self.test_set = FileSet.files_detected(('test (', ')'))
+
+    def tearDown(self):
+        FileSet.commit_batch()
+        os.chdir(self.previous_directory)
+        self.temp_directory.cleanup()
+
+        DirectorySnapshot.clear_cache()
+
+    def _get_contents(self):
+        contents = {}
+        for file_name in os.listdir('.'):
+            with open(file_name) as file:
+                contents[file_name] = file.read()
+        return contents
+
+    def test_switch_files(self):
+        """Switching two files should rename one of them into the staging directory and remove the directory afterwards."""
+        staged_names = []
+        original_rename = os.rename
+        def rename(old_name, new_name):
+            original_rename(old_name, new_name)
+            if os.path.dirname(new_name) == RenamePlan.STAGING_DIRECTORY:
+                staged_names.append(new_name)
+
+        with mock.patch('FileSet.rename', new=rename):
+            self.test_set.switch_files(0, 2)
+
+        self.assertEqual(len(staged_names), 1, "The cycle is not broken up using the staging directory.")
+        self.assertEqual(self._get_contents(), {'test (0).jpg': 'test (2).jpg', 'test (1).jpg': 'test (1).jpg', 'test (2).jpg': 'test (0).jpg', 'tmp0.jpg': 'tmp0.jpg'},
+                         "The files are not switched or a file outside of the set is touched.")
+
+    def test_batch(self):
+        """Committing a batch that contains a cycle should leave no staging directory behind."""
+        with FileSet.batch():
+            self.test_set.move_files((0, 0), (2, 3))
+
+        self.assertEqual(self._get_contents(), {'test (0).jpg': 'test (1).jpg', 'test (1).jpg': 'test (2).jpg', 'test (2).jpg': 'test (0).jpg', 'tmp0.jpg': 'tmp0.jpg'},
+                         "The files are not rotated correctly.")
+
+    def test_failure(self):
+        """If an operation fails, the staged files should be restored and the staging directory removed."""
+        original_rename = os.rename
+        failed_renames = []
+        def rename(old_name, new_name):
+            if new_name == 'test (1).jpg' and not failed_renames:
+                failed_renames.append(new_name)
+                raise PermissionError(new_name)
+            original_rename(old_name, new_name)
+
+        with mock.patch('FileSet.rename', new=rename):
+            with self.assertRaises(RenamePlan.RenameError, msg="The failing rename is not reported."):
+                self.test_set.move_files((0, 0), (2, 3))
+
+        self.assertEqual(self._get_contents(), {file_name: file_name for file_name in self.test_files}, "The files are not restored after a failure.")
+
+    def test_foreign_staging_files(self):
+        """A staging directory holding the files of another process should be left in place."""
+        os.mkdir(RenamePlan.STAGING_DIRECTORY)
+        open(os.path.join(RenamePlan.STAGING_DIRECTORY, 'foreign'), 'w').close()
+
+        self.test_set.switch_files(0, 1)
+
+        self.assertEqual(os.listdir(RenamePlan.STAGING_DIRECTORY), ['foreign'], "The staging directory or files of another process are removed.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,52 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from FileSet import FileSet
+
+
+mock_isfile = mock.MagicMock(name='isfile')
+
+@mock.patch('FileSet.isfile', new=mock_isfile)
+class SyncFilesTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pattern = ('test (', ')')
+
+    def tearDown(self):
+        mock_isfile.reset_mock()
+        mock_isfile.side_effect = None
+
+
+    def test_sync_files(self):
+        """The FileSet should add the given files that exist and remove the given files that don't exist anymore."""
+        test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg']
+        test_set = FileSet(self.pattern, test_files)
+
+        existing_files = {'test (0).jpg', 'test (1).jpg', 'test (4).png'}
+        mock_isfile.side_effect = lambda file_name: file_name in existing_files
+        added_files, removed_files = test_set.sync_files(['test (4).png', 'test (2).jpg', 'test (1).jpg', 'test (3).jpg', 'other (5).jpg'])
+
+        self.assertEqual(added_files, [(4, 'png')], "The FileSet fails to report the added files.")
+        self.assertEqual(removed_files, [(2, 'jpg')], "The FileSet fails to report the removed files.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 4: ['png']}, "The FileSet fails to apply the changes to its files dictionary.")
+        self.assertEqual(test_set.max_index, 4, "The FileSet fails to update its max index.")
+
+    def test_file_exists_function(self):
+        """The FileSet should use the given function to check whether the files exist."""
+        test_set = FileSet(self.pattern, ['test (0).jpg'])
+
+        added_files, removed_files = test_set.sync_files(['test (0).jpg', 'test (1)'], file_exists=lambda file_name: file_name == 'test (1)')
+
+        mock_isfile.assert_not_called()
+        self.assertEqual((added_files, removed_files), ([(1, '')], [(0, 'jpg')]), "The FileSet doesn't use the given function to check whether the files exist.")
+        self.assertEqual(test_set.files, {1: ['']}, "The FileSet fails to apply the changes to its files dictionary.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
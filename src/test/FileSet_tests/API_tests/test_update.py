@@ -0,0 +1,92 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
+from FileSet import FileSet
+from test.testing_tools import mock_scandir_gen
+
+
+mock_scandir = mock.MagicMock(name='scandir')
+
+@mock.patch('FileSet.scandir', new=mock_scandir)
+class UpdateTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pattern = ('test (', ')')
+
+    def tearDown(self):
+        mock_scandir.reset_mock()
+        DirectorySnapshot.clear_cache() # the mocked directory listings differ from test to test
+
+    def _scan(self, file_names):
+        mock_scandir.return_value = mock_scandir_gen([(file_name, True) for file_name in file_names])
+        DirectorySnapshot.clear_cache()
+
+
+    def test_incremental_update(self):
+        """The FileSet should only apply the files that have been added and removed to its files dictionary and return them."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(100)]
+        test_set = FileSet(self.pattern, test_files)
+        files_dict = test_set.files
+
+        self._scan([file_name for file_name in test_files if file_name != 'test (5).jpg'] + ['test (3).png', 'test (101).gif'])
+        added_files, removed_files = test_set.update()
+
+        self.assertEqual(added_files, [(3, 'png'), (101, 'gif')], "The FileSet fails to report the added files.")
+        self.assertEqual(removed_files, [(5, 'jpg')], "The FileSet fails to report the removed files.")
+        self.assertIs(test_set.files, files_dict, "The FileSet rebuilds its files dictionary even though only a few files have changed.")
+
+        expected_files = {i: ['jpg'] for i in range(100) if i != 5}
+        expected_files.update({3: ['jpg', 'png'], 101: ['gif']})
+        self.assertEqual(test_set.files, expected_files, "The FileSet fails to apply the changes to its files.")
+        self.assertEqual(test_set.files.gaps(), [(5, 5), (100, 100)], "The FileSet fails to keep its flaw index up to date.")
+        self.assertEqual(test_set.max_index, 101, "The FileSet fails to update its max_index.")
+
+    def test_changed_file_type(self):
+        """The FileSet should recognize a file which's file type has changed."""
+        test_set = FileSet(self.pattern, ['test (0).jpg', 'test (1).jpg'])
+
+        self._scan(['test (0).jpg', 'test (1).png'])
+        added_files, removed_files = test_set.update()
+
+        self.assertEqual((added_files, removed_files), ([(1, 'png')], [(1, 'jpg')]), "The FileSet fails to recognize a changed file type.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['png']}, "The FileSet fails to apply the changed file type.")
+
+    def test_removed_last_files(self):
+        """The FileSet should rebuild its files if most of them have changed and recompute its max_index."""
+        test_set = FileSet(self.pattern, ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (7).jpg'])
+
+        self._scan(['test (0).jpg', 'other (1).jpg'])
+        added_files, removed_files = test_set.update()
+
+        self.assertEqual((added_files, removed_files), ([], [(1, 'jpg'), (2, 'jpg'), (7, 'jpg')]), "The FileSet fails to report the removed files.")
+        self.assertEqual(test_set.files, {0: ['jpg']}, "The FileSet fails to rebuild its files.")
+        self.assertEqual(test_set.max_index, 0, "The FileSet keeps a stale max_index after its highest files have been removed.")
+
+    def test_no_changes(self):
+        """The FileSet should report no changes if the directory still contains exactly its files."""
+        test_set = FileSet(self.pattern, ['test (0).jpg', 'test (0).png', 'test (1).jpg'])
+
+        self._scan(['test (1).jpg', 'test (0).png', 'test (0).jpg'])
+
+        self.assertEqual(test_set.update(), ([], []), "The FileSet reports changes even though there are none.")
+        self.assertEqual(test_set.files, {0: ['jpg', 'png'], 1: ['jpg']}, "The FileSet changes its files even though there are no changes.")
+
+    def test_compact_files(self):
+        """The FileSet should keep its files in a CompactFilesDict when updating."""
+        test_set = FileSet(self.pattern, ['test (0).jpg'], compact_files=True)
+
+        self._scan(['test (1).jpg', 'test (2).jpg'])
+        test_set.update()
+
+        self.assertEqual(type(test_set.files).__name__, 'CompactFilesDict', "The FileSet loses its CompactFilesDict when updating.")
+        self.assertEqual(dict(test_set.files), {1: ['jpg'], 2: ['jpg']}, "The FileSet fails to update its compact files.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -5,6 +5,7 @@ Created on 26.08.2018
 '''
 import unittest
 import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
 from FileSet import FileSet
 from test.testing_tools import mock_scandir_gen
 
@@ -18,6 +19,7 @@ class FilesDetectedInitializerTests(unittest.TestCase):
     
     def tearDown(self):
         mock_scandir.reset_mock()
+        DirectorySnapshot.clear_cache() # the mocked directory listings differ from test to test
     
     
     def test_simple_coherent_file_set(self):
@@ -6,11 +6,12 @@ Created on 27.08.2018
 import unittest
 import unittest.mock as mock
 from FileSet import FileSet
-from test.testing_tools import mock_assert_msg, mock_assert_many_msg 
+from test.testing_tools import mock_assert_msg, replay_renames
 
 
-mock_change_index = mock.MagicMock(name='change_index')
-@mock.patch('FileSet.FileSet.change_index', new=mock_change_index)
+mock_rename = mock.MagicMock(name='rename')
+
+@mock.patch('FileSet.rename', new=mock_rename)
 class MoveRangeTests(unittest.TestCase):
 
     @classmethod
@@ -18,8 +19,20 @@ class MoveRangeTests(unittest.TestCase):
         cls.pattern = ('test (', ')')
     
     def tearDown(self):
-        mock_change_index.reset_mock()
-        mock_change_index.side_effect = None
+        mock_rename.reset_mock()
+    
+    def check_move_result(self, test_set, test_files, index_mapping, msg):
+        """
+        Convenience method for checking the outcome of a move operation, both physically and logically.
+        
+        @param index_mapping: A dictionary mapping the original index of every file to its expected index
+        """
+        expected_names = {'test ({}).jpg'.format(old_index): 'test ({}).jpg'.format(new_index) for old_index, new_index in index_mapping.items()}
+        expected_files = {new_index: ['jpg'] for new_index in index_mapping.values()}
+        
+        self.assertEqual(replay_renames(test_files, mock_rename), expected_names, "The FileSet fails to physically move {}.".format(msg))
+        self.assertEqual(test_set.files, expected_files, "The FileSet fails to logically move {}.".format(msg))
+        self.assertEqual(mock_rename.call_count, sum(old_index != new_index for old_index, new_index in index_mapping.items()), "The FileSet renames the files more often than necessary when moving {}.".format(msg))
     
     
     def test_beginning_to_end(self):
@@ -29,12 +42,7 @@ class MoveRangeTests(unittest.TestCase):
         
         test_set.move_range((0, 2), 7)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [0, 7]),
-                (mock_change_index.assert_any_call, [1, 8]),
-                (mock_change_index.assert_any_call, [2, 9])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move a range from the beginning to the end of the set.")
+        self.check_move_result(test_set, test_files, {0: 7, 1: 8, 2: 9, 3: 3, 4: 4, 5: 5, 6: 6}, "a range from the beginning to the end of the set")
         
     def test_dont_move_with_amount_0(self):
         """The FileSet should do nothing if the range isn't actually to be moved."""
@@ -43,7 +51,7 @@ class MoveRangeTests(unittest.TestCase):
         
         test_set.move_range((0, 2), 0)
         
-        mock_assert_msg(mock_change_index.assert_not_called, [], "The FileSet tries to move a range when in actuality it's moved by an amount of 0.")
+        mock_assert_msg(mock_rename.assert_not_called, [], "The FileSet tries to move a range when in actuality it's moved by an amount of 0.")
         
     def test_move_into_big_gap(self):
         """The FileSet should be able to move a range into a gap within the set that has more than enough space for it."""
@@ -52,12 +60,7 @@ class MoveRangeTests(unittest.TestCase):
         
         test_set.move_range((0, 2), 6)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [0, 6]),
-                (mock_change_index.assert_any_call, [1, 7]),
-                (mock_change_index.assert_any_call, [2, 8])
-            ]    
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move a range into the middle of a big gap which surrounds it in spaces.")
+        self.check_move_result(test_set, test_files, {0: 6, 1: 7, 2: 8, 3: 3, 4: 4, 10: 10, 11: 11}, "a range into the middle of a big gap which surrounds it in spaces")
         
     def test_move_into_perfectly_fitting_gap(self):
         """The FileSet should be able to move a range into a range that has the exact same size."""
@@ -66,37 +69,18 @@ class MoveRangeTests(unittest.TestCase):
         
         test_set.move_range((0, 2), 4)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [0, 4]),
-                (mock_change_index.assert_any_call, [1, 5]),
-                (mock_change_index.assert_any_call, [2, 6])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move a range into a gap of exactly the same size.")
+        self.check_move_result(test_set, test_files, {0: 4, 1: 5, 2: 6, 3: 3, 7: 7}, "a range into a gap of exactly the same size")
         
     def test_move_into_too_small_gap(self):
-        """The FileSet should recognize when moving a range into a gap that is too tight and raise an error after undoing its operation."""
+        """The FileSet should recognize when moving a range into a gap that is too tight and raise an error before renaming any file."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (4).jpg', 'test (5).jpg', 'test (6).jpg', 'test (7).jpg', 'test (8).jpg'] 
         test_set = FileSet(self.pattern, test_files)
         
-        def mock_change_index_side_effect(f, t):
-            if t == 4: raise FileSet.IndexAssignedError(t, f, "Index Assigned.")
-        mock_change_index.side_effect = mock_change_index_side_effect
-        
         with self.assertRaises(FileSet.FileCollisionError, msg="The FileSet fails to recognize when a range will collide with other files by being moved into a tight gap."):
             test_set.move_range((6, 8), 2)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [6, 2]),
-                (mock_change_index.assert_any_call, [7, 3]),
-                (mock_change_index.assert_any_call, [8, 4])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet doesn't actually try to move the range into the tight gap.")
-        
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [3, 7]),
-                (mock_change_index.assert_any_call, [2, 6])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to undo its operations after detecting a collision when being moved into the too-tight gap.")
+        mock_assert_msg(mock_rename.assert_not_called, [], "The FileSet renames files even though the range collides with other files.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 4: ['jpg'], 5: ['jpg'], 6: ['jpg'], 7: ['jpg'], 8: ['jpg']}, "The FileSet changes its files even though the range collides with other files.")
         
     def test_move_range_downwards(self):
         """The FileSet should be able to move a range downwards."""
@@ -105,27 +89,19 @@ class MoveRangeTests(unittest.TestCase):
         
         test_set.move_range((7, 8), 2)
         
-        assertion_calls = [
-            (mock_change_index.assert_any_call, [7, 2]),
-            (mock_change_index.assert_any_call, [8, 3])
-        ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move the range downwards.")
+        self.check_move_result(test_set, test_files, {0: 0, 1: 1, 6: 6, 7: 2, 8: 3}, "the range downwards")
         
     def test_move_upwards_implicit_self_collision(self):
-        """The FileSet should be able to move a range downwards, even if its new position will overlap with its old position. (i.e. in this case, the current 2 will be moved to the current 3, which is assigned at the moment)"""
+        """The FileSet should be able to move a range upwards, even if its new position will overlap with its old position. (i.e. in this case, the current 2 will be moved to the current 3, which is assigned at the moment)"""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg']
         test_set = FileSet(self.pattern, test_files)
         
         try:
             test_set.move_range((2, 3), 3)
-        except FileSet.IndexAssignedError:
+        except FileSet.FileCollisionError:
             self.fail("The FileSet can't move a range upwards if its new leftmost position is included in it, causing a file to seemingly 'collide' with the range's old position.")
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [3, 4]),
-                (mock_change_index.assert_called_with, [2, 3])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to actually move the range if there is an implicit self-collision.")
+        self.check_move_result(test_set, test_files, {0: 0, 1: 1, 2: 3, 3: 4}, "a range upwards if there is an implicit self-collision")
         
     def test_move_downwards_implicit_self_collision(self):
         """The FileSet should be able to move a range downwards, even if its new position will overlap with its old position. (i.e. in this case, the current 3 will be moved to the current 2, which is assigned at the moment)"""
@@ -134,120 +110,69 @@ class MoveRangeTests(unittest.TestCase):
         
         try:
             test_set.move_range((2, 3), 1)
-        except FileSet.IndexAssignedError:
+        except FileSet.FileCollisionError:
             self.fail("The FileSet can't move a range downwards if its new position causes a file to seemingly 'collide' with the range's old position.")
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [2, 1]),
-                (mock_change_index.assert_called_with, [3, 2])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to actually move the range if there is an implicit self-collision.")
+        self.check_move_result(test_set, test_files, {0: 0, 2: 1, 3: 2}, "a range downwards if there is an implicit self-collision")
         
     def test_move_range_with_gaps_upwards(self):
         """The FileSet should be able to move a range with gaps upwards, preserving the gaps."""
         test_files = ['test (0).jpg', 'test (3).jpg', 'test (4).jpg', 'test (5).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        def mock_change_index_side_effect(f, _):
-            if f in [1, 2]:
-                raise FileSet.IndexUnassignedError()
-        mock_change_index.side_effect = mock_change_index_side_effect
+        test_set.move_range((0, 4), 6)
         
-        try:
-            test_set.move_range((0, 4), 6)
-        except FileSet.IndexUnassignedError:
-            self.fail("The FileSet fails to move a range upwards if it contains gaps as it doesn't handle the IndexUnassignedError.")
-            
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [4, 10]),
-                (mock_change_index.assert_any_call, [3, 9]),
-                (mock_change_index.assert_called_with, [0, 6])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move a range upwards if it contains gaps.")
+        self.check_move_result(test_set, test_files, {0: 6, 3: 9, 4: 10, 5: 5}, "a range with gaps upwards")
     
     def test_move_range_with_gaps_downwards(self):
         """The FileSet should be able to move a range with gaps downwards, preserving the gaps."""
         test_files = ['test (3).jpg', 'test (4).jpg', 'test (7).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        def mock_change_index_side_effect(f, _):
-            if f in [0, 1, 5, 6]:
-                raise FileSet.IndexUnassignedError()
-        mock_change_index.side_effect = mock_change_index_side_effect
+        test_set.move_range((3, 7), 0)
         
-        try:
-            test_set.move_range((3, 7), 0)
-        except FileSet.IndexUnassignedError:
-            self.fail("The FileSet fails to move a range downwards if it contains gaps as it doesn't handle the IndexUnassignedError.")
+        self.check_move_result(test_set, test_files, {3: 0, 4: 1, 7: 4}, "a range with gaps downwards")
+        
+    def test_move_range_with_huge_gap(self):
+        """The FileSet should only visit the assigned indexes of a range, regardless of the width of its gaps."""
+        test_files = ['test (0).jpg', 'test (20240101120000).jpg']
+        test_set = FileSet(self.pattern, test_files)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [3, 0]),
-                (mock_change_index.assert_any_call, [4, 1]),
-                (mock_change_index.assert_called_with, [7, 4])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move a range downwards if it contains gaps.")
+        test_set.move_range((0, 20240101120000), 1)
+        
+        self.check_move_result(test_set, test_files, {0: 1, 20240101120000: 20240101120001}, "a range with a huge gap")
         
     def test_move_gap(self):
-        """The FileSet should do nothing when instructed to move a gap and ignore the IndexUnassignedErrors."""
+        """The FileSet should do nothing when instructed to move a gap, since only assigned indexes are visited."""
         test_files = ['test (0).jpg', 'test (4).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        def mock_change_index_side_effect(f, t):
-            raise FileSet.IndexUnassignedError(f, "Index unassigned.")
-        mock_change_index.side_effect = mock_change_index_side_effect
-        
-        try:
-            test_set.move_range((1, 3), 5)
-        except FileSet.IndexUnassignedError:
-            self.fail("The FileSet fails to ignore the IndexUnassignedError and thus the gaps.")
+        test_set.move_range((1, 3), 5)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [3, 7]),
-                (mock_change_index.assert_any_call, [2, 6]),
-                (mock_change_index.assert_any_call, [1, 5])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet doesn't even try to move the range if it is an entire gap.")
+        mock_assert_msg(mock_rename.assert_not_called, [], "The FileSet tries to move the unassigned indexes of a range that is an entire gap.")
         
     def test_collision_with_files(self):
-        """THe FileSet should recognize when the moved range collides with existing files and undo its operation."""
+        """The FileSet should recognize when the moved range collides with existing files and raise an error before renaming any file."""
         test_files = ['test (0).jpg', 'test (1).jpg', 'test (2).jpg', 'test (3).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        def mock_change_index_side_effect(f, t):
-            if t == 3: raise FileSet.IndexAssignedError(f, t, "Index assigned.")
-        mock_change_index.side_effect = mock_change_index_side_effect
-        
         with self.assertRaises(FileSet.FileCollisionError, msg="The FileSet fails to recognize when a file is colliding due to the movement operation."):
             test_set.move_range((1, 2), 3)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [2, 4]),
-                (mock_change_index.assert_any_call, [1, 3])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet does not actually try to move the range.")
-        
-        mock_assert_msg(mock_change_index.assert_any_call, [4, 2], "The FileSet does not properly undo its operations after discovering a file collision.")
+        mock_assert_msg(mock_rename.assert_not_called, [], "The FileSet renames files even though the range collides with another file.")
+        self.assertEqual(test_set.files, {0: ['jpg'], 1: ['jpg'], 2: ['jpg'], 3: ['jpg']}, "The FileSet changes its files even though the range collides with another file.")
         
     def test_move_gap_onto_files(self):
         """The FileSet should NOT find a collision when moving a gap onto other files."""
         test_files = ['test (0).jpg', 'test (4).jpg']
         test_set = FileSet(self.pattern, test_files)
         
-        def mock_change_index_side_effect(f, t):
-            raise FileSet.IndexUnassignedError(f, t, "Index does not exist.")
-        mock_change_index.side_effect = mock_change_index_side_effect
-        
-        test_set.move_range((1, 2), 4)
-        
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [2, 5]),
-                (mock_change_index.assert_any_call, [1, 4])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet does not actually try to move the range.")
+        try:
+            test_set.move_range((1, 2), 4)
+        except FileSet.FileCollisionError:
+            self.fail("The FileSet finds a collision when moving a gap onto other files.")
         
-        with self.assertRaises(AssertionError, msg="The FileSet tries to undo its operation even though there shouldn't be a problem."):
-            ## This assertion should fail, since the call should NOT exist!
-            mock_assert_msg(mock_change_index.assert_any_call(5, 2))
+        mock_assert_msg(mock_rename.assert_not_called, [], "The FileSet tries to move the unassigned indexes of a gap onto other files.")
         
     def test_range_wrong_order(self):
         """The FileSet should still move the range correctly even if the range is given from higher to lower."""
@@ -256,13 +181,8 @@ class MoveRangeTests(unittest.TestCase):
         
         test_set.move_range((2, 0), 7)
         
-        assertion_calls = [
-                (mock_change_index.assert_any_call, [0, 7]),
-                (mock_change_index.assert_any_call, [1, 8]),
-                (mock_change_index.assert_any_call, [2, 9])
-            ]
-        mock_assert_many_msg(assertion_calls, "The FileSet fails to move a range from the beginning to the end of the set if the range is given in the wrong order.")
+        self.check_move_result(test_set, test_files, {0: 7, 1: 8, 2: 9, 3: 3, 4: 4, 5: 5, 6: 6}, "a range that is given in the wrong order")
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
-    unittest.main()
\ No newline at end of file
+    unittest.main()
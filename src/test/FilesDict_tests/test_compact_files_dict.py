@@ -0,0 +1,117 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import copy
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import FileSet
+from FilesDict import CompactFilesDict
+
+
+class CompactFilesDictTests(unittest.TestCase):
+
+    def test_mapping(self):
+        """The CompactFilesDict should behave like the plain dictionary it is created from."""
+        files_dict = CompactFilesDict({5: ['jpg'], 0: ['png'], 3: ['jpg', 'gif']})
+
+        self.assertEqual(dict(files_dict), {0: ['png'], 3: ['jpg', 'gif'], 5: ['jpg']}, "The CompactFilesDict fails to return the file types it is initialized with.")
+        self.assertEqual(list(files_dict), [0, 3, 5], "The CompactFilesDict fails to iterate over its indexes in ascending order.")
+        self.assertIn(3, files_dict, "The CompactFilesDict fails to find an assigned index.")
+        self.assertNotIn(4, files_dict, "The CompactFilesDict finds an unassigned index.")
+        self.assertEqual(files_dict.multi_assigned_indexes(), [3], "The CompactFilesDict fails to find its multi-assigned indexes.")
+        self.assertEqual(files_dict.gaps(), [(1, 2), (4, 4)], "The CompactFilesDict fails to find its gaps.")
+
+    def test_modifications(self):
+        """The CompactFilesDict should keep its indexes and flaws up to date when items and file types are changed."""
+        files_dict = CompactFilesDict({0: ['jpg'], 1: ['jpg'], 4: ['jpg']})
+
+        files_dict[2] = ['png']
+        files_dict.add_type(1, 'gif')
+        files_dict.remove_type(0, 'jpg')
+        del files_dict[4]
+        files_dict[9] = ['']
+
+        self.assertEqual(dict(files_dict), {1: ['jpg', 'gif'], 2: ['png'], 9: ['']}, "The CompactFilesDict fails to apply modifications.")
+        self.assertEqual(files_dict.max_index(), 9, "The CompactFilesDict fails to update its highest index.")
+        self.assertEqual(files_dict.gaps(), [(0, 0), (3, 8)], "The CompactFilesDict fails to update its gaps.")
+        self.assertEqual(files_dict.multi_assigned_indexes(), [1], "The CompactFilesDict fails to update its multi-assigned indexes.")
+
+        files_dict.remove_type(1, 'jpg')
+        self.assertEqual(files_dict[1], ['gif'], "The CompactFilesDict fails to turn a multi-assigned index back into a single one.")
+        self.assertEqual(files_dict.multi_assigned_indexes(), [], "The CompactFilesDict keeps an index multi-assigned after removing a file type.")
+
+    def test_returned_lists_are_copies(self):
+        """The CompactFilesDict should not be modified by changing a file types list it has returned."""
+        files_dict = CompactFilesDict({0: ['jpg', 'png']})
+
+        files_dict[0].append('gif')
+
+        self.assertEqual(files_dict[0], ['jpg', 'png'], "The CompactFilesDict can be modified through a returned file types list.")
+
+    def test_from_files(self):
+        """The CompactFilesDict should compile unsorted (index, file_type) pairs, merging those of the same index."""
+        files_dict = CompactFilesDict.from_files([(4, 'jpg'), (0, 'jpg'), (4, 'png'), (2, ''), (4, 'gif')])
+
+        self.assertEqual(dict(files_dict), {0: ['jpg'], 2: [''], 4: ['jpg', 'png', 'gif']}, "The CompactFilesDict fails to compile the given files.")
+        self.assertEqual(files_dict.multi_assigned_indexes(), [4], "The CompactFilesDict fails to register a multi-assigned index while compiling.")
+
+    def test_copy(self):
+        """The CompactFilesDict should stay independent and consistent when it is copied."""
+        files_dict = CompactFilesDict({3: ['jpg'], 1: ['jpg', 'png']})
+
+        for copied_dict in (files_dict.copy(), copy.copy(files_dict), copy.deepcopy(files_dict)):
+            copied_dict.add_type(3, 'gif')
+            self.assertIsInstance(copied_dict, CompactFilesDict, "The copy of the CompactFilesDict is not a CompactFilesDict anymore.")
+            self.assertEqual(dict(copied_dict), {1: ['jpg', 'png'], 3: ['jpg', 'gif']}, "The copy of the CompactFilesDict is inconsistent.")
+        self.assertEqual(files_dict[3], ['jpg'], "The CompactFilesDict is modified through its copy.")
+
+    @mock.patch('FileSet.rename')
+    def test_file_set_with_compact_files(self, mock_rename):
+        """The FileSet should store its files in a CompactFilesDict and work as usual if compact_files is given."""
+        test_set = FileSet.FileSet(('test', ''), ['test0.jpg', 'test1.png', 'test3.gif', 'test3.jpg'], compact_files=True)
+
+        self.assertIsInstance(test_set.files, CompactFilesDict, "The FileSet does not store its files in a CompactFilesDict.")
+        self.assertEqual(test_set.find_flaws(), ([(2, 2)], [(3, ['gif', 'jpg'])]), "The FileSet fails to find the flaws of its compact files.")
+
+        test_set.change_index(3, 2)
+
+        self.assertEqual(dict(test_set.files), {0: ['jpg'], 1: ['png'], 2: ['gif', 'jpg']}, "The FileSet fails to modify its compact files.")
+
+    def test_arrays_round_trip(self):
+        """The CompactFilesDict should be recreated from its internal arrays without losing files or flaws."""
+        files_dict = CompactFilesDict({0: ['jpg'], 1: ['png', 'jpg'], 4: ['gif']})
+
+        recreated_dict = CompactFilesDict.from_arrays(*files_dict.to_arrays())
+
+        self.assertEqual(dict(recreated_dict), {0: ['jpg'], 1: ['png', 'jpg'], 4: ['gif']}, "The CompactFilesDict loses files when being recreated from its arrays.")
+        self.assertEqual(recreated_dict.gaps(), [(2, 3)], "The recreated CompactFilesDict fails to find its gaps.")
+        self.assertEqual(recreated_dict.multi_assigned_indexes(), [1], "The recreated CompactFilesDict fails to find its multi-assigned indexes.")
+
+        recreated_dict.add_type(4, 'jpg')
+        self.assertEqual(recreated_dict[4], ['gif', 'jpg'], "The recreated CompactFilesDict can't be modified correctly.")
+
+    def test_files_detected_with_compact_files(self):
+        """The FileSet should compile the detected files straight into a CompactFilesDict if compact_files is given."""
+        with tempfile.TemporaryDirectory() as directory:
+            for file_name in ('test0.jpg', 'test2', 'test2.png', 'other1.jpg'):
+                open(os.path.join(directory, file_name), 'w').close()
+
+            previous_directory = os.getcwd()
+            os.chdir(directory)
+            try:
+                test_set = FileSet.FileSet.files_detected(('test', ''), compact_files=True)
+            finally:
+                os.chdir(previous_directory)
+
+        self.assertIsInstance(test_set.files, CompactFilesDict, "The FileSet does not detect its files into a CompactFilesDict.")
+        self.assertEqual({i: sorted(types) for i, types in test_set.files.items()}, {0: ['jpg'], 2: ['', 'png']}, "The FileSet fails to detect its files.")
+        self.assertEqual(test_set.max_index, 2, "The FileSet fails to find the max index of its detected files.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,118 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import random
+import unittest
+from FilesDict import FilesDict
+
+
+def _scan_gaps(files_dict):
+    """Find the gaps of the dictionary by scanning every index, like find_flaws used to."""
+    gaps = []
+    gap_left = None
+    for i in range(0, max(files_dict.keys(), default=-1)+1):
+        if i in files_dict:
+            if gap_left is not None:
+                gaps.append((gap_left, i-1))
+                gap_left = None
+        elif gap_left is None:
+            gap_left = i
+    return gaps
+
+
+class FlawIndexTests(unittest.TestCase):
+
+    def test_initial_gaps(self):
+        """The FilesDict should find the gaps of the dictionary it is created from, including one at the front."""
+        files_dict = FilesDict({2: ['jpg'], 3: ['jpg'], 7: ['jpg'], 9: ['jpg']})
+
+        self.assertEqual(files_dict.gaps(), [(0, 1), (4, 6), (8, 8)], "The FilesDict fails to find the gaps it is initialized with.")
+
+    def test_assign_within_gap(self):
+        """The FilesDict should split a gap when an index within it is assigned."""
+        files_dict = FilesDict({0: ['jpg'], 6: ['jpg']})
+
+        files_dict[3] = ['jpg']
+        self.assertEqual(files_dict.gaps(), [(1, 2), (4, 5)], "The FilesDict fails to split a gap.")
+
+        files_dict[1] = ['jpg']
+        files_dict[2] = ['jpg']
+        self.assertEqual(files_dict.gaps(), [(4, 5)], "The FilesDict fails to remove a gap that has been filled up.")
+
+    def test_assign_beyond_max_index(self):
+        """The FilesDict should register a new gap when an index far above the highest index is assigned."""
+        files_dict = FilesDict({0: ['jpg']})
+
+        files_dict[10] = ['jpg']
+
+        self.assertEqual(files_dict.gaps(), [(1, 9)], "The FilesDict fails to register the gap below a newly assigned highest index.")
+
+    def test_unassign(self):
+        """The FilesDict should merge gaps when the index between them is unassigned, and drop the gap below a removed highest index."""
+        files_dict = FilesDict({0: ['jpg'], 2: ['jpg'], 4: ['jpg'], 8: ['jpg']})
+
+        del files_dict[2]
+        self.assertEqual(files_dict.gaps(), [(1, 3), (5, 7)], "The FilesDict fails to merge the gaps around an unassigned index.")
+
+        files_dict.pop(8)
+        self.assertEqual(files_dict.gaps(), [(1, 3)], "The FilesDict keeps the gap below the removed highest index.")
+
+    def test_multi_assigned_indexes(self):
+        """The FilesDict should keep track of multi-assigned indexes when file types are added and removed."""
+        files_dict = FilesDict({0: ['jpg'], 1: ['jpg', 'png'], 2: ['jpg']})
+        self.assertEqual(files_dict.multi_assigned_indexes(), [1], "The FilesDict fails to find the multi-assigned indexes it is initialized with.")
+
+        files_dict.add_type(2, 'gif')
+        files_dict.remove_type(1, 'png')
+        self.assertEqual(files_dict.multi_assigned_indexes(), [2], "The FilesDict fails to update the multi-assigned indexes when file types change.")
+
+        files_dict.remove_type(0, 'jpg')
+        self.assertEqual(files_dict, {1: ['jpg'], 2: ['jpg', 'gif']}, "The FilesDict fails to remove the entire index together with its last file type.")
+
+        files_dict[2] = ['jpg']
+        self.assertEqual(files_dict.multi_assigned_indexes(), [], "The FilesDict fails to update the multi-assigned indexes when the file types are re-assigned.")
+
+    def test_next_gap(self):
+        """The FilesDict should find the nearest gap that is wide enough, counting only the part of a gap above the given index."""
+        files_dict = FilesDict({0: ['jpg'], 3: ['jpg'], 4: ['jpg'], 6: ['jpg'], 10: ['jpg']})
+
+        self.assertEqual(files_dict.next_gap(0), (1, 2), "The FilesDict fails to find the nearest gap.")
+        self.assertEqual(files_dict.next_gap(2), (2, 2), "The FilesDict fails to find the part of a gap above the given index.")
+        self.assertEqual(files_dict.next_gap(2, 2), (7, 9), "The FilesDict returns a gap that is not wide enough.")
+        self.assertEqual(files_dict.next_gap(0, 4), None, "The FilesDict fails to recognize that there is no gap that is wide enough.")
+        self.assertEqual(files_dict.next_gap(10), None, "The FilesDict returns a gap above the highest index.")
+
+    def test_move_indexes(self):
+        """The FilesDict should keep its indexes and flaws consistent when moving indexes in bulk, whether it is rebuilt or not."""
+        for files_dict_size in (4, 100):
+            files_dict = FilesDict({i: ['jpg'] for i in range(files_dict_size)})
+            files_dict[1] = ['jpg', 'png']
+
+            files_dict.move_indexes({0: 1, 1: files_dict_size+1, 3: 0})
+
+            expected_dict = {i: ['jpg'] for i in range(files_dict_size) if not i in (1, 3)}
+            expected_dict.update({1: ['jpg'], files_dict_size+1: ['jpg', 'png'], 0: ['jpg']})
+            self.assertEqual(files_dict, expected_dict, "The FilesDict fails to move its indexes.")
+            self.assertEqual(list(files_dict.sorted_indexes()), sorted(expected_dict), "The FilesDict fails to keep its indexes sorted when moving them.")
+            self.assertEqual(files_dict.gaps(), _scan_gaps(expected_dict), "The FilesDict fails to update its gaps when moving indexes.")
+            self.assertEqual(files_dict.multi_assigned_indexes(), [files_dict_size+1], "The FilesDict fails to update its multi-assigned indexes when moving indexes.")
+
+    def test_random_modifications(self):
+        """The incrementally maintained gaps should always equal the gaps found by a full scan."""
+        rnd = random.Random(7)
+        files_dict = FilesDict({rnd.randrange(60): ['jpg'] for _ in range(30)})
+
+        for _ in range(500):
+            index = rnd.randrange(70)
+            if index in files_dict:
+                del files_dict[index]
+            else:
+                files_dict[index] = ['jpg']
+
+            self.assertEqual(files_dict.gaps(), _scan_gaps(files_dict), "The FilesDict's gaps diverge from the actual gaps after a modification.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
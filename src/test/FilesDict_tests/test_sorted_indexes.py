@@ -0,0 +1,71 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import copy
+import unittest
+from FilesDict import FilesDict
+
+
+class SortedIndexesTests(unittest.TestCase):
+
+    def test_initialization(self):
+        """The FilesDict should sort the indexes of the dictionary it is created from."""
+        files_dict = FilesDict({5: ['jpg'], 0: ['jpg'], 3: ['png']})
+
+        self.assertEqual(list(files_dict.sorted_indexes()), [0, 3, 5], "The FilesDict fails to sort the indexes it is initialized with.")
+        self.assertEqual(files_dict, {0: ['jpg'], 3: ['png'], 5: ['jpg']}, "The FilesDict fails to behave like a plain dictionary.")
+
+    def test_modifications(self):
+        """The FilesDict should keep its indexes sorted when items are added and removed."""
+        files_dict = FilesDict({2: ['jpg'], 4: ['jpg']})
+
+        files_dict[7] = ['jpg']
+        files_dict.update({0: ['gif'], 3: ['png']})
+        files_dict.setdefault(1, ['mp4'])
+        files_dict[3] = ['png', 'jpg'] # re-assignment must not duplicate the index
+        del files_dict[2]
+        files_dict.pop(4)
+        files_dict.pop(99, None)
+
+        self.assertEqual(list(files_dict.sorted_indexes()), [0, 1, 3, 7], "The FilesDict fails to keep its indexes sorted upon modification.")
+
+    def test_max_index(self):
+        """The FilesDict should know its highest index, even after the highest one has been removed."""
+        files_dict = FilesDict({0: ['jpg'], 6: ['jpg'], 12: ['jpg']})
+        self.assertEqual(files_dict.max_index(), 12, "The FilesDict fails to find its highest index.")
+
+        files_dict.pop(12)
+        self.assertEqual(files_dict.max_index(), 6, "The FilesDict fails to update its highest index after it has been removed.")
+
+        files_dict.clear()
+        self.assertEqual(files_dict.max_index(), -1, "The FilesDict fails to return -1 as the highest index when it is empty.")
+
+    def test_min_index_in(self):
+        """The FilesDict should find the lowest assigned index within a given range."""
+        files_dict = FilesDict({0: ['jpg'], 4: ['jpg'], 9: ['jpg']})
+
+        self.assertEqual(files_dict.min_index_in(1, 8), 4, "The FilesDict fails to find the lowest assigned index within a range.")
+        self.assertEqual(files_dict.min_index_in(4, 4), 4, "The FilesDict fails to find an assigned index on the bound of a range.")
+        self.assertEqual(files_dict.min_index_in(5, 8), None, "The FilesDict finds an index in a range that is entirely unassigned.")
+        self.assertEqual(files_dict.min_index_in(10, 20), None, "The FilesDict finds an index in a range beyond its highest index.")
+
+    def test_indexes_in(self):
+        """The FilesDict should list the assigned indexes within a given range in ascending order."""
+        files_dict = FilesDict({8: ['jpg'], 0: ['jpg'], 4: ['jpg'], 9: ['jpg']})
+
+        self.assertEqual(files_dict.indexes_in(1, 8), [4, 8], "The FilesDict fails to list the assigned indexes within a range.")
+        self.assertEqual(files_dict.indexes_in(10, 12), [], "The FilesDict lists indexes in a range that is entirely unassigned.")
+
+    def test_copy(self):
+        """The FilesDict should keep its sorted indexes consistent when it is copied."""
+        files_dict = FilesDict({3: ['jpg'], 1: ['jpg']})
+
+        for copied_dict in (files_dict.copy(), copy.copy(files_dict), copy.deepcopy(files_dict)):
+            self.assertIsInstance(copied_dict, FilesDict, "The copy of the FilesDict is not a FilesDict anymore.")
+            self.assertEqual(list(copied_dict.sorted_indexes()), [1, 3], "The copy of the FilesDict has inconsistent sorted indexes.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,64 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import random
+import unittest
+from IntervalSet import IntervalSet
+
+
+class IntervalSetTests(unittest.TestCase):
+
+    def test_normalization(self):
+        """The IntervalSet should order its runs and merge overlapping and adjoining ones."""
+        index_set = IntervalSet([(9, 7), (0, 2), (3, 4), (1, 1), (12, 12)])
+
+        self.assertEqual(index_set.runs, [(0, 4), (7, 9), (12, 12)], "The IntervalSet fails to normalize its runs.")
+        self.assertEqual(len(index_set), 9, "The IntervalSet counts its integers incorrectly.")
+        self.assertEqual(index_set.bounds, (0, 12), "The IntervalSet returns wrong bounds.")
+
+    def test_from_indexes(self):
+        """The IntervalSet should be creatable from single indexes in any order, ignoring duplicates."""
+        index_set = IntervalSet.from_indexes([5, 1, 2, 3, 2, 8])
+
+        self.assertEqual(index_set.runs, [(1, 3), (5, 5), (8, 8)], "The IntervalSet fails to combine single indexes into runs.")
+        self.assertEqual(list(index_set), [1, 2, 3, 5, 8], "The IntervalSet fails to iterate over its integers.")
+
+    def test_empty(self):
+        """An empty IntervalSet should be falsy and have no bounds."""
+        index_set = IntervalSet()
+
+        self.assertFalse(index_set, "An empty IntervalSet is truthy.")
+        self.assertIsNone(index_set.bounds, "An empty IntervalSet returns bounds.")
+        self.assertEqual(index_set.count_below(10), 0, "An empty IntervalSet counts integers.")
+
+    def test_membership_and_count_below(self):
+        """The IntervalSet should answer membership and rank queries like the equivalent set of integers."""
+        integers = set(random.Random(4).sample(range(200), 80))
+        index_set = IntervalSet.from_indexes(integers)
+
+        for value in range(-2, 203):
+            self.assertEqual(value in index_set, value in integers, "The IntervalSet fails to determine whether it contains {}.".format(value))
+            self.assertEqual(index_set.count_below(value), sum(1 for integer in integers if integer < value), "The IntervalSet fails to count the integers below {}.".format(value))
+
+    def test_huge_run(self):
+        """The IntervalSet should hold huge runs without expanding them."""
+        index_set = IntervalSet([(0, 10**12)])
+
+        self.assertIn(10**12, index_set, "The IntervalSet fails to contain the upper bound of a huge run.")
+        self.assertEqual(index_set.count_below(10**6), 10**6, "The IntervalSet fails to count the integers of a huge run.")
+
+    def test_invalid_bounds(self):
+        """The IntervalSet should reject bounds that are not integers."""
+        with self.assertRaises(TypeError, msg="The IntervalSet accepts bounds that are not integers."):
+            IntervalSet([(0, '3')])
+
+    def test_string(self):
+        """The IntervalSet should be printed in the range notation of the CLI."""
+        self.assertEqual(str(IntervalSet([(0, 2), (5, 5), (7, 8)])), '0-2,5,7-8', "The IntervalSet is not printed in the range notation.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
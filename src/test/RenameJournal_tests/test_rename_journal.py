@@ -0,0 +1,247 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+from DirectorySnapshot import DirectorySnapshot
+from FileSet import FileSet
+from RenameJournal import RenameJournal
+from RenamePlan import RenamePlan
+
+
+class RenameJournalTests(unittest.TestCase):
+
+    def setUp(self):
+        DirectorySnapshot.clear_cache()
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temp_directory.name
+        self.previous_directory = os.getcwd()
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        FileSet.journal_renames = False
+        os.chdir(self.previous_directory)
+        self.temp_directory.cleanup()
+
+        DirectorySnapshot.clear_cache()
+
+    def _create_files(self, file_names):
+        """Create the given files, each containing its own name."""
+        for file_name in file_names:
+            with open(file_name, 'w') as file:
+                file.write(file_name)
+
+    def _get_contents(self):
+        """Return a dictionary mapping the name of every file within the directory except the journal to its content."""
+        contents = {}
+        for file_name in os.listdir(self.directory):
+            if file_name != RenameJournal.FILE_NAME:
+                with open(file_name) as file:
+                    contents[file_name] = file.read()
+        return contents
+
+    def _interrupt(self, name_mapping, performed_count, sync_interval=RenameJournal.SYNC_INTERVAL):
+        """Start executing a plan of the given mapping with a journal and stop after performed_count renames, as if the process had died. Return the plan."""
+        self._create_files(name_mapping.keys())
+        plan = RenamePlan(name_mapping)
+        journal = RenameJournal(self.directory)
+        journal.SYNC_INTERVAL = sync_interval
+        journal.write_ahead(plan)
+
+        tracked_rename = journal.track(FileSet._rename_physically)
+        for old_name, new_name in plan.operations[:performed_count]:
+            tracked_rename(old_name, new_name)
+        journal._file.close()
+
+        return plan
+
+    def test_execute(self):
+        """Executing a plan with a journal should perform its renames and remove the journal afterwards."""
+        name_mapping = {'test ({}).jpg'.format(i): 'test ({}).jpg'.format(i+1) for i in range(10)}
+        self._create_files(name_mapping.keys())
+
+        RenamePlan(name_mapping).execute(os.rename, RenameJournal(self.directory))
+
+        self.assertEqual(self._get_contents(), {new_name: old_name for old_name, new_name in name_mapping.items()}, "The plan's renames are not performed when it is executed with a journal.")
+        self.assertFalse(RenameJournal.is_pending(self.directory), "The journal is not removed after the plan has been executed.")
+
+    def test_write_ahead(self):
+        """The journal should contain all operations of the plan before the first rename is performed."""
+        plan = self._interrupt({'a': 'b', 'b': 'c'}, 0)
+
+        self.assertTrue(RenameJournal.is_pending(self.directory), "The journal is not written ahead.")
+        with open(RenameJournal.FILE_NAME) as journal_file:
+            lines = journal_file.read().splitlines()
+        self.assertEqual(len(lines), 1 + len(plan.operations), "The journal doesn't contain a header and every operation.")
+
+    def test_write_ahead_inodes(self):
+        """The journal should record the inode number of every renamed file, looking up only the files of the plan instead of listing the directory."""
+        self._create_files(['a', 'b', 'unrelated'])
+        inodes = {file_name: os.lstat(file_name).st_ino for file_name in ('a', 'b')}
+        plan = RenamePlan({'a': 'b', 'b': 'c'})
+
+        with mock.patch('RenameJournal.scandir') as mock_scandir:
+            journal = RenameJournal(self.directory)
+            journal.write_ahead(plan)
+        journal._file.close()
+
+        mock_scandir.assert_not_called()
+        with open(RenameJournal.FILE_NAME) as journal_file:
+            entries = [json.loads(line) for line in journal_file.read().splitlines()[1:]]
+        self.assertEqual([entry[2] for entry in entries], [inodes[old_name] for old_name, _ in plan.operations], "The inode numbers of the renamed files are not recorded.")
+
+    def test_write_ahead_given_inodes(self):
+        """The journal should take the inode numbers from the given ones, looking up only the ones they lack."""
+        self._create_files(['a', 'b'])
+        inodes = {'a': os.lstat('a').st_ino, 'b': None}
+        plan = RenamePlan({'a': 'b', 'b': 'c'})
+
+        with mock.patch('RenameJournal.os.lstat', side_effect=os.lstat) as mock_lstat:
+            journal = RenameJournal(self.directory, inodes)
+            journal.write_ahead(plan)
+        journal._file.close()
+
+        mock_lstat.assert_called_once_with(os.path.join(journal.directory, 'b'))
+        with open(RenameJournal.FILE_NAME) as journal_file:
+            entries = [json.loads(line) for line in journal_file.read().splitlines()[1:]]
+        self.assertEqual({entry[0]: entry[2] for entry in entries}, {'a': inodes['a'], 'b': os.lstat('b').st_ino}, "The inode numbers of the renamed files are not recorded correctly.")
+
+    def test_snapshot_inodes(self):
+        """A FileSet should write its renames ahead with the inode numbers of the snapshot of its last detection instead of looking them up."""
+        self._create_files(['test (0).jpg', 'test (1).jpg', 'test (2).jpg'])
+        FileSet.journal_renames = True
+        test_set = FileSet.files_detected(('test (', ')'))
+
+        with mock.patch('RenameJournal.os.lstat', side_effect=os.lstat) as mock_lstat:
+            test_set.move_range((0, 2), 3)
+
+        looked_up_paths = [call[0][0] for call in mock_lstat.call_args_list]
+        self.assertFalse([path for path in looked_up_paths if os.path.basename(path) in ('test (0).jpg', 'test (1).jpg', 'test (2).jpg')], "The inode numbers of the renamed files are looked up although the snapshot provides them.")
+        self.assertEqual(self._get_contents(), {'test (3).jpg': 'test (0).jpg', 'test (4).jpg': 'test (1).jpg', 'test (5).jpg': 'test (2).jpg'}, "The files are not renamed correctly.")
+
+    def test_track_exchanges_before_write_ahead(self):
+        """A journal should be able to track exchanges before its plan has been written ahead."""
+        journal = RenameJournal(self.directory)
+        self.assertEqual(journal._exchanged, set(), "The performed exchanges are not initialized along with the journal.")
+
+    def test_journal_exists(self):
+        """Starting a journal while the journal of an interrupted plan exists should raise a JournalError without renaming any file."""
+        self._interrupt({'a': 'b'}, 0)
+        self._create_files(['x'])
+
+        with self.assertRaises(RenameJournal.JournalError, msg="A second journal is started while the first one has not been recovered."):
+            RenamePlan({'x': 'y'}).execute(os.rename, RenameJournal(self.directory))
+        self.assertIn('x', self._get_contents(), "A file is renamed although the journal can't be written.")
+
+    def test_failure_undone(self):
+        """If a rename fails, the plan should be undone and the journal removed."""
+        self._create_files(['a', 'b'])
+
+        with self.assertRaises(RenamePlan.RenameError, msg="The failing rename is not reported."):
+            RenamePlan({'a': 'c', 'missing': 'd'}).execute(os.rename, RenameJournal(self.directory))
+
+        self.assertEqual(set(self._get_contents()), {'a', 'b'}, "The performed renames are not undone after a failure.")
+        self.assertFalse(RenameJournal.is_pending(self.directory), "The journal is not removed after the plan has been undone.")
+
+    def test_no_journal(self):
+        """Recovering a directory without a journal should do nothing."""
+        self.assertIsNone(RenameJournal.recover(self.directory), "A recovery is reported although there is no journal.")
+
+    def test_incomplete_journal(self):
+        """A journal that has not been written completely should be discarded, since no rename has been performed yet."""
+        self._create_files(['a'])
+        with open(RenameJournal.FILE_NAME, 'w') as journal_file:
+            journal_file.write('{"format": 1, "operations": 2, "temp_names": []}\n["a", "b", 1]\n')
+
+        self.assertEqual(RenameJournal.recover(self.directory), (0, 0), "An incomplete journal is not discarded.")
+        self.assertEqual(set(self._get_contents()), {'a'}, "A file is renamed although the journal is incomplete.")
+        self.assertFalse(RenameJournal.is_pending(self.directory), "The incomplete journal is not removed.")
+
+    def test_roll_forward(self):
+        """Recovering an interrupted plan should perform its remaining operations."""
+        name_mapping = {'test ({}).jpg'.format(i): 'test ({}).jpg'.format(i+1) for i in range(10)}
+        self._interrupt(name_mapping, 4)
+
+        self.assertEqual(RenameJournal.recover(self.directory), (4, 6), "The performed and remaining operations are not determined correctly.")
+        self.assertEqual(self._get_contents(), {new_name: old_name for old_name, new_name in name_mapping.items()}, "The remaining operations are not performed.")
+        self.assertFalse(RenameJournal.is_pending(self.directory), "The journal is not removed after the recovery.")
+
+    def test_roll_back(self):
+        """Recovering an interrupted plan backwards should undo its performed operations."""
+        name_mapping = {'test ({}).jpg'.format(i): 'test ({}).jpg'.format(i+1) for i in range(10)}
+        self._interrupt(name_mapping, 4)
+
+        self.assertEqual(RenameJournal.recover(self.directory, roll_forward=False), (4, 4), "The performed operations are not determined correctly.")
+        self.assertEqual(self._get_contents(), {old_name: old_name for old_name in name_mapping}, "The performed operations are not undone.")
+
+    def test_cycle(self):
+        """An interrupted cycle should be recovered in both directions, including its temporary name."""
+        name_mapping = {'a': 'b', 'b': 'c', 'c': 'a'}
+        for performed_count in range(5):
+            for roll_forward in (True, False):
+                plan = self._interrupt(name_mapping, performed_count)
+                self.assertEqual(len(plan.operations), 4, "The test set up failed.")
+
+                RenameJournal.recover(self.directory, roll_forward)
+
+                expected_contents = {new_name: old_name for old_name, new_name in name_mapping.items()} if roll_forward else {name: name for name in name_mapping}
+                self.assertEqual(self._get_contents(), expected_contents, "A cycle interrupted after {} renames is not recovered correctly.".format(performed_count))
+
+                for file_name in os.listdir(self.directory):
+                    os.remove(file_name)
+
+    def test_recorded_progress(self):
+        """The recorded progress should be used for the files which's position can't be determined from their inode number."""
+        self._interrupt({'a': 'b'}, 1, sync_interval=1)
+
+        with open(RenameJournal.FILE_NAME) as journal_file:
+            lines = journal_file.read().splitlines()
+        self.assertEqual(len(lines), 3, "The progress is not recorded once SYNC_INTERVAL renames have been performed.")
+
+        ## Let the operation appear to be without a known inode number
+        lines[1] = '["a", "b", null]'
+        with open(RenameJournal.FILE_NAME, 'w') as journal_file:
+            journal_file.write('\n'.join(lines) + '\n')
+
+        self.assertEqual(RenameJournal.recover(self.directory), (1, 0), "The recorded progress is not taken into account.")
+        self.assertEqual(self._get_contents(), {'b': 'a'}, "A performed operation is repeated.")
+
+    def test_file_moved_away(self):
+        """If a file of the plan has been moved away since, recovering should raise a JournalError and leave the journal in place."""
+        self._interrupt({'a': 'b', 'b': 'c'}, 1)
+        os.rename('c', 'elsewhere')
+
+        with self.assertRaises(RenameJournal.JournalError, msg="A plan is recovered although one of its files is missing."):
+            RenameJournal.recover(self.directory)
+        self.assertTrue(RenameJournal.is_pending(self.directory), "The journal is removed although the plan could not be recovered.")
+
+    def test_file_set_journal(self):
+        """The operations of a FileSet should be journaled if journal_renames is set."""
+        test_files = ['test ({}).jpg'.format(i) for i in range(5)]
+        self._create_files(test_files)
+        FileSet.journal_renames = True
+        test_set = FileSet(('test (', ')'), test_files)
+
+        journaled_plans = []
+        original_write_ahead = RenameJournal.write_ahead
+        def write_ahead(journal, plan):
+            journaled_plans.append(plan)
+            original_write_ahead(journal, plan)
+
+        with mock.patch.object(RenameJournal, 'write_ahead', new=write_ahead):
+            test_set.move_range((0, 4), 1)
+
+        self.assertEqual(len(journaled_plans), 1, "The moved range is not journaled as a single plan.")
+        self.assertEqual(self._get_contents(), {'test ({}).jpg'.format(i+1): 'test ({}).jpg'.format(i) for i in range(5)}, "The files are not moved when their renames are journaled.")
+        self.assertFalse(RenameJournal.is_pending(self.directory), "The journal is not removed after the operation.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
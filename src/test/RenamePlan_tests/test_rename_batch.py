@@ -0,0 +1,72 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from RenamePlan import RenameBatch
+from test.testing_tools import replay_renames
+
+
+class RenameBatchTests(unittest.TestCase):
+
+    def test_coalescing(self):
+        """The RenameBatch should coalesce consecutive renames of a file and drop files that end up with their original name."""
+        batch = RenameBatch()
+
+        batch.rename('a', 'b')
+        batch.rename('b', 'c')
+        batch.rename('x', 'y')
+        batch.rename('y', 'x')
+
+        self.assertEqual(batch.get_name_mapping(), {'a': 'c'}, "The RenameBatch fails to coalesce the renames into their net mapping.")
+
+    def test_exchange(self):
+        """The RenameBatch should coalesce exchanges with the renames of the exchanged files."""
+        batch = RenameBatch()
+
+        batch.rename('a', 'c')
+        batch.exchange('c', 'b')
+        batch.exchange('x', 'y')
+
+        self.assertEqual(batch.get_name_mapping(), {'a': 'b', 'b': 'c', 'x': 'y', 'y': 'x'}, "The RenameBatch fails to coalesce exchanges into the net mapping.")
+
+    def test_commit(self):
+        """The RenameBatch should perform its net renames as a single plan upon commit and be empty afterwards."""
+        mock_rename = mock.MagicMock(name='rename')
+        batch = RenameBatch()
+        for i in range(5, 0, -1):
+            batch.rename('file{}'.format(i), 'file{}'.format(i+1)) # shift all files up
+        for i in range(2, 7):
+            batch.rename('file{}'.format(i), 'file{}'.format(i-2)) # and down again, one further
+
+        batch.commit(mock_rename)
+
+        self.assertEqual(replay_renames(['file1', 'file2', 'file3', 'file4', 'file5'], mock_rename), {'file1': 'file0', 'file2': 'file1', 'file3': 'file2', 'file4': 'file3', 'file5': 'file4'}, "The RenameBatch fails to perform its net renames.")
+        self.assertEqual(mock_rename.call_count, 5, "The RenameBatch renames the files more than once.")
+        self.assertEqual(len(batch), 0, "The RenameBatch is not empty after committing it.")
+
+    def test_name_taken_within_batch(self):
+        """The RenameBatch should raise an error if a file is renamed to a name that another file has been renamed to within the batch."""
+        batch = RenameBatch()
+        batch.rename('a', 'c')
+
+        with self.assertRaises(FileExistsError, msg="The RenameBatch fails to recognize a name that has been taken within the batch."):
+            batch.rename('b', 'c')
+
+    def test_pending_file_names(self):
+        """The RenameBatch should know which names are taken and which ones have been freed within the batch."""
+        batch = RenameBatch()
+        batch.rename('a', 'b')
+        batch.rename('c', 'd')
+        batch.rename('e', 'c')
+
+        self.assertEqual(sorted(batch.apply_to(['a', 'c', 'e', 'f'])), ['b', 'c', 'd', 'f'], "The RenameBatch fails to apply its renames to a list of file names.")
+        self.assertTrue(batch.holds('c'), "The RenameBatch fails to recognize a name that has been taken again within the batch.")
+        self.assertTrue(batch.renamed_away('a'), "The RenameBatch fails to recognize a name that has been freed within the batch.")
+        self.assertFalse(batch.renamed_away('f'), "The RenameBatch considers a file as renamed even though it has not been touched.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
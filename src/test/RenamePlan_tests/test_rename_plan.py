@@ -0,0 +1,103 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import unittest
+import unittest.mock as mock
+from RenamePlan import RenamePlan
+from test.testing_tools import replay_renames
+
+
+class RenamePlanTests(unittest.TestCase):
+
+    def test_chain(self):
+        """The RenamePlan should rename a chain of files back to front, so no file is overwritten, without using temporary names."""
+        mock_rename = mock.MagicMock(name='rename')
+        plan = RenamePlan({'a': 'b', 'b': 'c', 'c': 'd'})
+
+        plan.execute(mock_rename)
+
+        self.assertEqual(replay_renames(['a', 'b', 'c'], mock_rename), {'a': 'b', 'b': 'c', 'c': 'd'}, "The RenamePlan fails to rename a chain of files.")
+        self.assertEqual(len(plan), 3, "The RenamePlan renames the files of a chain more than once.")
+        self.assertEqual(plan.temp_names, [], "The RenamePlan uses a temporary name for a chain.")
+
+    def test_cycles(self):
+        """The RenamePlan should rename every file of a cycle once, using a single temporary name per cycle."""
+        mock_rename = mock.MagicMock(name='rename')
+        name_mapping = {'a': 'b', 'b': 'c', 'c': 'a', 'x': 'y', 'y': 'x'}
+        plan = RenamePlan(name_mapping)
+
+        plan.execute(mock_rename)
+
+        self.assertEqual(replay_renames(name_mapping.keys(), mock_rename), name_mapping, "The RenamePlan fails to rename cycles of files.")
+        self.assertEqual(len(plan.temp_names), 2, "The RenamePlan fails to use exactly one temporary name per cycle.")
+        self.assertEqual(len(plan), 7, "The RenamePlan renames the files of a cycle more often than necessary.")
+
+    def test_unchanged_names(self):
+        """The RenamePlan should ignore files that keep their name."""
+        plan = RenamePlan({'a': 'a', 'b': 'c'})
+
+        self.assertEqual(plan.operations, [('b', 'c')], "The RenamePlan renames a file to its own name.")
+
+    def test_undo_upon_error(self):
+        """The RenamePlan should undo the performed renames if one of them fails and raise a RenameError."""
+        directory = {'a': 'content a', 'b': 'content b', 'c': 'content c'}
+        def failing_rename(old_name, new_name):
+            if old_name == 'a':
+                raise PermissionError(old_name)
+            directory[new_name] = directory.pop(old_name)
+
+        plan = RenamePlan({'a': 'b', 'b': 'c', 'c': 'd'})
+
+        with self.assertRaises(RenamePlan.RenameError, msg="The RenamePlan fails to raise a RenameError if a rename fails."):
+            plan.execute(failing_rename)
+
+        self.assertEqual(directory, {'a': 'content a', 'b': 'content b', 'c': 'content c'}, "The RenamePlan fails to undo the performed renames.")
+
+    def test_validate(self):
+        """The RenamePlan should only look up the new names that are not freed within the plan and raise a CollisionError if one of them is taken or two files share a new name."""
+        existing_names = {'a', 'b', 'c', 'x'}
+        mock_file_exists = mock.MagicMock(name='file_exists', side_effect=existing_names.__contains__)
+
+        RenamePlan({'a': 'b', 'b': 'c', 'c': 'd'}).validate(mock_file_exists)
+        mock_file_exists.assert_called_once_with('d')
+
+        with self.assertRaises(RenamePlan.CollisionError, msg="The RenamePlan fails to recognize a new name that is taken by a file outside of the plan."):
+            RenamePlan({'a': 'b', 'b': 'x'}).validate(mock_file_exists)
+        with self.assertRaises(RenamePlan.CollisionError, msg="The RenamePlan fails to recognize two files that are renamed to the same name."):
+            RenamePlan({'a': 'd', 'b': 'd'}).validate(mock_file_exists)
+
+    def test_exchange_cycles(self):
+        """If exchanges are requested, the RenamePlan should plan cycles of two files as a single Exchange, while longer cycles still use a temporary name."""
+        mock_rename = mock.MagicMock(name='rename')
+        mock_exchange = mock.MagicMock(name='exchange')
+        plan = RenamePlan({'a': 'b', 'b': 'c', 'c': 'a', 'x': 'y', 'y': 'x'}, exchange_cycles=True)
+
+        plan.execute(mock_rename, exchange_function=mock_exchange)
+
+        mock_exchange.assert_called_once_with('x', 'y')
+        self.assertEqual(replay_renames(['a', 'b', 'c'], mock_rename), {'a': 'b', 'b': 'c', 'c': 'a'}, "The RenamePlan fails to rename a cycle of three files.")
+        self.assertEqual(len(plan.temp_names), 1, "The RenamePlan uses a temporary name for a cycle of two files.")
+        self.assertEqual(len(plan), 5, "The RenamePlan fails to exchange a cycle of two files in a single operation.")
+
+    def test_exchange_undone_upon_error(self):
+        """If a rename fails, the performed exchanges should be undone by exchanging the files again."""
+        directory = {'a': 'content a', 'b': 'content b', 'x': 'content x'}
+        def failing_rename(old_name, new_name):
+            raise PermissionError(old_name)
+        def exchange(name1, name2):
+            directory[name1], directory[name2] = directory[name2], directory[name1]
+
+        plan = RenamePlan({'a': 'b', 'b': 'a', 'x': 'y'}, exchange_cycles=True)
+
+        with self.assertRaises(ValueError, msg="The RenamePlan fails to raise an error if no exchange_function is given for its exchanges."):
+            plan.execute(failing_rename)
+        with self.assertRaises(RenamePlan.RenameError, msg="The RenamePlan fails to raise a RenameError if a rename fails."):
+            plan.execute(failing_rename, exchange_function=exchange)
+
+        self.assertEqual(directory, {'a': 'content a', 'b': 'content b', 'x': 'content x'}, "The RenamePlan fails to undo the performed exchange.")
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,102 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import random
+import unittest
+from RenamePlan import RenamePlan, RenameScheduler
+from test.testing_tools import LatencyFileSystem
+
+
+class RenameSchedulerTests(unittest.TestCase):
+
+    def _execute(self, name_mapping, max_workers=8, max_chain_length=None, latency=0, failing_names=()):
+        """Execute a plan of the given mapping on a LatencyFileSystem containing its old names and return the plan and the file system."""
+        file_system = LatencyFileSystem(name_mapping.keys(), latency, failing_names)
+        plan = RenamePlan(name_mapping, max_workers, max_chain_length)
+        plan.execute(file_system.rename)
+        return plan, file_system
+
+    def test_dependencies(self):
+        """Every operation of a plan should depend on the operations that free its new name or create its old name."""
+        plan = RenamePlan({'a': 'b', 'b': 'c', 'x': 'y', 'y': 'x'})
+        temp_name, = plan.temp_names
+        self.assertEqual(plan.operations, [('b', 'c'), ('a', 'b'), ('x', temp_name), ('y', 'x'), (temp_name, 'y')], "The test set up failed.")
+
+        dependencies = [set(operation_dependencies) for operation_dependencies in plan.dependencies()]
+
+        self.assertEqual(dependencies[0], set(), "An operation renaming a file to a free name depends on another operation.")
+        self.assertEqual(dependencies[1], {0}, "An operation doesn't depend on the operation freeing its new name.")
+        self.assertEqual(dependencies[2], set(), "The operation breaking up a cycle depends on another operation.")
+        self.assertEqual(dependencies[3], {2}, "An operation within a cycle doesn't depend on the operation freeing its new name.")
+        self.assertEqual(dependencies[4], {2, 3}, "The operation completing a cycle doesn't depend on both the operation creating its temporary name and the one freeing its new name.")
+
+    def test_parallel_chains(self):
+        """The scheduler should rename independent chains concurrently while keeping the order within every chain."""
+        name_mapping = {'{}_{}'.format(chain, i): '{}_{}'.format(chain, i+1) for chain in range(20) for i in range(10)}
+
+        plan, file_system = self._execute(name_mapping, latency=0.001)
+
+        self.assertEqual(file_system.get_name_mapping(), name_mapping, "The scheduler fails to rename the chains correctly.")
+        self.assertEqual(file_system.rename_count, len(plan), "The scheduler doesn't perform every operation exactly once.")
+
+    def test_split_chain(self):
+        """A long chain should be split into parts that can be renamed concurrently, costing one additional rename per split."""
+        name_mapping = {str(i): str(i+1) for i in range(100)}
+
+        plan, file_system = self._execute(name_mapping, max_chain_length=10)
+
+        self.assertEqual(file_system.get_name_mapping(), name_mapping, "The scheduler fails to rename a split chain correctly.")
+        self.assertEqual(len(plan.temp_names), 9, "The chain is not split every max_chain_length operations.")
+        self.assertEqual(len(plan), 109, "Splitting the chain costs more than one additional rename per split.")
+
+        independent_operations = [operation for operation, dependencies in zip(plan.operations, plan.dependencies()) if not dependencies]
+        self.assertEqual(len(independent_operations), 10, "The parts of the split chain can't be started independently.")
+
+    def test_split_cycle(self):
+        """A long cycle should be split as well."""
+        name_mapping = {str(i): str((i+1) % 100) for i in range(100)}
+
+        plan, file_system = self._execute(name_mapping, max_chain_length=10)
+
+        self.assertEqual(file_system.get_name_mapping(), name_mapping, "The scheduler fails to rename a split cycle correctly.")
+        self.assertEqual(len(plan.temp_names), 10, "The cycle is not split every max_chain_length operations.")
+
+    def test_random_mappings(self):
+        """The scheduler should realize arbitrary mappings, no matter how they are split."""
+        random_generator = random.Random(13)
+        for _ in range(30):
+            old_names = ['f{}'.format(i) for i in range(random_generator.randint(1, 200))]
+            new_names = old_names + ['g{}'.format(i) for i in range(random_generator.randint(0, 50))]
+            random_generator.shuffle(new_names)
+            name_mapping = dict(zip(old_names, new_names))
+
+            _, file_system = self._execute(name_mapping, random_generator.randint(2, 16), random_generator.choice([None, 1, 3, 50]))
+
+            self.assertEqual(file_system.get_name_mapping(), name_mapping, "The scheduler fails to realize the mapping {}.".format(name_mapping))
+
+    def test_undo_upon_error(self):
+        """The scheduler should undo all completed renames if one of them fails and raise a RenameError."""
+        name_mapping = {str(i): str(i+1) for i in range(100)}
+        name_mapping.update({'x{}'.format(i): 'y{}'.format(i) for i in range(100)})
+
+        file_system = LatencyFileSystem(name_mapping.keys(), failing_names=['50'])
+        with self.assertRaises(RenamePlan.RenameError, msg="The scheduler fails to raise a RenameError if a rename fails."):
+            RenamePlan(name_mapping, max_workers=8, max_chain_length=10).execute(file_system.rename)
+
+        self.assertEqual(file_system.get_name_mapping(), {file_name: file_name for file_name in name_mapping}, "The scheduler fails to undo the completed renames.")
+
+    def test_scheduler_directly(self):
+        """The scheduler should execute any operations in an order respecting the given dependencies."""
+        order = []
+        operations = [('a', 'b'), ('c', 'd'), ('e', 'f')]
+
+        RenameScheduler(4).execute(operations, [(), (0,), (1,)], lambda old_name, new_name: order.append(old_name))
+
+        self.assertEqual(order, ['a', 'c', 'e'], "The scheduler doesn't respect the dependencies of the operations.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
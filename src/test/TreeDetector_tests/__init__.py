@@ -0,0 +1 @@
+from . import *
\ No newline at end of file
@@ -0,0 +1,68 @@
+'''
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import tempfile
+import unittest
+from DirectoryRegistry import DirectoryRegistry
+from TreeDetector import TreeDetector
+
+
+class TreeDetectorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self.temp_directory.name)
+        self.directories = [self.root, os.path.join(self.root, 'a'), os.path.join(self.root, 'a', 'b'), os.path.join(self.root, 'c')]
+        for directory in self.directories[1:]:
+            os.makedirs(directory)
+
+        self._create_files(self.root, ['IMG_0.jpg', 'IMG_1.jpg', 'notes.txt'])
+        self._create_files(self.directories[1], ['test (0).jpg', 'test (0).png', 'test (3).jpg', 'other 0.gif'])
+        self._create_files(self.directories[2], ['IMG_5.jpg'])
+        self._create_files(self.directories[3], ['notes.txt'])
+        os.symlink(self.directories[1], os.path.join(self.directories[3], 'link'))
+
+    def tearDown(self):
+        self.temp_directory.cleanup()
+
+    def _create_files(self, directory, file_names):
+        for file_name in file_names:
+            open(os.path.join(directory, file_name), 'w').close()
+
+    def _summarize(self, detected_sets):
+        """Return the pattern and files of every detected set as plain dictionaries, per directory."""
+        return {directory: {file_set.pattern: dict(file_set.files) for file_set in file_sets} for directory, file_sets in detected_sets.items()}
+
+    def check_detection(self, max_workers):
+        detected_sets = TreeDetector(max_workers).detect(self.root)
+
+        self.assertEqual(self._summarize(detected_sets), {
+                self.root: {('IMG_', ''): {0: ['jpg'], 1: ['jpg']}},
+                self.directories[1]: {('test (', ')'): {0: ['jpg', 'png'], 3: ['jpg']}, ('other ', ''): {0: ['gif']}},
+                self.directories[2]: {('IMG_', ''): {5: ['jpg']}}
+            }, "The file sets of the tree are not detected correctly with {} worker(s).".format(max_workers))
+
+    def test_in_process(self):
+        """A single worker should detect the file sets of every directory within the tree by itself."""
+        self.check_detection(1)
+
+    def test_worker_processes(self):
+        """Several worker processes should detect the same file sets of every directory within the tree."""
+        self.check_detection(2)
+
+    def test_registry(self):
+        """The detected file sets should be stored in the given registry, valid as long as their directory doesn't change."""
+        registry = DirectoryRegistry()
+
+        detected_sets = TreeDetector(1).detect(self.root, registry)
+
+        self.assertEqual(len(registry), 3, "The file sets are not stored in the registry.")
+        self.assertIs(registry.take(self.directories[2]), detected_sets[self.directories[2]], "The stored file sets are not the detected ones.")
+
+
+if __name__ == "__main__":
+    #import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
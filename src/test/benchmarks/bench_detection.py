@@ -0,0 +1,102 @@
+'''
+Benchmark comparing the single-pass file set detection of the CLI with the former two-pass detection,
+which split every file name with regular expressions and had FileSet match every name a second time.
+
+The directory listing is synthetic, so the benchmark measures the detection itself and not the file system.
+
+Run from within the src directory: python -m test.benchmarks.bench_detection [ENTRY_COUNT]
+
+Created on 18.10.2026
+
+@author: FM
+'''
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_loader
+import os
+import re
+import sys
+import time
+import unittest.mock as mock
+
+from FileSet import FileSet
+from test.testing_tools import mock_scandir_gen
+
+
+def _load_cli():
+    """Load the CLI module, which can't be imported directly since its file has no .py extension."""
+    cli_path = os.path.join(os.path.dirname(sys.modules[FileSet.__module__].__file__), 'file_set_manager')
+    cli_spec = spec_from_loader('CLI', SourceFileLoader('CLI', cli_path))
+    cli_module = module_from_spec(cli_spec)
+    cli_spec.loader.exec_module(cli_module)
+    return cli_module
+
+CLI = _load_cli()
+
+PATTERNS = (('IMG_', ''), ('holiday (', ')'), ('scan_', '_final'), ('.hidden', ''))
+FILE_TYPES = ('jpg', 'png', 'tar.gz', 'mp4')
+
+
+def _generate_entries(entry_count):
+    """Generate the entries of a directory with a few big, interleaved sets, dirt files without a pattern and some sub directories."""
+    next_indexes = [0] * len(PATTERNS)
+    entries = []
+    for i in range(entry_count):
+        if i % 50 == 0:
+            entries.append(('notes_{}'.format(chr(97 + i % 26)), True)) # dirt file
+        elif i % 1000 == 1:
+            entries.append(('folder{}'.format(i), False)) # directory
+        else:
+            pattern_number = i % len(PATTERNS)
+            left_pattern, right_pattern = PATTERNS[pattern_number]
+            index = next_indexes[pattern_number]
+            next_indexes[pattern_number] += 1 if i % 101 else 3 # leave a few gaps
+            entries.append(('{}{}{}.{}'.format(left_pattern, index, right_pattern, FILE_TYPES[i % len(FILE_TYPES)]), True))
+    return list(mock_scandir_gen(entries)) # create the entry objects up front, so they don't count towards the detection time
+
+def _detect_file_sets_two_pass():
+    """The former detection: split every name with uncompiled regular expressions and let FileSet compile the name lists."""
+    pattern_files_dic = {}
+    for entry in os.scandir(os.getcwd()):
+        if entry.is_file():
+            plain_name = re.sub(r"(?<!^)\..+$", "", entry.name)
+
+            try:
+                left_pattern, right_pattern = re.split(r"\d+(?!.*\d)", plain_name)
+            except ValueError:
+                continue
+
+            pattern_files_dic.setdefault((left_pattern, right_pattern), []).append(entry.name)
+
+    return [FileSet(pattern, files) for pattern, files in pattern_files_dic.items()]
+
+def _time(detection, entries):
+    """Return the duration of the given detection over the given directory entries."""
+    with mock.patch('os.scandir', new=lambda _: iter(entries)):
+        start_time = time.perf_counter()
+        detection()
+        duration = time.perf_counter() - start_time
+
+    return duration
+
+def run(entry_count=1000000):
+    """Time both detections over a synthetic directory of entry_count entries and check that they detect the same sets."""
+    entries = _generate_entries(entry_count)
+
+    two_pass_time = _time(_detect_file_sets_two_pass, entries)
+    single_pass_time = _time(CLI.detect_file_sets, entries)
+
+    with mock.patch('os.scandir', new=lambda _: iter(entries)):
+        expected_files = {file_set.pattern: dict(file_set.files) for file_set in _detect_file_sets_two_pass()}
+        CLI.detect_file_sets()
+    detected_files = {file_set.pattern: dict(file_set.files) for file_set in CLI.file_set_cache}
+    assert detected_files == expected_files, "The single-pass detection detects different file sets."
+
+    print("{} entries, {} file sets".format(entry_count, len(detected_files)))
+    print("two-pass detection:    {:>8.2f} s".format(two_pass_time))
+    print("single-pass detection: {:>8.2f} s   ({:.1f}x faster)".format(single_pass_time, two_pass_time / single_pass_time))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
@@ -0,0 +1,66 @@
+'''
+Benchmark comparing the sorted FilesDict with the plain dictionary it replaces as the FileSet's files dictionary.
+
+Run from within the src directory: python -m test.benchmarks.bench_files_dict [FILE_COUNT]
+
+Created on 18.10.2026
+
+@author: FM
+'''
+import random
+import sys
+import timeit
+
+from FilesDict import FilesDict
+
+
+def _plain_max_index(files_dict):
+    try:
+        return max(files_dict.keys())
+    except ValueError:
+        return -1
+
+def _plain_min_index_in(files_dict, left_bound, right_bound):
+    min_index = None
+    for index in files_dict:
+        if left_bound <= index <= right_bound:
+            if min_index is None or index < min_index:
+                min_index = index
+    return min_index
+
+def _plain_sorted_indexes(files_dict):
+    indexes = list(files_dict.keys())
+    indexes.sort()
+    return indexes
+
+
+def run(file_count=200000, repetitions=20):
+    """Time the max_index, min_index_in and ordered iteration queries for a plain dict and a FilesDict of file_count files."""
+    indexes = list(range(file_count))
+    random.shuffle(indexes) # files are usually not detected in order
+    plain_dict = {index: ['jpg'] for index in indexes}
+    files_dict = FilesDict(plain_dict)
+
+    queries = [
+            ('max_index after removing the top index',
+                lambda: (plain_dict.pop(file_count-1), _plain_max_index(plain_dict), plain_dict.update({file_count-1: ['jpg']})),
+                lambda: (files_dict.pop(file_count-1), files_dict.max_index(), files_dict.update({file_count-1: ['jpg']}))),
+            ('lowest assigned index in [a, b]',
+                lambda: _plain_min_index_in(plain_dict, file_count//2, file_count//2 + 10),
+                lambda: files_dict.min_index_in(file_count//2, file_count//2 + 10)),
+            ('ordered iteration',
+                lambda: _plain_sorted_indexes(plain_dict),
+                lambda: list(files_dict.sorted_indexes()))
+        ]
+
+    print("{} files, {} repetitions each".format(file_count, repetitions))
+    for description, plain_query, sorted_query in queries:
+        plain_time = timeit.timeit(plain_query, number=repetitions) / repetitions
+        sorted_time = timeit.timeit(sorted_query, number=repetitions) / repetitions
+        print("{:<42} dict: {:>10.1f} us   FilesDict: {:>10.1f} us".format(description, plain_time*1e6, sorted_time*1e6))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
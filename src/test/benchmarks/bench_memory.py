@@ -0,0 +1,55 @@
+'''
+Benchmark measuring the memory a FileSet needs per file, once with the sorted FilesDict and once with the array-backed CompactFilesDict.
+
+Run from within the src directory: python -m test.benchmarks.bench_memory [FILE_COUNT]
+
+Created on 18.10.2026
+
+@author: FM
+'''
+import gc
+import sys
+import tracemalloc
+
+import FileSet
+
+
+FILE_TYPES = ('jpg', 'png', 'gif', 'mp4')
+
+
+def _generate_file_names(file_count):
+    """Generate the file names of a set with a few gaps and multi-assigned indexes, which is what real sets tend to look like."""
+    for i in range(file_count):
+        if i % 97 == 0:
+            continue # gap
+        yield 'test{}.{}'.format(i, FILE_TYPES[i % len(FILE_TYPES)])
+        if i % 89 == 0:
+            yield 'test{}.txt'.format(i) # multi-assigned index
+
+def _measure(file_names, compact_files):
+    """Return the number of bytes the FileSet created from the given file names holds on to."""
+    gc.collect()
+    tracemalloc.start()
+    test_set = FileSet.FileSet(('test', ''), file_names, compact_files=compact_files)
+    gc.collect()
+    allocated_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del test_set
+    return allocated_size
+
+
+def run(file_count=1000000):
+    """Print the bytes per file of a FileSet of about file_count files using a FilesDict and a CompactFilesDict."""
+    file_names = list(_generate_file_names(file_count))
+
+    print("{} files".format(len(file_names)))
+    for description, compact_files in (('FilesDict', False), ('CompactFilesDict', True)):
+        allocated_size = _measure(file_names, compact_files)
+        print("{:<18} {:>12} bytes   {:>6.1f} bytes/file".format(description, allocated_size, allocated_size / len(file_names)))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
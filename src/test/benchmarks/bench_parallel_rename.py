@@ -0,0 +1,85 @@
+'''
+Benchmark of shifting the tail of a file set on a high-latency file system, renaming the files one after another
+versus concurrently by several workers (see FileSet.rename_workers and RenameScheduler).
+
+The file system is an in-memory stand-in which's renames take a given latency, like the ones of a network file system.
+Additionally, a file set detected from a real directory is shifted, so the cached snapshot of the directory (see
+DirectorySnapshot) is kept up to date by every rename, as it is within the CLI.
+
+Run from within the src directory: python -m test.benchmarks.bench_parallel_rename [FILE_COUNT [LATENCY_MS]]
+
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import sys
+import tempfile
+import time
+import unittest.mock as mock
+
+from FileSet import FileSet
+from test.testing_tools import LatencyFileSystem
+
+
+WORKER_COUNTS = (1, 4, 16, 64)
+
+def _time_shift(file_count, latency, rename_workers):
+    """Return the duration of shifting all files of a set by one index as well as the amount of renames it took."""
+    file_names = ['IMG_{}.jpg'.format(i) for i in range(file_count)]
+    file_set = FileSet(('IMG_', ''), file_names)
+    file_system = LatencyFileSystem(file_names, latency)
+
+    FileSet.rename_workers = rename_workers
+    try:
+        with mock.patch('FileSet.rename', new=file_system.rename):
+            start_time = time.perf_counter()
+            file_set.move_range((0, file_count-1), 1)
+            duration = time.perf_counter() - start_time
+    finally:
+        FileSet.rename_workers = 1
+
+    expected_mapping = {'IMG_{}.jpg'.format(i): 'IMG_{}.jpg'.format(i+1) for i in range(file_count)}
+    assert file_system.get_name_mapping() == expected_mapping, "The files have not been shifted correctly."
+
+    return duration, file_system.rename_count
+
+def _time_detected_shift(file_count, rename_workers):
+    """Return the duration of shifting all files of a set detected within a temporary directory by one index."""
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(file_count):
+            open(os.path.join(directory, 'IMG_{}.jpg'.format(i)), 'w').close()
+        file_set = FileSet.files_detected(('IMG_', ''), directory=directory) # caches a snapshot of the directory
+
+        FileSet.rename_workers = rename_workers
+        try:
+            start_time = time.perf_counter()
+            file_set.move_range((0, file_count-1), 1)
+            duration = time.perf_counter() - start_time
+        finally:
+            FileSet.rename_workers = 1
+
+        expected_names = {'IMG_{}.jpg'.format(i+1) for i in range(file_count)}
+        assert set(os.listdir(directory)) == expected_names, "The files have not been shifted correctly."
+        assert set(FileSet.files_detected(('IMG_', ''), directory=directory).files) == set(range(1, file_count+1)), "The snapshot does not reflect the shift."
+
+    return duration
+
+def run(file_count=2000, latency_ms=2):
+    """Time shifting a set of file_count files by one index with a rename latency of latency_ms for different amounts of workers."""
+    print("shifting {} files, {} ms per rename".format(file_count, latency_ms))
+
+    serial_time = None
+    for rename_workers in WORKER_COUNTS:
+        duration, rename_count = _time_shift(file_count, latency_ms / 1000, rename_workers)
+        if serial_time is None:
+            serial_time = duration
+        print("{:>3} worker(s): {:>8.2f} s   {:>7} renames   ({:.1f}x faster)".format(rename_workers, duration, rename_count, serial_time / duration))
+
+    print("shifting {} files detected within a directory".format(file_count))
+    for rename_workers in WORKER_COUNTS:
+        duration = _time_detected_shift(file_count, rename_workers)
+        print("{:>3} worker(s): {:>8.2f} s   ({:.0f} renames/s)".format(rename_workers, duration, file_count / duration))
+
+if __name__ == '__main__':
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,54 @@
+'''
+Benchmark of detecting the file sets of a directory tree with different amounts of worker processes (see TreeDetector).
+
+The tree is created within a temporary directory: DIRECTORY_COUNT directories of FILES_PER_DIRECTORY empty files each,
+nested a few levels deep. A single worker detects the directories within the benchmark's own process.
+
+Run from within the src directory: python -m test.benchmarks.bench_tree_detection [DIRECTORY_COUNT [FILES_PER_DIRECTORY]]
+
+Created on 18.10.2026
+
+@author: FM
+'''
+import os
+import sys
+import tempfile
+import time
+
+from TreeDetector import TreeDetector
+
+
+WORKER_COUNTS = (1, 2, 4, 8)
+BRANCHING = 10 # sub directories per directory
+
+def _create_tree(root, directory_count, files_per_directory):
+    """Create directory_count directories below root, BRANCHING per directory, each containing two file sets."""
+    directories = [root]
+    for i in range(directory_count):
+        directory = os.path.join(directories[i // BRANCHING], 'shoot {}'.format(i))
+        os.mkdir(directory)
+        directories.append(directory)
+
+        for j in range(files_per_directory):
+            open(os.path.join(directory, 'IMG_{}.jpg'.format(j) if j % 2 else 'DSC {}.raw'.format(j)), 'w').close()
+
+def run(directory_count=2000, files_per_directory=200):
+    """Time detecting a tree of directory_count directories with files_per_directory files each for different amounts of workers."""
+    print("detecting {} directories with {} files each".format(directory_count, files_per_directory))
+
+    with tempfile.TemporaryDirectory() as root:
+        _create_tree(root, directory_count, files_per_directory)
+
+        serial_time = None
+        for max_workers in WORKER_COUNTS:
+            start_time = time.perf_counter()
+            detected_sets = TreeDetector(max_workers).detect(root)
+            duration = time.perf_counter() - start_time
+
+            assert len(detected_sets) == directory_count, "Not every directory has been detected."
+            if serial_time is None:
+                serial_time = duration
+            print("{:>3} worker(s): {:>8.2f} s   ({:.1f}x faster)".format(max_workers, duration, serial_time / duration))
+
+if __name__ == '__main__':
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -6,6 +6,8 @@ Created on 27.08.2018
 @author: FM
 '''
 from collections import namedtuple
+import threading
+import time
 import types # get access to types such as function or method)
 
 ## TODO: create class MockAssertionError and implement a string method for better readability
@@ -22,6 +24,7 @@ class _MockedEntry():
         self.name = name
         
         self.is_file = (lambda: is_file_bool) # is_file is expected to be a function, thus lambda
+        self.inode = (lambda: None)
 
 def mock_scandir_gen(entry_file_tuples):
     """
@@ -95,4 +98,76 @@ def mock_assert_many_msg(calls, msg):
             mock_method(*args, **kwargs)
     except AssertionError as e:
         raise AssertionError(e.args, msg)
-#------------------------------------------------------------------------------ 
\ No newline at end of file
+#------------------------------------------------------------------------------ 
+
+
+#------------------------------------------------------------------------------ 
+# Procedure that replays the calls of a mocked rename function in order to
+# check the physical outcome of an operation
+#------------------------------------------------------------------------------ 
+def replay_renames(file_names, mock_rename):
+    """
+    Replay the calls of a mocked rename function on the given file names and return where every file ended up.
+    
+    @param file_names: An iterable of the names of the files that exist before the operation
+    @param mock_rename: The mock that has been used in place of the rename function
+    
+    @raise AssertionError: A rename overwrites an existing file or renames a non-existing file
+    
+    @return: A dictionary mapping every file name to its final name
+    """
+    original_names = {file_name: file_name for file_name in file_names} # current name -> original name
+    
+    for rename_call in mock_rename.call_args_list:
+        (old_name, new_name), _ = rename_call
+        if not old_name in original_names:
+            raise AssertionError("The file '{}' is renamed to '{}', but it does not exist.".format(old_name, new_name))
+        if new_name in original_names:
+            raise AssertionError("The file '{}' is renamed to '{}', overwriting an existing file.".format(old_name, new_name))
+        
+        original_names[new_name] = original_names.pop(old_name)
+    
+    return {original_name: current_name for current_name, original_name in original_names.items()}
+
+
+#------------------------------------------------------------------------------ 
+# In-memory stand-in for a directory with a slow rename function, e.g. to
+# simulate a network file system in tests and benchmarks
+#------------------------------------------------------------------------------ 
+class LatencyFileSystem():
+    """
+    An in-memory directory which's rename function takes a given amount of time, like the one of a high-latency file system.
+    
+    Contrary to os.rename, a rename onto an existing file fails, so renames executed in a wrong order are noticed.
+    The rename function is thread-safe; the latency is spent outside of the lock, so concurrent renames overlap.
+    """
+    def __init__(self, file_names, latency=0, failing_names=()):
+        """
+        @param file_names: An iterable of the names of the files that exist initially
+        @param latency: The amount of seconds every rename takes
+        @param failing_names: An iterable of file names which's renaming fails with a PermissionError
+        """
+        self.files = {file_name: file_name for file_name in file_names} # current name -> original name
+        self.latency = latency
+        self.failing_names = set(failing_names)
+        self.rename_count = 0
+        self._lock = threading.Lock()
+    
+    def rename(self, old_name, new_name):
+        if self.latency:
+            time.sleep(self.latency)
+        
+        with self._lock:
+            if old_name in self.failing_names:
+                raise PermissionError(old_name)
+            if not old_name in self.files:
+                raise FileNotFoundError(old_name)
+            if new_name in self.files:
+                raise FileExistsError(new_name)
+            
+            self.files[new_name] = self.files.pop(old_name)
+            self.rename_count += 1
+    
+    def get_name_mapping(self):
+        """Return a dictionary mapping the original name of every file to its current name."""
+        return {original_name: current_name for current_name, original_name in self.files.items()}